@@ -0,0 +1,77 @@
+"""Measure how long it takes to start using pyunitx in a fresh interpreter.
+
+Each scenario runs in its own process several times and the fastest run is
+reported, as that is the least disturbed by whatever else the machine is
+doing. Bytecode is cached by a first run that isn't counted, as it would be
+for an installed package. Exits with an error if any scenario goes over its budget.
+
+    python benchmarks/import_time.py [--runs N] [--scale FACTOR]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# Seconds for each scenario, on top of starting the interpreter
+SCENARIOS = {
+    "import pyunitx": (
+        "import pyunitx",
+        0.03,
+    ),
+    "one dimension": (
+        "from pyunitx.length import meters; meters(1)",
+        0.035,
+    ),
+    "named result": (
+        "from pyunitx.length import meters; from pyunitx.mass import kilograms;"
+        "from pyunitx.time import seconds; kilograms(1) * meters(1) / seconds(1) ** 2",
+        0.05,
+    ),
+    "symbol lookup": (
+        "from pyunitx.uconvert import parse_unit; parse_unit('kJ/kg.K^-1')",
+        0.06,
+    ),
+    "everything": (
+        "import pyunitx; [getattr(pyunitx, name) for name in pyunitx._SUBMODULES]",
+        0.1,
+    ),
+}
+
+_TIMER = """\
+import time
+start = time.perf_counter()
+{}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(code: str, runs: int) -> float:
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    times = []
+    for _ in range(runs + 1):
+        result = subprocess.run([sys.executable, "-c", _TIMER.format(code)],
+                                capture_output=True, text=True, check=True, env=env)
+        times.append(float(result.stdout))
+    return min(times[1:])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Multiply every budget by this, for slower machines.")
+    args = parser.parse_args()
+
+    over = False
+    for name, (code, budget) in SCENARIOS.items():
+        elapsed = measure(code, args.runs)
+        budget *= args.scale
+        status = "ok" if elapsed <= budget else "OVER BUDGET"
+        over = over or elapsed > budget
+        print(f"{name:<16}{elapsed * 1000:8.1f} ms  (budget {budget * 1000:.0f} ms)  {status}")
+    sys.exit(1 if over else 0)
+
+
+if __name__ == "__main__":
+    main()
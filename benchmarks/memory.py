@@ -0,0 +1,52 @@
+"""Measure how many bytes each measurement takes to hold in memory.
+
+Creates many distinct measurements with the flyweight cache off, so every one
+is a separate object, and reports the memory traced per measurement for each
+numeric backend, beyond the values they're given. Exits with an error if a
+decimal measurement goes over the budget.
+
+    python benchmarks/memory.py [--count N] [--budget BYTES]
+"""
+import argparse
+import sys
+import tracemalloc
+
+import pyunitx
+from pyunitx.length import meters
+
+
+def bytes_per_measurement(backend: str, count: int) -> float:
+    with pyunitx.using_backend(backend):
+        # Make the values first so that only the measurements are counted
+        values = [meters(1).value.__class__(i) for i in range(count)]
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        kept = [meters(v) for v in values]
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    # The list holding them is a pointer each
+    return (after - before) / len(kept) - 8
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--budget", type=int, default=56,
+                        help="The most bytes a decimal measurement can take, besides its"
+                             " value.")
+    args = parser.parse_args()
+
+    pyunitx.set_flyweight_policy(pyunitx.FLYWEIGHT_OFF)
+    print(f"object header alone: {sys.getsizeof(meters(1))} bytes")
+    over = False
+    for backend in (pyunitx.BACKEND_DECIMAL, pyunitx.BACKEND_FLOAT, pyunitx.BACKEND_FRACTION):
+        size = bytes_per_measurement(backend, args.count)
+        print(f"{backend:<10}{size:8.1f} bytes per measurement")
+        if backend == pyunitx.BACKEND_DECIMAL and size > args.budget:
+            over = True
+            print(f"over the budget of {args.budget} bytes")
+    sys.exit(1 if over else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Measure how the working precision affects the speed of unit arithmetic.
+
+Runs the same pipeline at a range of precisions with :func:`pyunitx.precision`,
+and reports the best time per step out of several runs, along with how far the
+result drifts from the one at the default precision. Each step takes a square
+root and divides, which get slower with more digits, unlike adding or making
+measurements, whose cost doesn't depend on the precision.
+
+    python benchmarks/precision.py [--steps N] [--repeat N] [--digits 6 12 28 50]
+"""
+import argparse
+import time
+from decimal import Decimal
+
+import pyunitx
+from pyunitx.length import meters
+from pyunitx.time import seconds
+
+HALF = Decimal("0.5")
+
+
+def pipeline(steps: int) -> Decimal:
+    total = Decimal(0)
+    for i in range(1, steps + 1):
+        distance = (meters(Decimal(i) / 7) ** 2 + meters(Decimal(i) / 3) ** 2) ** HALF
+        speed = distance / seconds(Decimal(i % 60 + 1) / 3)
+        total += speed.to_miles_per_hour().value
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="How many times to run each precision, keeping the fastest.")
+    parser.add_argument("--digits", type=int, nargs="+", default=[6, 12, 28, 50, 100])
+    args = parser.parse_args()
+
+    # Measurements are all distinct, so caching them would only add overhead
+    pyunitx.set_flyweight_policy(pyunitx.FLYWEIGHT_OFF)
+    reference = pipeline(args.steps)
+    for digits in args.digits:
+        with pyunitx.precision(digits):
+            elapsed = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                result = pipeline(args.steps)
+                elapsed = min(elapsed, time.perf_counter() - start)
+        error = abs(result - reference) / reference
+        print(f"{digits:4d} digits  {elapsed / args.steps * 1e6:7.2f} us/step"
+              f"  relative difference {error:.1E}")
+
+
+if __name__ == "__main__":
+    main()
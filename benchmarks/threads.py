@@ -0,0 +1,77 @@
+"""Measure throughput of shared unit registries with several threads at once.
+
+Every thread runs the same mix of work: creating measurements, arithmetic
+that resolves to named and unnamed units, conversions, and looking units up
+by name. Throughput should scale with the number of threads on a
+free-threaded build of Python, and stay about flat with the GIL.
+
+    python benchmarks/threads.py [--seconds S] [--threads 1 2 4 8]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+from pyunitx.length import meters, feet
+from pyunitx.mass import kilograms
+from pyunitx.time import seconds
+from pyunitx._api import Compound
+
+
+def workload(i: int):
+    distance = meters(i % 97)
+    duration = seconds(i % 13 + 1)
+    speed = distance / duration
+    force = kilograms(2) * speed / duration
+    distance.to_feet()
+    feet(i % 89).to_meters()
+    speed.to_kilometers_per_hour()
+    Compound.from_string("meters_per_second_squared")
+    return force
+
+
+def run(threads: int, duration: float) -> float:
+    counts = [0] * threads
+    stop = threading.Event()
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(n):
+        barrier.wait()
+        i = 0
+        while not stop.is_set():
+            workload(i)
+            i += 1
+        counts[n] = i
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    time.sleep(duration)
+    stop.set()
+    for thread in pool:
+        thread.join()
+    return sum(counts) / duration
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--threads", type=int, nargs="+",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    # Warm the caches so that the first run isn't measuring one-time setup
+    run(1, 0.2)
+    baseline = None
+    for threads in args.threads:
+        throughput = run(threads, args.seconds)
+        baseline = baseline or throughput
+        print(f"{threads:3d} threads {throughput:12,.0f} ops/s  x{throughput / baseline:.2f}")
+
+
+if __name__ == "__main__":
+    main()
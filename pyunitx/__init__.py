@@ -8,44 +8,144 @@ Most values of constants come from
 `this list also from NIST <https://physics.nist.gov/cuu/Constants/Table/allascii.txt>`_.
 """
 
-# After the update for automatic conversion functions, this is somewhat less
-# important, at least in terms of "not knowing about the conversion functions".
-# However, it is still nice to have all the pre-constructed units and dimensions
-# with special names available.
-# noinspection PyUnresolvedReferences
-from . import (
-    angle,
-    area,
-    capacitance,
-    charge,
-    constants,
-    current,
-    data,
-    derived,
-    energy,
-    force,
-    frequency,
-    inductance,
-    length,
-    luminosity,
-    magneticflux,
-    magneticfluxdensity,
-    mass,
-    mole,
-    power,
-    pressure,
-    resistance,
-    temperature,
-    time,
-    volume,
-    voltage,
-)
+import importlib
+import sys
 
 from ._api import (
     make_dimension,
     make_unit,
     make_compound_dimension,
     make_compound_unit,
+    conversion_factor,
+    natural_si,
+    round_sig_figs,
+    warm_converters,
+    result_cache_info,
+    set_flyweight_policy,
+    flyweight_info,
+    FLYWEIGHT_OFF,
+    FLYWEIGHT_LRU,
+    FLYWEIGHT_WEAK,
+    set_backend,
+    using_backend,
+    get_backend,
+    BACKEND_DECIMAL,
+    BACKEND_FLOAT,
+    BACKEND_FRACTION,
+    precision,
     SIUNITX_OLD,
     SIUNITX_NEW,
 )
+from . import _api
+
+# After the update for automatic conversion functions, this is somewhat less
+# important, at least in terms of "not knowing about the conversion functions".
+# However, it is still nice to have all the pre-constructed units and dimensions
+# with special names available. They are imported the first time they're used
+# rather than all at once, so that using one dimension doesn't pay for all of
+# them.
+_SUBMODULES = (
+    "angle",
+    "area",
+    "capacitance",
+    "charge",
+    "constants",
+    "current",
+    "data",
+    "derived",
+    "energy",
+    "force",
+    "frequency",
+    "inductance",
+    "length",
+    "luminosity",
+    "magneticflux",
+    "magneticfluxdensity",
+    "mass",
+    "mole",
+    "power",
+    "pressure",
+    "resistance",
+    "temperature",
+    "time",
+    "volume",
+    "voltage",
+)
+_registry_loaded = False
+
+# The submodules are listed too, so that a star import gives them as it did
+# when they were imported up front
+__all__ = [
+    "make_dimension",
+    "make_unit",
+    "make_compound_dimension",
+    "make_compound_unit",
+    "conversion_factor",
+    "natural_si",
+    "round_sig_figs",
+    "warm_converters",
+    "result_cache_info",
+    "set_flyweight_policy",
+    "flyweight_info",
+    "FLYWEIGHT_OFF",
+    "FLYWEIGHT_LRU",
+    "FLYWEIGHT_WEAK",
+    "set_backend",
+    "using_backend",
+    "get_backend",
+    "BACKEND_DECIMAL",
+    "BACKEND_FLOAT",
+    "BACKEND_FRACTION",
+    "precision",
+    "SIUNITX_OLD",
+    "SIUNITX_NEW",
+    *_SUBMODULES,
+]
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        # Importing a submodule also binds it here, so this only runs once
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
+
+
+def _load_registry(**wanted) -> bool:
+    """Import the submodules that define units that couldn't be found.
+
+    Named-unit recognition and lookup by name or symbol need to know about
+    units whose modules haven't been used yet, so they call this when they
+    come up empty. The registry snapshot says which modules those are; if it's
+    out of date, every submodule is imported.
+
+    :param wanted: What was being looked for, as accepted by
+        :func:`pyunitx._registry.modules_defining`. Without it, every
+        submodule is imported.
+    :return: If anything was imported, so that it's worth looking again.
+    """
+    global _registry_loaded
+    if _registry_loaded:
+        return False
+    namespace = globals()
+    for name in _SUBMODULES:
+        # A submodule is bound here only once it has finished running. One
+        # that is still running may not have defined the names that the
+        # modules imported after it need from it, so wait until it's done.
+        if f"{__name__}.{name}" in sys.modules and name not in namespace:
+            return False
+    from . import _registry
+    modules = _registry.modules_defining(_SUBMODULES, **wanted) if wanted else None
+    if modules is None:
+        _registry_loaded = True
+        modules = _SUBMODULES
+    missing = [name for name in modules if name not in namespace]
+    for name in missing:
+        importlib.import_module(f"{__name__}.{name}")
+    return len(missing) > 0
+
+
+_api._REGISTRY_LOADER = _load_registry
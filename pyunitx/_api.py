@@ -1,15 +1,24 @@
-import itertools
+import array
+import contextlib
+import contextvars
+import decimal
+import functools
 import math
 import re
+import sys
 import textwrap
-import warnings
+import threading
+import weakref
+from collections import namedtuple, OrderedDict
 from decimal import Decimal
 from fractions import Fraction
-from typing import Union, Tuple, Type, Dict, Iterator, Optional
+from types import MappingProxyType, MethodType
+from typing import (Union, Tuple, Type, Dict, Iterator, Optional, Iterable, List, Mapping,
+                    Callable)
 
-import sigfig
 
 from pyunitx._exceptions import OperationError, ImplicitConversionError
+from pyunitx._tokenize import Trie, is_compound_name, tokenize_names, tokenize_abbreviations
 
 __all__ = [
     "make_dimension",
@@ -17,11 +26,29 @@ __all__ = [
     "make_compound_dimension",
     "make_compound_unit",
     "si_unit",
+    "conversion_factor",
+    "natural_si",
+    "round_sig_figs",
+    "warm_converters",
+    "result_cache_info",
+    "set_flyweight_policy",
+    "flyweight_info",
+    "FLYWEIGHT_OFF",
+    "FLYWEIGHT_LRU",
+    "FLYWEIGHT_WEAK",
+    "set_backend",
+    "using_backend",
+    "get_backend",
+    "BACKEND_DECIMAL",
+    "BACKEND_FLOAT",
+    "BACKEND_FRACTION",
+    "precision",
     "SIUNITX_NEW",
     "SIUNITX_OLD",
 ]
 
-UnitOperand = Union['UnitBase', int, float, Decimal]
+Number = Union[int, float, Decimal, Fraction]
+UnitOperand = Union['UnitBase', int, float, Decimal, Fraction]
 Scale = Union[Decimal, float, str]
 UnitLike = Union[Type['UnitBase'], 'DimensionBase']
 Pair = Tuple[UnitLike, Union[int, float, Decimal]]
@@ -30,6 +57,25 @@ Exponents = Union[Pairs, Dict[UnitLike, Union[int, float, Decimal]], 'Multiset']
 
 SIUNITX_NEW = 3
 SIUNITX_OLD = 2
+# Enough precision that multiplying two decimals and normalizing never round
+_EXACT = decimal.Context(prec=decimal.MAX_PREC)
+# Unit scales are always worked out at the default precision, whatever
+# precision() is in effect, so which unit a result belongs to never depends on
+# the precision it happened to be made under
+_SCALES = decimal.Context(prec=28, rounding=decimal.ROUND_HALF_EVEN)
+# Base dimensions with a fixed place in the exponent vectors of dimensions.
+# Others are given places after these in the order they're made.
+_RESERVED_BASE_DIMENSIONS = (
+    "Length",
+    "Mass",
+    "Time",
+    "Current",
+    "Temperature",
+    "Quantity",
+    "Luminous Intensity",
+    "Angle",
+    "Data",
+)
 _SI_PREFIXES = [
     ["yotta", "Y", "1e24"],
     ["zetta", "Z", "1e21"],
@@ -54,6 +100,21 @@ _SI_PREFIXES = [
 ]
 
 _EXTANT_UNITS = {}
+# Every registered unit keyed by its canonical (composition, scale), so that the
+# result of a calculation can be matched to a named unit in constant time
+_UNIT_INDEX = {}
+# Spellings of unit names (plural and singular) and symbols, for parsing
+_NAMES = Trie()
+_ABBREVIATIONS = Trie()
+# SI prefixed units that haven't been built yet, by name and by index key
+_PENDING_UNITS = {}
+_PENDING_INDEX = {}
+# Held while creating units and dimensions, but not while looking them up.
+# Reentrant because creating a compound unit creates a unit and a dimension.
+_REGISTRY_LOCK = threading.RLock()
+# Set by the package to import the modules that haven't been used yet, so that
+# units they define can be found. Returns if it imported anything.
+_REGISTRY_LOADER: Optional[Callable[..., bool]] = None
 
 
 def make_dimension(name: str) -> 'DimensionBase':
@@ -101,17 +162,29 @@ def make_unit(*, name: str, dimension: 'DimensionBase', scale: Scale, abbrev: st
         # Special class variables
         "__name__": name,
         "__doc__": textwrap.dedent(doc),
+        # Measurements only hold a value, so they don't need a __dict__
+        "__slots__": (),
         # Class variables
         "abbreviation": abbrev,
         "scale": Decimal(scale),
-        "instances": {},
+        # The scale as the type of each backend, filled as used
+        "scales": {},
+        "instances": _make_instance_cache(*_FLYWEIGHT_DEFAULT),
+        "flyweight_policy": None,
         "dimension": dimension,
     })
     # @formatter:on
     unit.composition = Compound(((unit, 1),))
 
-    setattr(dimension, "to_" + name.replace(" ", "_"), _make_converter(unit))
-    _EXTANT_UNITS[unit.__name__] = unit
+    with _REGISTRY_LOCK:
+        # Conversions to the other units of the dimension become its methods,
+        # and the conversion to this one becomes a method of all of them
+        for key, converter in list(vars(dimension).items()):
+            if key.startswith("to_"):
+                _install_converter(unit, key, converter)
+        dimension.units.append(unit)
+        setattr(dimension, _converter_name(unit), _make_converter(unit))
+        _register_unit(unit)
     return unit
 
 
@@ -129,8 +202,7 @@ def make_compound_dimension(exponents: Exponents, name: str = None) -> 'Dimensio
     """
     if isinstance(exponents, dict):
         exponents = tuple(exponents.items())
-    if name is None:
-        name = str(Multiset(exponents))
+    # Without a name, one is made from the exponents if the dimension is new
     dimension = DimensionBase(name, exponents)
 
     return dimension
@@ -174,64 +246,424 @@ def make_compound_unit(*, scale: Scale, exponents: Exponents, name: str = None,
     existing = _access_unit_cache(composition, Decimal(scale))
     if existing:
         return existing
-    if name is None:
-        name = str(Multiset(exponents))
-    dims_extracted = tuple((unit.dimension, exp) for unit, exp in composition.to_pairs())
-    dims = _sort(_dedupe(dims_extracted))
-    dimension = make_compound_dimension(dims)
-    unit = make_unit(
-        name=name,
-        dimension=dimension,
-        scale=scale,
-        abbrev=abbrev if abbrev is not None else composition.make_abbreviation(),
-        doc=doc
-    )
-    unit.composition = composition
+    # Imports must happen before taking the lock, as the module being imported
+    # may be waiting for it in another thread
+    if name is None and _load_registry(composition=composition, scale=Decimal(scale)):
+        # A named unit for this may be defined in a module not yet imported
+        existing = _access_unit_cache(composition, Decimal(scale))
+        if existing:
+            return existing
+    with _REGISTRY_LOCK:
+        # Another thread may have made it while this one was waiting
+        existing = _access_unit_cache(composition, Decimal(scale))
+        if existing:
+            return existing
+        if name is None:
+            name = str(Multiset(exponents))
+        dims_extracted = tuple((unit.dimension, exp) for unit, exp in composition.to_pairs())
+        dims = _sort(_dedupe(dims_extracted))
+        dimension = make_compound_dimension(dims)
+        generated = composition.make_abbreviation()
+        # Without a symbol of its own, the unit is spelled like its composition,
+        # and parsing that spelling should give the composition rather than it
+        unit = make_unit(
+            name=name,
+            dimension=dimension,
+            scale=scale,
+            abbrev=None if abbrev == generated else abbrev,
+            doc=doc
+        )
+        unit.abbreviation = abbrev if abbrev is not None else generated
+        _set_composition(unit, composition)
     return unit
 
 
 def si_unit(*, base_unit: Type['UnitBase'], skip=()) \
-        -> Dict[str, Type['UnitBase']]:
+        -> Mapping[str, Type['UnitBase']]:
     """Create the full range of SI prefixes on a unit.
 
+    Most of the prefixed units are never used by any one program, so they
+    aren't actually built until they're first needed: when they're looked up
+    in the returned mapping, by name or symbol, or when a calculation results
+    in one of them.
+
     :param base_unit: The unit to which prefixes can be applied.
     :param skip: If you've already created one of the units (I did this with
         kilograms since prefixes apply to grams), list the prefix here so it
         doesn't get overwritten.
-    :return: A dictionary between the name of the unit and the unit class.
+    :return: A mapping between the name of the unit and the unit class.
     """
-    generated = {}
+    # The family from smallest to largest, by power of ten from the base unit.
+    # Units that haven't been built yet are represented by their name.
+    ladder = {0: base_unit}
+    names = {}
+    is_base = _is_base(base_unit.composition)
+    with _REGISTRY_LOCK:
+        _declare_prefixed_units(base_unit, skip, ladder, names, is_base)
+    return _PrefixedUnits(ladder, names)
+
+
+def _declare_prefixed_units(base_unit, skip, ladder, names, is_base):
     for prefix, short, scale in _SI_PREFIXES:
+        exponent = Decimal(scale).adjusted()
+        new_name = prefix + base_unit.__name__
         if prefix in skip:
+            existing = _EXTANT_UNITS.get(new_name)
+            if existing is not None:
+                ladder[exponent] = existing
             continue
-        new_scale = Decimal(scale) * base_unit.scale
-        new_name = prefix + base_unit.__name__
+        new_scale = _SCALES.multiply(Decimal(scale), base_unit.scale)
         new_abbrev = short + base_unit.abbreviation
-        if _is_base(base_unit.composition):
-            new_unit = make_unit(
-                name=new_name,
-                abbrev=new_abbrev,
-                scale=new_scale,
-                dimension=base_unit.dimension,
-            )
-        else:
-            new_unit = make_compound_unit(
-                name=new_name,
-                abbrev=new_abbrev,
-                scale=new_scale,
-                exponents=base_unit.composition.to_pairs(),
-            )
-        generated[new_name] = new_unit
-    return generated
+        key = None if is_base else _index_key(base_unit.composition, new_scale)
+        _PENDING_UNITS[new_name] = _PendingUnit(
+            base_unit, new_name, new_abbrev, new_scale, key, ladder, exponent
+        )
+        if key is not None:
+            _PENDING_INDEX[key] = new_name
+        _index_spellings(new_name, new_abbrev)
+        ladder[exponent] = new_name
+        names[new_name] = exponent
+    for exponent, unit in ladder.items():
+        if not isinstance(unit, str):
+            unit.si_ladder = ladder
+            unit.si_exponent = exponent
+
+
+_PendingUnit = namedtuple(
+    "_PendingUnit", ["base_unit", "name", "abbrev", "scale", "key", "ladder", "exponent"]
+)
+
+
+class _PrefixedUnits(Mapping):
+    """The units generated by :func:`si_unit`, built as they're looked up."""
+
+    def __init__(self, ladder: Dict[int, Union[str, Type['UnitBase']]], names: Dict[str, int]):
+        self.ladder = ladder
+        self.names = names
+
+    def __getitem__(self, name: str) -> Type['UnitBase']:
+        return _ladder_unit(self.ladder, self.names[name])
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+
+def _ladder_unit(ladder, exponent: int) -> Optional[Type['UnitBase']]:
+    unit = ladder.get(exponent)
+    if isinstance(unit, str):
+        _materialize(unit)
+        unit = ladder[exponent]
+    return unit
+
+
+def _materialize(name: str) -> Optional[Type['UnitBase']]:
+    with _REGISTRY_LOCK:
+        pending = _PENDING_UNITS.pop(name, None)
+        if pending is None:
+            # Either never pending, or another thread has just built it
+            return _EXTANT_UNITS.get(name)
+        return _build_pending(pending)
+
+
+def _build_pending(pending: '_PendingUnit') -> Type['UnitBase']:
+    if pending.key is None:
+        unit = make_unit(
+            name=pending.name,
+            abbrev=pending.abbrev,
+            scale=pending.scale,
+            dimension=pending.base_unit.dimension,
+        )
+    else:
+        del _PENDING_INDEX[pending.key]
+        unit = make_compound_unit(
+            name=pending.name,
+            abbrev=pending.abbrev,
+            scale=pending.scale,
+            exponents=pending.base_unit.composition.to_pairs(),
+        )
+    unit.si_ladder = pending.ladder
+    unit.si_exponent = pending.exponent
+    pending.ladder[pending.exponent] = unit
+    return unit
+
+
+def _get_unit(name: str) -> Optional[Type['UnitBase']]:
+    """Find a unit by name, building it if it's a pending SI prefixed unit."""
+    unit = _EXTANT_UNITS.get(name)
+    if unit is None:
+        unit = _materialize(name)
+    return unit
+
+
+def _lazy_getattr(module: str, *families: _PrefixedUnits):
+    """Make a module ``__getattr__`` that provides the module's prefixed units.
+
+    Once looked up, a unit is stored in the module so this isn't used again
+    for it.
+    """
+
+    def __getattr__(name: str):
+        for family in families:
+            if name in family:
+                unit = family[name]
+                setattr(sys.modules[module], name, unit)
+                return unit
+        raise AttributeError(f"module {module!r} has no attribute {name!r}")
+
+    return __getattr__
+
+
+def conversion_factor(src: Type['UnitBase'], dst: Type['UnitBase'],
+                      precision: Optional[int] = None) -> Number:
+    """Get the number to multiply by to convert from one unit to another.
+
+    For instance, ``conversion_factor(kilometers, meters) == 1000``. It can
+    be fetched once to convert a large amount of plain numbers at once.
+
+    The factor has the type of the current numeric backend (see
+    :func:`set_backend`). Decimal factors are computed at the current
+    :mod:`decimal` precision (see :func:`precision`), so unlike the ``to_*``
+    conversion functions, which only round their results, multiplying by a
+    factor like ``conversion_factor(feet, yards)`` can be a little off.
+    Factors are remembered by the dimension the first time they're used at
+    each precision.
+
+    :param src: The unit to convert from.
+    :param dst: The unit to convert to.
+    :param precision: The number of significant digits to compute a decimal
+        factor to, instead of the current precision.
+    :raises ImplicitConversionError: If the units measure different
+        dimensions.
+    :return: The ratio of the scale of ``src`` to that of ``dst``.
+    """
+    if src.dimension is not dst.dimension:
+        raise ImplicitConversionError(src, dst)
+    if precision is not None:
+        with _precision(precision):
+            return _conversion_factor(src, dst)
+    return _conversion_factor(src, dst)
+
+
+def _conversion_factor(src: Type['UnitBase'], dst: Type['UnitBase']) -> Number:
+    backend = _backend()
+    key = (src, dst, backend.name, decimal.getcontext().prec)
+    factors = dst.dimension.factors
+    try:
+        return factors[key]
+    except KeyError:
+        factor = factors[key] = backend.ratio(src.scale, dst.scale)
+        return factor
+
+
+def natural_si(measurements: Iterable['UnitBase']) -> List['UnitBase']:
+    """Convert many measurements to their most natural SI prefix at once.
+
+    This is :meth:`to_natural_si <pyunitx.length.meters.to_natural_si>`
+    applied to each measurement, for formatting a whole table or report.
+
+    :param measurements: Measurements in units that have SI prefixes.
+    :raises TypeError: If any of the units don't have SI prefixes.
+    :raises ValueError: If any of the values are too big or too small to be
+        expressed with an SI prefix.
+    :return: A list of the converted measurements, in the same order.
+    """
+    return [_natural_si(m) for m in measurements]
+
+
+def _natural_si(measurement: 'UnitBase') -> 'UnitBase':
+    unit = type(measurement)
+    ladder = unit.si_ladder
+    if ladder is None:
+        raise TypeError("This isn't an SI unit so prefixes can't be applied")
+    order = _to_decimal(measurement.value).adjusted() + unit.si_exponent
+    if order > 26 or order < -24:
+        raise ValueError("SI prefixes only cover 48 orders of magnitude")
+    target = _ladder_unit(ladder, (order // 3) * 3)
+    if target is None:
+        raise ValueError("This unit doesn't have the needed SI prefix")
+    backend = _backend()
+    value = backend.convert(measurement.value)
+    return target(_rescale(value, _scale_in(unit, backend), _scale_in(target, backend)))
+
+
+def round_sig_figs(measurements: Iterable['UnitBase'], figs=3) -> List['UnitBase']:
+    """Round many measurements to significant figures at once.
+
+    This is :meth:`sig_figs <pyunitx.length.meters.sig_figs>` applied to
+    each measurement, for formatting a whole table or report.
+
+    :param measurements: Measurements in any units.
+    :param figs: How many significant figures to round to.
+    :raises ValueError: If fewer than one significant figure is asked for.
+    :return: A list of the rounded measurements, in the same order.
+    """
+    return [type(m)(_round_sig_figs(_to_decimal(m.value), figs)) for m in measurements]
+
+
+def _round_sig_figs(value: Decimal, figs: int) -> Decimal:
+    # Rounds half away from zero and pads with zeros to show how many figures
+    # are significant, the same way sigfig.round did
+    if figs < 1:
+        raise ValueError("Must round to at least one significant figure")
+    if not value.is_finite():
+        return value
+    magnitude = value.adjusted() if value else 0
+    rounded = value.quantize(Decimal((0, (1,), magnitude - figs + 1)),
+                             rounding=decimal.ROUND_HALF_UP, context=_EXACT)
+    if rounded and rounded.adjusted() > magnitude:
+        # Rounding up carried into another digit, like 999.6 to 1000
+        rounded = rounded.quantize(Decimal((0, (1,), magnitude - figs + 2)),
+                                   rounding=decimal.ROUND_HALF_UP, context=_EXACT)
+    return rounded
 
 
 def _make_converter(unit):
-    def converter(self):
+    def converter(self, precision: Optional[int] = None):
         f"""Convert {self.__name__} to {unit.__name__}"""
-        return unit(self.value * self.scale / unit.scale)
+        if precision is not None:
+            with _precision(precision):
+                return converter(self)
+        backend = _backend()
+        value = backend.convert(self.value)
+        return unit(_rescale(value, _scale_in(type(self), backend), _scale_in(unit, backend)))
+
+    return converter
+
+
+def _converter_name(unit: Type['UnitBase']) -> str:
+    # Names like "imperial fluid ounce" have to be usable as attributes
+    return "to_" + unit.__name__.replace(" ", "_")
+
+def warm_converters(unit: Type['UnitBase'], names: Iterable[str]):
+    """Work out conversion functions ahead of time.
+
+    Conversions to units that don't exist yet, like ``to_kilometers_per_hour``,
+    have to be worked out from the name on first use. Calling this at startup
+    moves that cost out of the first conversion.
+
+    :param unit: The unit that will be converted from.
+    :param names: The conversion names, with or without the leading ``to_``.
+    :raises KeyError: If a name refers to units that don't exist.
+    """
+    for name in names:
+        if not name.startswith("to_"):
+            name = "to_" + name
+        _resolve_converter(unit, name)
+
+
+def _resolve_converter(unit: Type['UnitBase'], key: str):
+    if key in unit.__dict__:
+        return unit.__dict__[key]
+    converter = getattr(unit.dimension, key, None)
+    if converter is None:
+        composition = Compound.from_string(key[3:])
+        target = make_compound_unit(
+            name=key[3:],
+            scale=_base_scale(composition),
+            exponents=composition.to_pairs(),
+        )
+        if 'radian' in key:
+            # Radians are dimensionless so the conversion depends on how the
+            # angle appears in this particular unit
+            converter = _make_radian_converter(unit, target)
+        else:
+            try:
+                converter = getattr(unit.dimension, "to_" + target.__name__)
+            except AttributeError:
+                raise AttributeError(
+                    f"{unit.__name__} cannot be converted to {target.__name__}"
+                ) from None
+            # Remember the name on the dimension so every unit can use it
+            setattr(unit.dimension, key, converter)
+    setattr(unit, key, converter)
+    return converter
+
+
+def _conversion(unit: Type['UnitBase'], key: str, precision: Optional[int] = None) \
+        -> Tuple[Optional[Type['UnitBase']], Number, Number]:
+    """Find the unit a conversion goes to and how it changes values.
+
+    Containers of many measurements use this to convert all their values with
+    the same conversion a single measurement would go through. A value ``x``
+    converts to ``x * scale / divisor``, which like ``to_*`` should only be
+    rounded once, with :func:`_rescale` or :func:`_rescaler`.
+
+    :param unit: The unit to convert from.
+    :param key: The name of the conversion, like ``to_feet``.
+    :param precision: The number of significant digits to compute a decimal
+        factor to, instead of the current precision, for conversions that
+        aren't between units of the same dimension.
+    :raises AttributeError: If the name isn't a conversion of the unit.
+    :return: The unit converted to, or None if the conversion gives plain
+        numbers like ``to_radians`` does, then the scale and the divisor in
+        the current numeric backend.
+    """
+    if not key.startswith("to_") or hasattr(UnitBase, key):
+        raise AttributeError(key)
+    converter = _resolve_converter(unit, key)
+    one = converter(unit(1)) if precision is None else converter(unit(1), precision)
+    backend = _backend()
+    if not isinstance(one, UnitBase):
+        # Only to_radians gives plain numbers, and taking the factor from one
+        # would round it before it's applied
+        from pyunitx.angle import _radian_factor
+        scale, divisor = _radian_factor(unit)
+        return None, scale, divisor
+    target = type(one)
+    if target.dimension is unit.dimension:
+        return target, _scale_in(unit, backend), _scale_in(target, backend)
+    # Conversions involving radians aren't just a ratio of scales
+    return target, backend.convert(one.value), backend.convert(1)
+
+
+def _require_unit(unit: Type['UnitBase'], other: Optional[type], operation: str):
+    """Check that an operation on measurements of a unit is given the same unit.
+
+    :raises ImplicitConversionError: If the other is a different unit of the
+        same dimension.
+    :raises OperationError: If the other is of a different dimension, or None
+        for a plain number.
+    """
+    if other is unit:
+        return
+    if other is not None and unit.dimension is other.dimension:
+        raise ImplicitConversionError(other, unit)
+    raise OperationError(operation, unit, other)
+
+
+def _install_converter(unit: Type['UnitBase'], key: str, converter, replaces=None):
+    # Methods of UnitBase itself like to_latex aren't conversions, and
+    # conversions particular to the unit take precedence over the dimension's
+    if hasattr(UnitBase, key):
+        return
+    current = unit.__dict__.get(key)
+    if current is None or current is replaces:
+        setattr(unit, key, converter)
+
+
+def _make_radian_converter(unit: Type['UnitBase'], target: Type['UnitBase']):
+    from pyunitx.angle import Angle
+    angle = [(u, e) for u, e in unit.composition if u.dimension == Angle]
+    assert len(angle) == 1
+    angular, exponent = angle[0]
+    factor = (Decimal(math.pi) / angular(180 / angular.scale)) ** exponent
+    to_target = _make_converter(target)
+
+    def converter(self, precision: Optional[int] = None):
+        if precision is not None:
+            with _precision(precision):
+                return converter(self)
+        return to_target(self * factor)
 
     return converter
 
+
 def _exponent_name(unit: type, exponent: int) -> str:
     value_names = {
         1: "",
@@ -284,12 +716,71 @@ def _sort(d: Union[Exponents, Iterator[Pair]]) -> Pairs:
     return tuple(sorted(pairs, key=lambda p: (-p[1], p[0].__name__)))
 
 
+def _index_key(c: 'Compound', scale: Decimal) -> Tuple['Compound', Decimal]:
+    # Compounds are interned, so they are canonical as they are
+    return c, scale
+
+
+def _register_unit(unit: Type['UnitBase']):
+    _clear_derived_caches()
+    name = unit.__name__
+    previous = _EXTANT_UNITS.get(name)
+    if previous is not None:
+        # A redefinition by name replaces the old unit entirely
+        _unindex_unit(previous)
+    _EXTANT_UNITS[name] = unit
+    _UNIT_INDEX[_index_key(unit.composition, unit.scale)] = unit
+    _index_spellings(name, unit.abbreviation)
+
+
+def _index_spellings(name: str, abbreviation: Optional[str]):
+    if is_compound_name(name):
+        return
+    _NAMES.insert(name, name)
+    singular = name.rstrip("s")
+    if singular not in _EXTANT_UNITS and singular not in _PENDING_UNITS:
+        _NAMES.insert(singular, name)
+    if abbreviation is not None:
+        _ABBREVIATIONS.insert(abbreviation, name)
+
+
+def _own_abbreviation(unit: Type['UnitBase']) -> Optional[str]:
+    """Get the symbol of a unit, or None if it's only spelled like its composition."""
+    composition = unit.composition
+    if composition.to_pairs() != ((unit, 1),) \
+            and unit.abbreviation == composition.make_abbreviation():
+        return None
+    return unit.abbreviation
+
+
+def _clear_derived_caches():
+    # Everything worked out from the registry may change when it does
+    _RESULT_UNITS.clear()
+    _parse_names.cache_clear()
+    _parse_abbreviations.cache_clear()
+
+
+def _unindex_unit(unit: Type['UnitBase']):
+    key = _index_key(unit.composition, unit.scale)
+    if _UNIT_INDEX.get(key) is unit:
+        del _UNIT_INDEX[key]
+
+
+def _set_composition(unit: Type['UnitBase'], composition: 'Compound'):
+    """Change what a unit is composed of, keeping the unit index in sync."""
+    with _REGISTRY_LOCK:
+        _clear_derived_caches()
+        _unindex_unit(unit)
+        unit.composition = composition
+        _UNIT_INDEX[_index_key(composition, unit.scale)] = unit
+
+
 def _access_unit_cache(c: 'Compound', scale) -> Optional[Type['UnitBase']]:
-    remap = {(_sort(_dedupe(unit.composition.to_pairs())), unit.scale): unit
-             for name, unit in _EXTANT_UNITS.items()}
-    key = (_sort(_dedupe(c.to_pairs())), scale)
-    if key in remap:
-        return remap[key]
+    key = _index_key(c, scale)
+    if key in _UNIT_INDEX:
+        return _UNIT_INDEX[key]
+    if key in _PENDING_INDEX:
+        return _materialize(_PENDING_INDEX[key])
     if len(c) == 1 and _is_base(c):
         # Particular case: SI derivatives of base units are also base units,
         # divorced from their root
@@ -299,74 +790,649 @@ def _access_unit_cache(c: 'Compound', scale) -> Optional[Type['UnitBase']]:
             if len(si_prefix) != 1:
                 return None
             si_name = si_prefix[0] + c.to_pairs()[0][0].__name__
-            if si_name in _EXTANT_UNITS:
-                return _EXTANT_UNITS[si_name]
+            return _get_unit(si_name)
     return None
 
 
+ResultCacheInfo = namedtuple("ResultCacheInfo", ["hits", "misses", "currsize"])
+
+
+class _ResultUnitCache:
+    """Remembers which unit results from combining two units.
+
+    The result of ``*``, ``/`` or ``**`` depends only on the classes (and for
+    powers the exponent) involved, so it is worked out once per combination.
+    Registering a unit can change what a combination resolves to, so that
+    clears the table.
+    """
+
+    def __init__(self):
+        self.store = {}
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, left: Type['UnitBase'], right, operation: str) \
+            -> Tuple[Optional[Type['UnitBase']], Decimal]:
+        """Get the unit and scale of ``left <operation> right``.
+
+        :param left: The unit on the left of the operator.
+        :param right: The unit on the right of the operator, or the exponent
+            for ``**``.
+        :param operation: One of ``"*"``, ``"/"``, or ``"**"``.
+        :return: The resulting unit, or None if the units cancel completely,
+            along with the combined scale.
+        """
+        key = (left, right, operation)
+        try:
+            result = self.store[key]
+        except KeyError:
+            self.misses += 1
+            result = self.store[key] = self.__resolve(left, right, operation)
+            unit = result[0]
+            if unit is not None and _UNIT_INDEX.get(_index_key(unit.composition, unit.scale)) \
+                    is not unit:
+                # Another thread registered a unit that this should resolve to
+                # instead, after clearing the table but before this was stored
+                self.store.pop(key, None)
+        else:
+            self.hits += 1
+        return result
+
+    def clear(self):
+        self.store.clear()
+
+    def info(self) -> ResultCacheInfo:
+        return ResultCacheInfo(self.hits, self.misses, len(self.store))
+
+    @staticmethod
+    def __resolve(left, right, operation):
+        if operation == "**":
+            composition = left.composition ** right
+            scale = _SCALES.power(left.scale, _frac_to_decimal(right, _SCALES))
+            return make_compound_unit(scale=scale, exponents=composition.to_pairs()), scale
+        if operation == "*":
+            composition = left.composition * right.composition
+            scale = _SCALES.multiply(left.scale, right.scale)
+        else:
+            composition = left.composition / right.composition
+            scale = _SCALES.divide(left.scale, right.scale)
+        if len(composition) == 0:
+            return None, scale
+        return make_compound_unit(scale=scale, exponents=composition.to_pairs()), scale
+
+
+_RESULT_UNITS = _ResultUnitCache()
+
+
+def result_cache_info() -> ResultCacheInfo:
+    """Report how well the cache of arithmetic result units is working.
+
+    Every combination of units by multiplication, division, or powers has its
+    resulting unit worked out only once. This reports how many operations were
+    able to use a previously found result (``hits``), how many had to work it
+    out (``misses``), and how many combinations are currently remembered
+    (``currsize``).
+
+    :return: A named tuple of ``(hits, misses, currsize)``.
+    """
+    return _RESULT_UNITS.info()
+
+
+BACKEND_DECIMAL = "decimal"
+BACKEND_FLOAT = "float"
+BACKEND_FRACTION = "fraction"
+_NUMBERS = (int, float, Decimal, Fraction)
+
+
+class _Backend(namedtuple("_Backend", ["name", "type", "convert", "ratio", "power"])):
+    """How measurement values are represented and calculated with.
+
+    ``convert`` turns any number into the backend's type, ``ratio`` divides
+    one exact decimal scale by another, and ``power`` raises a value to an
+    exponent.
+    """
+
+
+def _to_decimal(value) -> Decimal:
+    # Checking against Fraction goes through the slow abstract base class
+    # machinery, so the common types are let through first
+    if type(value) in _PLAIN_DECIMAL_TYPES:
+        return Decimal(value)
+    if isinstance(value, Fraction):
+        return _frac_to_decimal(value)
+    return Decimal(value)
+
+
+_PLAIN_DECIMAL_TYPES = frozenset((int, str, float, Decimal))
+
+
+def _to_fraction(value) -> Fraction:
+    # Unlike Decimal and float, Fraction copies a value that's already a Fraction
+    return value if type(value) is Fraction else Fraction(value)
+
+
+def _fraction_power(value: Fraction, exponent) -> Fraction:
+    exponent = Fraction(exponent)
+    if exponent.denominator == 1:
+        return value ** exponent.numerator
+    # Roots of fractions generally aren't fractions
+    return Fraction(float(value) ** float(exponent))
+
+
+_BACKENDS = {
+    BACKEND_DECIMAL: _Backend(
+        BACKEND_DECIMAL, Decimal, _to_decimal, lambda a, b: a / b,
+        lambda value, exponent: value ** _frac_to_decimal(exponent),
+    ),
+    BACKEND_FLOAT: _Backend(
+        BACKEND_FLOAT, float, float, lambda a, b: float(a / b),
+        lambda value, exponent: value ** float(exponent),
+    ),
+    BACKEND_FRACTION: _Backend(
+        BACKEND_FRACTION, Fraction, _to_fraction, lambda a, b: Fraction(a) / Fraction(b),
+        _fraction_power,
+    ),
+}
+# Finds the backend that a value came from
+_BACKEND_TYPES = {backend.type: backend for backend in _BACKENDS.values()}
+_DEFAULT_BACKEND = _BACKENDS[BACKEND_DECIMAL]
+# Overrides the default within a context, set by using_backend
+_CONTEXT_BACKEND = contextvars.ContextVar("pyunitx_backend", default=None)
+
+
+def _get_backend(name: str) -> _Backend:
+    try:
+        return _BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown numeric backend {name!r}") from None
+
+
+def _backend() -> _Backend:
+    return _CONTEXT_BACKEND.get() or _DEFAULT_BACKEND
+
+
+def set_backend(backend: str):
+    """Choose how the values of measurements are represented.
+
+    Measurements normally hold :external:py:class:`decimal.Decimal` values,
+    which are exact for the decimal numbers units are defined with. When that
+    exactness isn't needed, plain floats are several times faster; when
+    calculations must be exact, :external:py:class:`fractions.Fraction`
+    is available too. The backend applies to measurements created after it is
+    set, including the results of arithmetic and conversions, and to the
+    conversion factors they use. Unit classes are shared between backends.
+
+    Measurements with values of different backends can still be combined, the
+    result then uses the current backend.
+
+    :param backend: One of :data:`BACKEND_DECIMAL` (the default),
+        :data:`BACKEND_FLOAT`, or :data:`BACKEND_FRACTION`.
+    :raises ValueError: If the backend isn't one of those.
+    """
+    global _DEFAULT_BACKEND
+    _DEFAULT_BACKEND = _get_backend(backend)
+
+
+@contextlib.contextmanager
+def using_backend(backend: str):
+    """Use a numeric backend within a ``with`` block.
+
+    This overrides :func:`set_backend` in the current thread or async task
+    only, and restores the previous backend afterwards.
+
+    :param backend: One of :data:`BACKEND_DECIMAL`, :data:`BACKEND_FLOAT`, or
+        :data:`BACKEND_FRACTION`.
+    :raises ValueError: If the backend isn't one of those.
+    """
+    token = _CONTEXT_BACKEND.set(_get_backend(backend))
+    try:
+        yield
+    finally:
+        _CONTEXT_BACKEND.reset(token)
+
+
+def get_backend() -> str:
+    """Get the name of the numeric backend currently in use."""
+    return _backend().name
+
+
+def _in_backend(value: Number) -> Number:
+    return _backend().convert(value)
+
+
+def _coerced(a: Number, b: Number) -> Tuple[Number, Number]:
+    """Bring two numbers to the same type, the current backend's if they differ."""
+    if type(a) is type(b):
+        return a, b
+    convert = _backend().convert
+    return convert(a), convert(b)
+
+
+def _scale_in(unit: Type['UnitBase'], backend: _Backend = None) -> Number:
+    """Get the scale of a unit as the type of a backend, the current one by default."""
+    backend = backend or _backend()
+    try:
+        return unit.scales[backend.name]
+    except KeyError:
+        scale = unit.scales[backend.name] = backend.convert(unit.scale)
+        return scale
+
+
+def _rescale(value: Number, scale: Number, divisor: Number) -> Number:
+    """Calculate ``value * scale / divisor``, with all three the same type.
+
+    Decimals are only rounded once, at the end, so that conversions that
+    should be exact, like three feet to a yard, are.
+    """
+    if type(value) is Decimal:
+        return decimal.getcontext().divide(_EXACT.multiply(value, scale), divisor)
+    return value * scale / divisor
+
+
+def _rescaler(scale: Number, divisor: Number, precision: Optional[int] = None) \
+        -> Callable[[Number], Number]:
+    """Make a function that does :func:`_rescale` with the same scale and divisor.
+
+    Decimals are rounded to the precision current when this is called, or the
+    one given, even if the function is used after that has changed.
+    """
+    if type(scale) is Decimal:
+        context = decimal.getcontext().copy()
+        if precision is not None:
+            context.prec = precision
+        multiply, divide = _EXACT.multiply, context.divide
+        return lambda value: divide(multiply(value, scale), divisor)
+    return lambda value: value * scale / divisor
+
+
+def _exact_base_value(measurement: 'UnitBase') -> Union[Decimal, Fraction]:
+    """Get the value of a measurement in the base unit without any rounding."""
+    value = measurement.value
+    if isinstance(value, Fraction):
+        return value * Fraction(measurement.scale)
+    # Decimal is exact for floats too
+    return _EXACT.multiply(Decimal(value), measurement.scale)
+
+
+def _base_value(measurement: 'UnitBase') -> Number:
+    """Get the value of a measurement in the base unit, in the type it already has."""
+    value = measurement.value
+    return value * _scale_in(type(measurement), _BACKEND_TYPES[type(value)])
+
+
+@contextlib.contextmanager
+def precision(digits: int):
+    """Set the working precision of measurement arithmetic within a ``with`` block.
+
+    Decimal arithmetic rounds every result to the precision of the current
+    :mod:`decimal` context, 28 significant digits by default. That includes
+    multiplying and dividing measurements, conversions and the conversion
+    factors they use, and calculations with the constants. Much of the time
+    far fewer digits are meaningful, and calculating with fewer is faster::
+
+        with pyunitx.precision(12):
+            speeds = [(d / t).to_kilometers_per_hour() for d, t in readings]
+
+    Measurements created directly keep every digit they're given; only the
+    results of calculations are rounded. Like :func:`decimal.localcontext`,
+    which this uses, the precision only applies to the current thread or async
+    task. Conversions and :func:`conversion_factor` also take a ``precision``
+    argument to set it for one call. It has no effect with the float or
+    fraction backends.
+
+    :param digits: The number of significant digits to keep.
+    :return: The :external:py:class:`decimal.Context` in effect, to adjust
+        further if needed.
+    """
+    with decimal.localcontext() as context:
+        context.prec = digits
+        yield context
+
+
+# For use in functions with a parameter called precision
+_precision = precision
+
+
+FLYWEIGHT_OFF = "off"
+FLYWEIGHT_LRU = "lru"
+FLYWEIGHT_WEAK = "weak"
+
+
+class FlyweightInfo(namedtuple("FlyweightInfo",
+                               ["policy", "hits", "misses", "maxsize", "currsize"])):
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _InstanceCache:
+    """Holds the measurements of one unit that can be handed out again.
+
+    Measurements are found by their value, or the integer it was made from.
+    Equal values aren't always the same, though: they can come from different
+    numeric backends, or be decimals written differently, like
+    ``Decimal("1.0")`` and ``Decimal("1")``. A measurement that's found is
+    only handed out if its value is the backend's type, and for decimals,
+    written the same way.
+    """
+    policy = FLYWEIGHT_OFF
+
+    def __init__(self, maxsize: Optional[int]):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, value: Number, kind: type) -> Optional['UnitBase']:
+        self.misses += 1
+        return None
+
+    def put(self, value: Number, instance: 'UnitBase'):
+        pass
+
+    def __len__(self):
+        return 0
+
+    def info(self) -> FlyweightInfo:
+        return FlyweightInfo(self.policy, self.hits, self.misses, self.maxsize, len(self))
+
+
+class _LRUInstanceCache(_InstanceCache):
+    policy = FLYWEIGHT_LRU
+
+    def __init__(self, maxsize: Optional[int]):
+        super().__init__(maxsize)
+        self.store = OrderedDict()
+        # Only for evicting; lookups and insertions are atomic on their own
+        self.lock = threading.Lock()
+
+    def get(self, value, kind):
+        instance = self.store.get(value)
+        if instance is not None:
+            held = instance.value
+            # compare_total is zero only for decimals written the same way
+            if type(held) is kind and (kind is not Decimal
+                                       or not held.compare_total(value)):
+                self.hits += 1
+                try:
+                    self.store.move_to_end(value)
+                except KeyError:
+                    # Evicted by another thread in the meantime
+                    pass
+                return instance
+        self.misses += 1
+        return None
+
+    def put(self, value, instance):
+        store = self.store
+        store[value] = instance
+        if self.maxsize is not None and len(store) > self.maxsize:
+            with self.lock:
+                while len(store) > self.maxsize:
+                    store.popitem(last=False)
+
+    def __len__(self):
+        return len(self.store)
+
+
+class _WeakInstanceCache(_LRUInstanceCache):
+    policy = FLYWEIGHT_WEAK
+
+    def __init__(self, maxsize: Optional[int]):
+        super().__init__(None)
+        self.store = weakref.WeakValueDictionary()
+
+    def put(self, value, instance):
+        self.store[value] = instance
+
+    def get(self, value, kind):
+        instance = self.store.get(value)
+        if instance is not None:
+            held = instance.value
+            if type(held) is kind and (kind is not Decimal
+                                       or not held.compare_total(value)):
+                self.hits += 1
+                return instance
+        self.misses += 1
+        return None
+
+
+_INSTANCE_CACHES = {
+    FLYWEIGHT_OFF: _InstanceCache,
+    FLYWEIGHT_LRU: _LRUInstanceCache,
+    FLYWEIGHT_WEAK: _WeakInstanceCache,
+}
+_FLYWEIGHT_DEFAULT = (FLYWEIGHT_LRU, 1024)
+
+
+def _make_instance_cache(policy: str, maxsize: Optional[int]) -> _InstanceCache:
+    try:
+        return _INSTANCE_CACHES[policy](maxsize)
+    except KeyError:
+        raise ValueError(f"Unknown flyweight policy {policy!r}") from None
+
+
+def set_flyweight_policy(policy: str, maxsize: Optional[int] = 1024,
+                         unit: Type['UnitBase'] = None):
+    """Choose how measurements are shared between identical constructions.
+
+    Measurements are immutable, so ``meters(1)`` can hand back a measurement
+    that was created earlier with the same value instead of making a new one.
+    How many are kept around for that is controlled here:
+
+    * :data:`FLYWEIGHT_LRU` keeps the ``maxsize`` most recently used
+      measurements of each unit. This is the default, with a size of 1024.
+    * :data:`FLYWEIGHT_WEAK` keeps measurements only as long as something
+      else is still holding on to them.
+    * :data:`FLYWEIGHT_OFF` never shares measurements.
+
+    Changing the policy forgets any measurements that were being kept.
+
+    :param policy: One of the policies above.
+    :param maxsize: The most measurements to keep per unit with the LRU
+        policy, or None for no limit. Ignored by the other policies.
+    :param unit: Set the policy for only this unit. Without it, the policy is
+        set for every unit that hasn't been given its own.
+    :raises ValueError: If the policy isn't one of the above.
+    """
+    cache = _make_instance_cache(policy, maxsize)
+    if unit is not None:
+        unit.flyweight_policy = (policy, maxsize)
+        unit.instances = cache
+        return
+    global _FLYWEIGHT_DEFAULT
+    # Units may be registered by other threads meanwhile
+    with _REGISTRY_LOCK:
+        _FLYWEIGHT_DEFAULT = (policy, maxsize)
+        for registered in _EXTANT_UNITS.values():
+            if registered.flyweight_policy is None:
+                registered.instances = _make_instance_cache(policy, maxsize)
+
+
+def flyweight_info(unit: Type['UnitBase'] = None) -> FlyweightInfo:
+    """Report how many measurements are being shared and how often.
+
+    :param unit: The unit to report on. Without it, the numbers are totalled
+        over every unit using the global policy.
+    :return: A named tuple of ``(policy, hits, misses, maxsize, currsize)``,
+        which also has a ``hit_rate`` property.
+    """
+    if unit is not None:
+        return unit.instances.info()
+    policy, maxsize = _FLYWEIGHT_DEFAULT
+    hits = misses = currsize = 0
+    with _REGISTRY_LOCK:
+        registered_units = tuple(_EXTANT_UNITS.values())
+    for registered in registered_units:
+        if registered.flyweight_policy is None:
+            info = registered.instances.info()
+            hits += info.hits
+            misses += info.misses
+            currsize += info.currsize
+    return FlyweightInfo(policy, hits, misses, maxsize, currsize)
+
+
 def _is_base(composition: 'Compound') -> bool:
     return (len(composition) == 1
             and composition.to_pairs()[0][1] == 1
             and composition.to_pairs()[0][0].composition == composition)
 
 
+def _load_registry(**wanted) -> bool:
+    return _REGISTRY_LOADER is not None and _REGISTRY_LOADER(**wanted)
+
+
+def _tokenize(tokenizer, spec: str, spellings: Trie, kind: str) -> Pairs:
+    try:
+        return tokenizer(spec, spellings)
+    except KeyError:
+        # The unit may be defined in a module that hasn't been imported yet
+        if not _load_registry(**{kind: spec}):
+            raise
+        return tokenizer(spec, spellings)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_names(spec: str) -> 'Compound':
+    pairs = _tokenize(tokenize_names, spec, _NAMES, "names")
+    return Compound(tuple((_spelled_unit(name), power) for name, power in pairs))
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_abbreviations(spec: str) -> Pairs:
+    pairs = _tokenize(tokenize_abbreviations, spec, _ABBREVIATIONS, "abbreviations")
+    return tuple((_spelled_unit(name), power) for name, power in pairs)
+
+
+def _spelled_unit(name: str) -> Type['UnitBase']:
+    unit = _get_unit(name)
+    if unit is None:
+        # A prefixed unit that turned out to be an existing unit by another name
+        raise KeyError(f"The requested unit {name} does not exist")
+    return unit
+
+
 def _base_scale(composition: Union['Compound', Pairs]) -> Decimal:
     base_scale = Decimal(1)
     for u, e in composition:
-        base_scale *= u.scale ** e
+        power = _SCALES.power(u.scale, _frac_to_decimal(e, _SCALES))
+        base_scale = _SCALES.multiply(base_scale, power)
     return base_scale
 
 
-def _frac_to_decimal(frac: Union[Fraction, Decimal, int, float]) -> Decimal:
+def _frac_to_decimal(frac: Union[Fraction, Decimal, int, float],
+                     context: Optional[decimal.Context] = None) -> Decimal:
     if hasattr(frac, "numerator"):
-        return frac.numerator / Decimal(frac.denominator)
+        context = context or decimal.getcontext()
+        return context.divide(frac.numerator, Decimal(frac.denominator))
     return Decimal(frac)
 
 
 class DimensionBase:
+    """A dimension, identified by its exponents over the base dimensions.
+
+    Every dimension has an exponent vector with one place for each base
+    dimension, and dimensions are interned by that vector. Two dimensions
+    made of the same base dimensions are therefore the same object, so
+    checking compatibility is an identity check and combining dimensions is
+    adding vectors. Each dimension also gets a small integer ``id`` in order
+    of creation.
+    """
     __INSTANCES = {}
+    # Which place in the exponent vector belongs to each base dimension
+    __BASE_PLACES = {name: i for i, name in enumerate(_RESERVED_BASE_DIMENSIONS)}
+
+    vector: Tuple[Union[int, Decimal], ...]
+    id: int
 
-    def __new__(cls, name: str, exponents: Pairs):
+    def __new__(cls, name: Optional[str], exponents: Pairs):
         exponents = tuple((k, v) for k, v in exponents if v != 0)
         if len(exponents) == 0:
-            # Base dimensions are identified by name
-            key = name
-        elif len(exponents) == 1 and exponents[0][1] == 1:
-            # If you end up with a base unit after a calculation
-            decomposed = _decompose_all(exponents)
-            if len(decomposed) == 1 and decomposed[0][1] == 1:
-                key = name
-            else:
-                key = decomposed
+            vector = cls.__base_vector(name)
         else:
-            # Compound dimensions with the same base dimensions must refer to the same thing
-            key = _decompose_all(exponents)
-        if key not in cls.__INSTANCES:
-            cls.__INSTANCES[key] = super(DimensionBase, cls).__new__(cls)
-            this = cls.__INSTANCES[key]
-            this.__name__ = name
-            this.composition = Compound(exponents or ((this, 1),))
-        return cls.__INSTANCES[key]
+            vector = _dimension_vector(exponents)
+        existing = cls.__INSTANCES.get(vector)
+        if existing is not None:
+            return existing
+        with _REGISTRY_LOCK:
+            return cls.__INSTANCES.get(vector) or cls.__create(name, exponents, vector)
+
+    @classmethod
+    def __create(cls, name: Optional[str], exponents: Pairs, vector) -> 'DimensionBase':
+        this = super(DimensionBase, cls).__new__(cls)
+        this.__name__ = name if name is not None else str(Multiset(exponents))
+        this.vector = vector
+        this.id = len(cls.__INSTANCES)
+        this.composition = Compound(exponents or ((this, 1),))
+        # Conversion factors between units of this dimension, filled as used
+        this.factors = {}
+        this.units = []
+        cls.__INSTANCES[vector] = this
+        return this
+
+    @classmethod
+    def __base_vector(cls, name: str) -> Tuple[int, ...]:
+        # Base dimensions are identified by name
+        places = cls.__BASE_PLACES
+        if name not in places:
+            with _REGISTRY_LOCK:
+                if name not in places:
+                    places[name] = max(len(_RESERVED_BASE_DIMENSIONS), len(places))
+        return (0,) * places[name] + (1,)
+
+    def __setattr__(self, key, value):
+        previous = self.__dict__.get(key)
+        object.__setattr__(self, key, value)
+        if key.startswith("to_"):
+            # Conversions are real methods of every unit of this dimension
+            for unit in tuple(self.units):
+                _install_converter(unit, key, value, replaces=previous)
 
     def __hash__(self):
-        return hash(self.__name__)
+        return self.id
 
     def __repr__(self):
         return self.__name__
 
 
+def _dimension_vector(exponents: Pairs) -> Tuple[Union[int, Decimal], ...]:
+    """Add up the exponent vectors of dimensions raised to powers.
+
+    Trailing zeros are left off, so that a vector doesn't change when more
+    base dimensions are created.
+    """
+    size = max(len(dimension.vector) for dimension, _ in exponents)
+    total = [0] * size
+    for dimension, exponent in exponents:
+        for i, e in enumerate(dimension.vector):
+            total[i] += e * exponent
+    while total and total[-1] == 0:
+        total.pop()
+    return tuple(total)
+
+
 class Multiset:
     # just different enough from collections.Counter to be worth writing
+    # Immutable so it can be hashed; the sorted pairs are computed once here
+    # rather than every time they're needed
+    __slots__ = ("store", "_pairs", "_hash")
+
     def __init__(self, pairs: Union[Pairs, 'Multiset', dict]):
         if isinstance(pairs, Multiset):
-            self.store = pairs.store.copy()
+            store = pairs.store.copy()
         # Split these cases from each other just because it makes pycharm's
         # type inference work properly
         elif isinstance(pairs, dict):
-            self.store = pairs.copy()
+            store = pairs.copy()
         else:
-            self.store = _dedupe(pairs)
-        self.store = {k: v for k, v in self.store.items() if v != 0}
+            store = _dedupe(pairs)
+        store = {k: v for k, v in store.items() if v != 0}
+        object.__setattr__(self, "store", MappingProxyType(store))
+        object.__setattr__(self, "_pairs", _sort(store))
+        object.__setattr__(self, "_hash", hash(frozenset(store.items())))
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Multiset is immutable")
 
     def __iter__(self) -> Iterator[UnitLike]:
         return iter(self.store.keys())
@@ -376,14 +1442,17 @@ class Multiset:
 
     def __eq__(self, other):
         if isinstance(other, Multiset):
-            return self.store == other.store
+            return self._hash == other._hash and self.store == other.store
         return False
 
+    def __hash__(self):
+        return self._hash
+
     def __len__(self):
         return len(self.store)
 
     def __str__(self):
-        names = [_exponent_name(k, v) for k, v in _sort(self.store)]
+        names = [_exponent_name(k, v) for k, v in self._pairs]
         return "_".join(names)
 
     def add(self, elem: Union[type, 'Multiset']):
@@ -399,7 +1468,7 @@ class Multiset:
         return self.__merge(elem)
 
     def to_pairs(self) -> Pairs:
-        return _sort((key, self[key]) for key in self)
+        return self._pairs
 
     def __merge(self, other: 'Multiset') -> 'Multiset':
         copy = self.store.copy()
@@ -414,24 +1483,43 @@ class Multiset:
 
 
 class Compound:
-    def __init__(self, units: Union[Pairs, Multiset]):
+    """The units that make up a unit, broken down into base units.
+
+    Compounds are interned: constructing one with the same base units as an
+    existing one returns that same object. They can therefore be compared by
+    identity and used directly as dict keys.
+    """
+    __slots__ = ("units", "dimensions", "_pairs")
+    __INSTANCES = {}
+
+    def __new__(cls, units: Union[Pairs, Multiset]):
         if isinstance(units, Multiset):
-            self.units = Multiset(units)
+            units = Multiset(units)
         else:
-            decomposed = _decompose_all(units)
-            self.units = Multiset(decomposed)
-
-    def __eq__(self, other):
-        try:
-            return self.units == other.units
-        except AttributeError:
-            return False
+            units = Multiset(_decompose_all(units))
+        if units in cls.__INSTANCES:
+            return cls.__INSTANCES[units]
+        this = super(Compound, cls).__new__(cls)
+        object.__setattr__(this, "units", units)
+        object.__setattr__(this, "_pairs", units.to_pairs())
+        # Dimension objects stand in for themselves in dimension compositions
+        object.__setattr__(this, "dimensions",
+                           {getattr(unit, "dimension", unit): unit for unit in units})
+        # setdefault is atomic, so threads racing to make the same compound
+        # all get the one that was stored first
+        return cls.__INSTANCES.setdefault(units, this)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Compound is immutable")
+
+    def __reduce__(self):
+        return Compound, (self.units,)
 
     def __len__(self):
         return len(self.units)
 
     def __iter__(self):
-        yield from self.to_pairs()
+        yield from self._pairs
 
     def __mul__(self, other: Union[type, Multiset, 'Compound']) -> 'Compound':
         if isinstance(other, type):
@@ -451,27 +1539,27 @@ class Compound:
 
     def __pow__(self, power: Union[int, float, Decimal, Fraction]):
         pairs = []
-        for t, e in self.to_pairs():
+        for t, e in self._pairs:
             new_exponent = e * power
             pairs.append((t, _frac_to_decimal(new_exponent)))
         return Compound(tuple(pairs))
 
     def __verify_no_dimension_mismatch(self, extra: Multiset):
-        existing_dimensions = {unit.dimension: unit for unit in self.units}
+        existing_dimensions = self.dimensions
         for unit in extra:
-            if (unit.dimension in existing_dimensions
-                    and existing_dimensions[unit.dimension] is not unit):
+            dimension = getattr(unit, "dimension", unit)
+            if (dimension in existing_dimensions
+                    and existing_dimensions[dimension] is not unit):
                 # the dimension is already represented in the current unit, but it isn't the
                 # same unit
-                raise ImplicitConversionError(unit, existing_dimensions[unit.dimension])
+                raise ImplicitConversionError(unit, existing_dimensions[dimension])
 
     def to_pairs(self) -> Pairs:
-        return self.units.to_pairs()
+        return self._pairs
 
     def make_abbreviation(self) -> str:
-        ordered = _sort(self.to_pairs())
         chunks = []
-        for unit, exponent in ordered:
+        for unit, exponent in self._pairs:
             if exponent == 1:
                 chunks.append(unit.abbreviation)
             else:
@@ -480,63 +1568,51 @@ class Compound:
 
     @classmethod
     def from_string(cls, spec: str) -> 'Compound':
-        name_values = {
-            None: 1,
-            "": 1,
-            "_squared": 2,
-            "_cubed": 3,
-            "_to_the_fourth": 4,
-            "_to_the_fifth": 5,
-            # that's the highest I've ever seen
-        }
-        names = "|".join(
-            itertools.chain(
-                _EXTANT_UNITS,
-                [n.rstrip("s") for n in _EXTANT_UNITS]
-            )
-        )
-        pattern = re.compile(
-            r"(per_)?(" + names + "|[a-z]+)(_squared|_cubed|_to_the_fourth|_to_the_fifth)?"
-        )
-        pairs = []
-        for match in re.finditer(pattern, spec):
-            name = match.group(2)
-            if name not in _EXTANT_UNITS:
-                name = name + "s"
-                if name not in _EXTANT_UNITS:
-                    raise KeyError(f"The requested unit {name} does not exist")
-            unit = _EXTANT_UNITS[name]
-            power = name_values[match.group(3)]
-            if match.group(1):
-                power *= -1
-            pairs.append((unit, power))
-        return cls(tuple(pairs))
+        """Read a compound from a name like ``meters_per_second_squared``.
+
+        :raises KeyError: If any part of the name isn't a known unit.
+        """
+        return _parse_names(spec)
 
 
 class UnitBase:
     """The base class for unit classes, defining their interface."""
     composition: 'Compound'
     scale: 'Decimal'
+    scales: Dict[str, Number]
     abbreviation: str
     dimension: DimensionBase
-    __slots__ = ["value"]
+    # Set for units in a family made by si_unit
+    si_ladder: Optional[Dict[int, Union[str, Type['UnitBase']]]] = None
+    si_exponent: int = 0
+    # Weak references are needed for the weak flyweight policy
+    __slots__ = ["value", "__weakref__"]
 
     def __new__(cls, value: Scale):
         """Create a new measurement using this unit.
 
-        Instances are flyweights; two invocations of ``meters(1)`` will return
-        the same object.
+        Instances are flyweights; two invocations of ``meters(1)`` will
+        usually return the same object. How many are kept for reuse is set with
+        :func:`set_flyweight_policy <pyunitx._api.set_flyweight_policy>`.
 
         :param value: The numerical value of the measurement, in any form that
-            :external:py:class:`decimal.Decimal` can accept.
+            the current numeric backend can accept (see
+            :func:`set_backend <pyunitx._api.set_backend>`). For the default,
+            that's anything :external:py:class:`decimal.Decimal` can accept.
         :return: The newly created measurement, or the cached version.
         """
-        v = Decimal(value)
-        if v not in cls.instances:
+        backend = _backend()
+        kind = backend.type
+        # Integers are exact in every backend, and quicker to look up than the
+        # values they'd be converted to
+        key = value if type(value) is int or type(value) is kind else backend.convert(value)
+        instances = cls.instances
+        instance = instances.get(key, kind)
+        if instance is None:
             # noinspection PySuperArguments
-            cls.instances[v] = super(type, cls).__new__(cls)
-        instance = cls.instances[v]
-        instance.value = v
+            instance = super(type, cls).__new__(cls)
+            instance.value = key if type(key) is kind else backend.convert(key)
+            instances.put(key, instance)
         return instance
 
     def __add__(self, other: UnitOperand) -> 'UnitBase':
@@ -547,8 +1623,12 @@ class UnitBase:
         :return: A measurement with the values of the two added.
         """
         if type(other) != type(self):
+            if not isinstance(other, (UnitBase, *_NUMBERS)):
+                # Let containers of measurements like QuantityArray handle it
+                return NotImplemented
             raise OperationError("add", type(self), type(other))
-        return type(self)(self.value + other.value)
+        a, b = _coerced(self.value, other.value)
+        return type(self)(a + b)
 
     def __radd__(self, other):
         return self.__add__(other)
@@ -561,8 +1641,11 @@ class UnitBase:
         :return: A measurement with the values of the two subtracted.
         """
         if type(other) != type(self):
+            if not isinstance(other, (UnitBase, *_NUMBERS)):
+                return NotImplemented
             raise OperationError("subtract", type(self), type(other))
-        return type(self)(self.value - other.value)
+        a, b = _coerced(self.value, other.value)
+        return type(self)(a - b)
 
     def __rsub__(self, other):
         # Order doesn't matter as any cases where you're actually adding two
@@ -582,6 +1665,30 @@ class UnitBase:
             return False
         return self.value == other.value
 
+    def __hash__(self):
+        """Hash consistently with equality, so measurements can be set members or dict keys.
+
+        Like equality, this depends on the unit, so ``kilometers(1)`` and
+        ``meters(1000)`` are different keys. To treat them as the same, use
+        :meth:`canonical_key <pyunitx.length.meters.canonical_key>`.
+        """
+        return hash((type(self), self.value))
+
+    def canonical_key(self) -> Tuple[DimensionBase, Union[Decimal, Fraction]]:
+        """Get a key that's the same for all measurements of the same quantity.
+
+        The key pairs the dimension with the exact value in the dimension's
+        base unit, so ``kilometers(1).canonical_key() ==
+        meters(1000).canonical_key()``. It can be used to group or deduplicate
+        measurements in a mix of units without converting them.
+
+        No rounding is done, so measurements only share a key if they are
+        exactly the same quantity according to the scales of their units.
+
+        :return: A tuple of the dimension and the base unit value.
+        """
+        return self.dimension, _exact_base_value(self)
+
     def __mul__(self, other: UnitOperand) -> Union['UnitBase', Decimal]:
         """Multiply two measurements.
 
@@ -600,16 +1707,16 @@ class UnitBase:
         :raises TypeError: If base units are incompatible.
         :return: The result of the calculation, with the compound units.
         """
-        if isinstance(other, (int, float, Decimal)):
-            return type(self)(self.value * Decimal(other))
-        result_value = self.value * other.value
-        unit_composition = (self.composition * other.composition).units
-        if len(unit_composition) == 0:
+        if isinstance(other, _NUMBERS):
+            a, b = _coerced(self.value, _in_backend(other))
+            return type(self)(a * b)
+        if not isinstance(other, UnitBase):
+            return NotImplemented
+        result_unit, _ = _RESULT_UNITS.lookup(type(self), type(other), "*")
+        a, b = _coerced(self.value, other.value)
+        result_value = a * b
+        if result_unit is None:
             return result_value
-        result_unit = make_compound_unit(
-            scale=self.scale * other.scale,
-            exponents=unit_composition
-        )
         return result_unit(result_value)
 
     def __rmul__(self, other: UnitOperand) -> 'UnitBase':
@@ -634,21 +1741,22 @@ class UnitBase:
         :raises TypeError: If base units are incompatible.
         :return: The result of the division, with correct units.
         """
-        if isinstance(other, (int, float, Decimal)):
-            return type(self)(self.value / Decimal(other))
-        result_units = self.composition / other.composition
-        result_value = self.value / other.value
-        if len(result_units) == 0:
+        if isinstance(other, _NUMBERS):
+            a, b = _coerced(self.value, _in_backend(other))
+            return type(self)(a / b)
+        if not isinstance(other, UnitBase):
+            return NotImplemented
+        result_unit, _ = _RESULT_UNITS.lookup(type(self), type(other), "/")
+        a, b = _coerced(self.value, other.value)
+        result_value = a / b
+        if result_unit is None:
             return result_value
-        result_unit = make_compound_unit(
-            scale=self.scale / other.scale,
-            exponents=result_units.to_pairs()
-        )
         return result_unit(result_value)
 
-    def __rtruediv__(self, other: Union[int, float, Decimal]) -> 'UnitBase':
-        result_unit = type(self ** -1)
-        return result_unit(Decimal(other) / self.value)
+    def __rtruediv__(self, other: Number) -> 'UnitBase':
+        result_unit, _ = _RESULT_UNITS.lookup(type(self), -1, "**")
+        a, b = _coerced(_in_backend(other), self.value)
+        return result_unit(a / b)
 
     def __pow__(self, other: Union[int, float, Decimal, Fraction, str]):
         """Raise this measurement to a power.
@@ -663,42 +1771,108 @@ class UnitBase:
 
         Anything other than fractions will be run through the
         :external:py:class:`decimal.Decimal` constructor first, so you can use
-        anything including strings to represent the number.
+        anything including strings to represent the number. With the float
+        backend, the power is a float.
 
         :param other: Any integer, the power to raise this measurement to.
         :return: A measurement with the value and units raised to the power.
         """
         if isinstance(other, str):
             other = Decimal(other)
-        result_composition = self.composition ** other
-        result_value = self.value ** _frac_to_decimal(other)
-        result_unit = make_compound_unit(
-            scale=self.scale ** _frac_to_decimal(other),
-            exponents=result_composition.to_pairs()
-        )
+        result_unit, _ = _RESULT_UNITS.lookup(type(self), other, "**")
+        backend = _backend()
+        result_value = backend.power(backend.convert(self.value), other)
         return result_unit(result_value)
 
+    def _comparable(self, other: 'UnitBase') -> Optional[Tuple[Number, Number]]:
+        # The same unit can be compared as is, others go through the base unit.
+        # Anything that isn't a measurement gets a chance to compare itself.
+        if type(other) is type(self):
+            return self.value, other.value
+        if not isinstance(other, UnitBase):
+            return None
+        if other.dimension is self.dimension:
+            return _base_value(self), _base_value(other)
+        raise TypeError(f"{self.abbreviation} and {other.abbreviation} cannot be compared")
+
     def __lt__(self, other):
         """Check if this measurement is less than another.
 
+        Measurements in different units of the same dimension are compared by
+        their values in the base unit, so ``feet(3) < meters(1)``.
+
         :param other: The measurement to compare to.
-        :raises TypeError: If the two arguments are different units and can
-            therefore not be compared.
-        :return: Whether the other measurement is less than this one.
+        :raises TypeError: If the two arguments are of different dimensions and
+            can therefore not be compared.
+        :return: Whether this measurement is less than the other one.
         """
-        if type(other) != type(self):
-            raise TypeError(f"{self.abbreviation} and {other.abbreviation} cannot be compared")
-        return self.value * self.scale < other.value * other.scale
+        pair = self._comparable(other)
+        if pair is None:
+            return NotImplemented
+        a, b = pair
+        return a < b
 
     def __le__(self, other):
         """Check if this measurement is less than or equal to another.
 
+        Unlike equality, this compares measurements in different units by
+        their values in the base unit, so ``kilometers(1) <= meters(1000)``
+        even though the two aren't equal.
+
+        :param other: The measurement to compare to.
+        :raises TypeError: If the two arguments are of different dimensions and
+            can therefore not be compared.
+        :return: Whether this measurement is less than or equal to the other one.
+        """
+        pair = self._comparable(other)
+        if pair is None:
+            return NotImplemented
+        a, b = pair
+        return a <= b
+
+    def __gt__(self, other):
+        """Check if this measurement is greater than another.
+
+        :param other: The measurement to compare to.
+        :raises TypeError: If the two arguments are of different dimensions and
+            can therefore not be compared.
+        :return: Whether this measurement is greater than the other one.
+        """
+        pair = self._comparable(other)
+        if pair is None:
+            return NotImplemented
+        a, b = pair
+        return a > b
+
+    def __ge__(self, other):
+        """Check if this measurement is greater than or equal to another.
+
         :param other: The measurement to compare to.
-        :raises TypeError: If the two arguments are different units and can
-            therefore not be compared.
-        :return: Whether the other measurement is less than this one.
+        :raises TypeError: If the two arguments are of different dimensions and
+            can therefore not be compared.
+        :return: Whether this measurement is greater than or equal to the other one.
+        """
+        pair = self._comparable(other)
+        if pair is None:
+            return NotImplemented
+        a, b = pair
+        return a >= b
+
+    def sort_key(self) -> Number:
+        """Get the value of this measurement in the base unit of its dimension.
+
+        Use it to sort or search measurements in a mix of units of one
+        dimension as plain numbers, without converting any of them::
+
+            ordered = sorted(lengths, key=lambda m: m.sort_key())
+            keys = [m.sort_key() for m in ordered]
+            shorter = ordered[:bisect.bisect_left(keys, meters(5).sort_key())]
+
+        The key doesn't include the dimension, so don't mix dimensions.
+
+        :return: The value in the base unit, of the same numeric type as the value.
         """
-        return self < other or self == other
+        return _base_value(self)
 
     def __abs__(self):
         """Get the absolute value of this measurement.
@@ -721,6 +1895,88 @@ class UnitBase:
         """
         return self
 
+    @classmethod
+    def convert_many(cls, values, to: Type['UnitBase'], precision: Optional[int] = None):
+        """Convert many plain numbers from this unit to another at once.
+
+        The conversion is the same one ``to_*`` would do, but it's worked out
+        once and no measurements are created::
+
+            kilometers = miles.convert_many([1, 26.2, 100], to=kilometers)
+
+        The results come back in the same kind of container as the values: a
+        list, tuple, NumPy array, or :external:py:class:`array.array`. Other
+        buffers like :external:py:class:`memoryview` give an ``array.array``
+        of floats, and anything else, like a generator, gives a list. NumPy
+        arrays of numbers and buffers are converted as floats, and the rest,
+        including NumPy arrays of objects, as the current numeric backend's
+        type. To convert an unbounded stream of values, use
+        :meth:`convert_stream <pyunitx.length.meters.convert_stream>`.
+
+        :param values: The values in this unit.
+        :param to: The unit to convert to.
+        :param precision: The number of significant digits to round decimal
+            results to, instead of the current precision.
+        :raises ImplicitConversionError: If there's no conversion between the
+            units, as when they measure different dimensions.
+        :return: The values in the other unit.
+        """
+        if isinstance(values, (list, tuple)):
+            return type(values)(cls.convert_stream(values, to, precision))
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(values, numpy.ndarray) and values.dtype.kind == "O":
+            # Objects can be exact numbers, which shouldn't be mixed with floats
+            converted = numpy.empty(values.shape, dtype=object)
+            converted.flat = list(cls.convert_stream(values.flat, to, precision))
+            return converted
+        scale, divisor = cls.__scales(to, precision)
+        factor = float(scale / divisor)
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            if values.dtype.kind in "fc":
+                return values * values.dtype.type(factor)
+            return values * factor
+        if isinstance(values, array.array):
+            code = values.typecode if values.typecode in "fd" else "d"
+            return array.array(code, map(factor.__mul__, values))
+        if isinstance(values, memoryview):
+            return array.array("d", map(factor.__mul__, values.tolist()))
+        return list(cls.convert_stream(values, to, precision))
+
+    @classmethod
+    def convert_stream(cls, values: Iterable, to: Type['UnitBase'],
+                       precision: Optional[int] = None) -> Iterator[Number]:
+        """Convert plain numbers from this unit to another as they're needed.
+
+        This is :meth:`convert_many <pyunitx.length.meters.convert_many>` for
+        iterators that are too long to hold at once, or never end. The
+        conversion is worked out immediately, and each value is converted when
+        it's taken from the result.
+
+        :param values: The values in this unit.
+        :param to: The unit to convert to.
+        :param precision: The number of significant digits to round decimal
+            results to, instead of the current precision.
+        :raises ImplicitConversionError: If there's no conversion between the
+            units, as when they measure different dimensions.
+        :return: An iterator of the values in the other unit, as the current
+            numeric backend's type.
+        """
+        backend = _backend()
+        rescale = _rescaler(*cls.__scales(to, precision), precision)
+        return map(rescale, map(backend.convert, values))
+
+    @classmethod
+    def __scales(cls, to: Type['UnitBase'], precision: Optional[int]) -> Tuple[Number, Number]:
+        # The conversion is whichever to_* method is named for the unit, which
+        # may give plain numbers, like converting to radians does
+        try:
+            target, scale, divisor = _conversion(cls, _converter_name(to), precision)
+        except AttributeError:
+            raise ImplicitConversionError(cls, to) from None
+        if target is not None and target is not to:
+            raise ImplicitConversionError(cls, to)
+        return scale, divisor
+
     def __getattr__(self, key: str):
         """Forward conversion requests to the dimension.
 
@@ -728,36 +1984,24 @@ class UnitBase:
         is the logical place to store all conversion functions between different
         units.
 
-        Any ``x.to_*`` method calls are therefore passed to the dimension.
+        Conversions between the units of a dimension are stored on the
+        dimension and installed as methods of each of its units, including
+        units defined later, so they don't come through here. Any other
+        ``x.to_*`` lookups are passed to the dimension.
+
+        Conversions that have to be worked out from the name, like
+        ``to_kilometers_per_hour``, are only worked out once; afterwards they
+        are ordinary methods of the unit.
 
         :param key: The method name.
-        :return: A pseudo-bound method of the conversion function.
+        :return: A bound method of the conversion function.
         :raise AttributeError: If the requested method doesn't look like a
             conversion function, or if there isn't a conversion function by that
             name.
         """
         if key.startswith("to_"):
-            if not hasattr(self.dimension, key):
-                composition = Compound.from_string(key[3:])
-                base_scale = _base_scale(composition)
-                unit = make_compound_unit(
-                    name=key[3:],
-                    scale=base_scale,
-                    exponents=composition.to_pairs(),
-                )
-                if 'radian' in key:
-                    from pyunitx.angle import Angle
-                    angle = [(u, e) for u, e in self.composition if u.dimension == Angle]
-                    assert len(angle) == 1
-                    angular, exponent = angle[0]
-                    factor = (Decimal(math.pi) / angular(180 / angular.scale)) ** exponent
-                    converted = self * factor
-                    return lambda: _make_converter(unit)(converted)
-                key = "to_" + unit.__name__
-                # It is automatically registered on the dimension on creation,
-                # no need to explicitly use it
-            return lambda: getattr(self.dimension, key)(self)
-        raise AttributeError()
+            return MethodType(_resolve_converter(type(self), key), self)
+        raise AttributeError(key)
 
     def __str__(self):
         return f"{self.value} {self.abbreviation}"
@@ -791,10 +2035,8 @@ class UnitBase:
         :param dim: The dimension to check against.
         :return: Whether this unit is of the given dimension.
         """
-        try:
-            return dim.composition == self.dimension.composition
-        except AttributeError:
-            return False
+        # Dimensions are interned by their exponent vectors
+        return dim is self.dimension
 
     def equivalent_to(self, other: 'UnitBase', figs=5) -> bool:
         """Check if this measurement represents the same quantity as another,
@@ -807,27 +2049,26 @@ class UnitBase:
         :param figs: How many significant figures to round to before comparison.
         :raises TypeError: If the two units do not represent the same dimension
             and therefore cannot be compared.
+        :raises ValueError: If fewer than one significant figure is asked for.
         :return: Whether the two measurements are approximately equal.
         """
         if not other.is_dimension(self.dimension):
             raise ImplicitConversionError(type(other), type(self))
-        with warnings.catch_warnings():
-            # sigfig.round raises warnings if the quantity being rounded has fewer significant
-            # figures than are given, but for the purposes of this comparison, I don't care
-            # so ignore them all
-            warnings.simplefilter("ignore")
-            a = sigfig.round(self.value * self.scale, sigfigs=figs)
-            b = sigfig.round(other.value * other.scale, sigfigs=figs)
+        a = _round_sig_figs(_to_decimal(self.value) * self.scale, figs)
+        b = _round_sig_figs(_to_decimal(other.value) * other.scale, figs)
         return a == b
 
     def sig_figs(self, figs=3):
         """Produce a version of this measurement rounded to significant figures.
 
+        To round many measurements at once, use
+        :func:`round_sig_figs <pyunitx._api.round_sig_figs>`.
+
         :param figs: How many significant figures to round to.
+        :raises ValueError: If fewer than one significant figure is asked for.
         :return: A new measurement with a rounded value.
         """
-        rounded = sigfig.round(self.value, sigfigs=figs)
-        return type(self)(rounded)
+        return type(self)(_round_sig_figs(_to_decimal(self.value), figs))
 
     def to_latex(self, siunitx_major_version=SIUNITX_NEW):
         r"""Output this unit value as it would be used in LaTeX with siunitx.
@@ -873,6 +2114,9 @@ class UnitBase:
         These are not used nearly as often, with the exception of the
         centimeter.
 
+        To convert many measurements at once, see
+        :func:`natural_si <pyunitx._api.natural_si>`.
+
         :raises TypeError: If this unit is not an SI unit.
         :raises ValueError: If the value of this unit is too big or too small
             to be directly expressed with an SI prefix. Instead you should
@@ -881,24 +2125,4 @@ class UnitBase:
         :return: This value expressed in the unit that requires no extra
             scientific notation.
         """
-        magnitude = math.log10(self.scale)
-        if magnitude != int(magnitude):
-            raise TypeError("This isn't an SI unit so prefixes can't be applied")
-        pattern = re.compile(
-            f"[{''.join(p for _, p, __ in _SI_PREFIXES)}]?" +
-            "(m|g|s|A|K|cd|mol|J|Hz|C|Pa|V|Ω)"
-        )
-        if not pattern.match(self.abbreviation):
-            raise TypeError("This isn't a base SI unit so prefixes can't be applied")
-        order = (self.value * self.scale).adjusted()
-        if order > 26 or order < -24:
-            raise ValueError("SI prefixes only cover 48 orders of magnitude")
-        mag = (order // 3) * 3
-        family = [u for u in _EXTANT_UNITS.values()
-                  if u.dimension == self.dimension and u.scale == Decimal(f"1e{mag}")]
-        if len(family) != 1:
-            # kelvin/celsius are a special case, being equal in scale
-            k = [u for u in family if u.__name__ == "kelvin"]
-            family = [k[0]]
-        converter_name = f"to_{family[0].__name__}"
-        return getattr(self, converter_name)()
+        return _natural_si(self)
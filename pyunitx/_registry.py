@@ -0,0 +1,218 @@
+"""A snapshot of which module defines each named unit.
+
+Submodules are imported the first time they're used, but recognizing a unit
+by name, symbol, or composition needs to know about units in modules that
+haven't been used yet. Rather than importing every module to find out, the
+snapshot in ``_snapshot.py`` says which module to import. It records the
+names, symbols, scales, compositions, and dimensions of the registry along
+with a hash of the module sources it was built from. If the sources have
+changed since, it isn't used and everything is imported instead.
+
+Regenerate it after changing unit definitions with::
+
+    python -m pyunitx._registry
+"""
+import ast
+import functools
+import hashlib
+import importlib
+import os
+import sys
+from decimal import Decimal
+from typing import Tuple, Optional, Set, Dict, NamedTuple, Iterable
+
+from pyunitx import _api
+from pyunitx._api import _EXACT
+from pyunitx._tokenize import Trie, is_compound_name, tokenize_names, tokenize_abbreviations
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_SNAPSHOT = os.path.join(_HERE, "_snapshot.py")
+
+CompositionKey = Tuple[Tuple[Tuple[str, str], ...], str]
+
+
+class _Index(NamedTuple):
+    # Each spelling maps to itself in the tries, and to the modules that use
+    # it in the dicts
+    names: Trie
+    abbreviations: Trie
+    name_owners: Dict[str, Set[str]]
+    abbreviation_owners: Dict[str, Set[str]]
+    compositions: Dict[CompositionKey, str]
+
+
+def source_hash(modules: Iterable[str]) -> str:
+    """Hash the sources of the modules that define units."""
+    digest = hashlib.sha256()
+    for module in modules:
+        with open(os.path.join(_HERE, module + ".py"), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def composition_key(composition: '_api.Compound', scale: Decimal) -> CompositionKey:
+    pairs = tuple((unit.__name__, str(exp)) for unit, exp in composition.to_pairs())
+    return pairs, str(Decimal(scale).normalize(_EXACT))
+
+
+def modules_defining(modules: Tuple[str, ...], *, names: str = None,
+                     abbreviations: str = None, composition: '_api.Compound' = None,
+                     scale: Decimal = None) -> Optional[Set[str]]:
+    """Find which modules need to be imported to look something up.
+
+    :param modules: All the modules that define units.
+    :param names: A spec of unit names like ``kilometers_per_hour``.
+    :param abbreviations: A spec of unit symbols like ``km/h``.
+    :param composition: The composition of a unit, along with its scale.
+    :param scale: The scale of a unit, along with its composition.
+    :return: The modules that define the units, empty if none do, or None if
+        the snapshot is missing or out of date.
+    """
+    index = _load_index(modules)
+    if index is None:
+        return None
+    if composition is not None:
+        owner = index.compositions.get(composition_key(composition, scale))
+        return {owner} if owner else set()
+    if names is not None:
+        tokenize, spec, trie, owners = tokenize_names, names, index.names, index.name_owners
+    else:
+        tokenize, spec, trie, owners = (tokenize_abbreviations, abbreviations,
+                                        index.abbreviations, index.abbreviation_owners)
+    try:
+        found = tokenize(spec, trie)
+    except KeyError:
+        return set()
+    return set().union(*(owners[spelling] for spelling, _ in found))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_index(modules: Tuple[str, ...]) -> Optional[_Index]:
+    try:
+        from pyunitx import _snapshot
+    except ImportError:
+        return None
+    if _snapshot.SOURCE_HASH != source_hash(modules):
+        return None
+    index = _Index(Trie(), Trie(), {}, {}, {})
+    defined = {name for _, name, *_ in _snapshot.UNITS}
+    # Mirrors how the registry indexes spellings
+    for module, name, abbrev, scale, composition, _ in _snapshot.UNITS:
+        if composition is not None:
+            index.compositions[composition, scale] = module
+        if is_compound_name(name):
+            continue
+        spellings = [name]
+        singular = name.rstrip("s")
+        if singular not in defined:
+            spellings.append(singular)
+        for spelling in spellings:
+            index.names.insert(spelling, spelling)
+            index.name_owners.setdefault(spelling, set()).add(module)
+        if abbrev is not None:
+            index.abbreviations.insert(abbrev, abbrev)
+            index.abbreviation_owners.setdefault(abbrev, set()).add(module)
+    return index
+
+
+def build(modules: Tuple[str, ...]) -> str:
+    """Import every module and write down what each one defines.
+
+    This has to run in a fresh interpreter, so that the registry starts empty
+    and each unit can be attributed to the module that created it.
+
+    :return: The source of the snapshot module.
+    """
+    # Looking elsewhere for missing units would pull in modules out of order
+    _api._REGISTRY_LOADER = None
+    owners = {}
+    for module in _import_order(modules):
+        importlib.import_module(f"pyunitx.{module}")
+        for pending in _api._PENDING_UNITS.values():
+            owners.setdefault(pending.name, module)
+        for unit in _api._EXTANT_UNITS.values():
+            # A prefixed unit belongs where it was declared, not where it was built
+            owners.setdefault(unit, owners.get(unit.__name__, module))
+
+    rows = []
+    for unit in _api._EXTANT_UNITS.values():
+        rows.append((
+            owners[unit],
+            unit.__name__,
+            _api._own_abbreviation(unit),
+            str(unit.scale.normalize(_EXACT)),
+            composition_key(unit.composition, unit.scale)[0],
+            unit.dimension.__name__,
+        ))
+    for pending in _api._PENDING_UNITS.values():
+        rows.append((
+            owners[pending.name],
+            pending.name,
+            pending.abbrev,
+            str(Decimal(pending.scale).normalize(_EXACT)),
+            None if pending.key is None else composition_key(*pending.key)[0],
+            pending.base_unit.dimension.__name__,
+        ))
+
+    lines = [
+        "# Generated by python -m pyunitx._registry, do not edit",
+        f"SOURCE_HASH = {source_hash(modules)!r}",
+        "UNITS = (",
+    ]
+    lines.extend(f"    {row!r}," for row in rows)
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def _import_order(modules: Tuple[str, ...]) -> Iterable[str]:
+    # Dependencies first, so that no module is imported on behalf of another
+    order = []
+
+    def visit(module):
+        if module in order:
+            return
+        for dependency in _dependencies(module):
+            visit(dependency)
+        order.append(module)
+
+    for module in modules:
+        visit(module)
+    return order
+
+
+def _dependencies(module: str) -> Iterable[str]:
+    with open(os.path.join(_HERE, module + ".py")) as f:
+        tree = ast.parse(f.read())
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            package, _, name = node.module.partition(".")
+            if package == "pyunitx" and name and not name.startswith("_"):
+                yield name
+
+
+def main():
+    import argparse
+    from pyunitx import _SUBMODULES
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true",
+                        help="Exit with an error if the snapshot is out of date instead of"
+                             " writing it.")
+    args = parser.parse_args()
+    source = build(_SUBMODULES)
+    if args.check:
+        try:
+            with open(_SNAPSHOT) as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != source:
+            print("The registry snapshot is out of date", file=sys.stderr)
+            sys.exit(1)
+    else:
+        with open(_SNAPSHOT, "w") as f:
+            f.write(source)
+
+
+if __name__ == "__main__":
+    main()
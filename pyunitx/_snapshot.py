@@ -0,0 +1,554 @@
+# Generated by python -m pyunitx._registry, do not edit
+SOURCE_HASH = '4cb671a751984c3860e3d9181252285e78bf7c30fe9a56609cdef435db19e8a1'
+UNITS = (
+    ('angle', 'degrees', '°', '1', (('degrees', '1'),), 'Angle'),
+    ('angle', 'arcminutes', '′', '0.01666666666666666666666666667', (('arcminutes', '1'),), 'Angle'),
+    ('angle', 'arcseconds', '″', '0.0002777777777777777777777777778', (('arcseconds', '1'),), 'Angle'),
+    ('angle', 'radians', 'rad', '0.0174532925199432954743716805978692718781530857086181640625', (), 'Angle'),
+    ('length', 'meters', 'm', '1', (('meters', '1'),), 'Length'),
+    ('length', 'feet', 'ft', '0.3048', (('feet', '1'),), 'Length'),
+    ('length', 'miles', 'mi', '1609.344', (('miles', '1'),), 'Length'),
+    ('length', 'yards', 'yd', '0.9144', (('yards', '1'),), 'Length'),
+    ('length', 'inches', 'in', '0.0254', (('inches', '1'),), 'Length'),
+    ('length', 'au', 'au', '1.495978707E+11', (('au', '1'),), 'Length'),
+    ('length', 'angstroms', 'Å', '1E-10', (('angstroms', '1'),), 'Length'),
+    ('area', 'acres', 'acre', '4046.873', (('meters', '2'),), 'Area'),
+    ('area', 'hectares', 'ha', '1E+4', (('meters', '2'),), 'Area'),
+    ('current', 'amperes', 'A', '1', (('amperes', '1'),), 'Current'),
+    ('time', 'seconds', 's', '1', (('seconds', '1'),), 'Time'),
+    ('time', 'minutes', 'min', '6E+1', (('minutes', '1'),), 'Time'),
+    ('time', 'hours', 'hr', '3.6E+3', (('hours', '1'),), 'Time'),
+    ('time', 'days', 'day', '8.64E+4', (('days', '1'),), 'Time'),
+    ('time', 'sidereal_days', 'day_sd', '86164.091', (('sidereal_days', '1'),), 'Time'),
+    ('time', 'julian_years', 'jyr', '3.15576E+7', (('julian_years', '1'),), 'Time'),
+    ('time', 'years', 'yr', '3.155693E+7', (('years', '1'),), 'Time'),
+    ('charge', 'coulombs', 'C', '1', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'fundamental_charge', 'e', '1.602176634E-19', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('mass', 'kilograms', 'kg', '1', (('kilograms', '1'),), 'Mass'),
+    ('mass', 'grams', 'g', '0.001', (('grams', '1'),), 'Mass'),
+    ('mass', 'tonnes', 't', '1E+3', (('tonnes', '1'),), 'Mass'),
+    ('mass', 'atomic_mass_unit', 'u', '1.660538782E-27', (('atomic_mass_unit', '1'),), 'Mass'),
+    ('mass', 'pounds_mass', 'lbm', '0.45359237', (('pounds_mass', '1'),), 'Mass'),
+    ('mass', 'troy_pounds_mass', 'lbm_T', '0.3732417', (('troy_pounds_mass', '1'),), 'Mass'),
+    ('mass', 'slugs', 'slug', '14.5939', (('slugs', '1'),), 'Mass'),
+    ('mass', 'tons', 'tn', '907.18474', (('tons', '1'),), 'Mass'),
+    ('force', 'newtons', 'N', '1', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'kilograms_force', 'kgf', '9.80665', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'pounds', 'lb', '4.4482216152605', (('feet', '1'), ('slugs', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('energy', 'joules', 'J', '1', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'calorie', 'cal', '4.184', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'btu', 'btu', '1054.35', (('feet', '2'), ('slugs', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'electronvolts', 'eV', '1.602176634E-19', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('voltage', 'volts', 'V', '1', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('capacitance', 'farads', 'F', '1', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('mole', 'moles', 'mol', '1', (('moles', '1'),), 'Quantity'),
+    ('mole', 'pound_moles', 'lbmol', '453.59237', (('pound_moles', '1'),), 'Quantity'),
+    ('power', 'watts', 'W', '1', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'kilowatts', 'kW', '1E+3', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'horsepower', 'hp', '745.6999', (('feet', '2'), ('slugs', '1'), ('seconds', '-3')), 'Power'),
+    ('pressure', 'pascals', 'Pa', '1', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'bars', 'bar', '1E+5', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'psi', 'psi', '6894.757', (('feet', '1'), ('slugs', '1'), ('inches', '-2'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'torr', 'Torr', '133.3223684210526315789473684', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('temperature', 'kelvin', 'K', '1', (('kelvin', '1'),), 'Temperature'),
+    ('temperature', 'celsius', '°C', '1', (('celsius', '1'),), 'Temperature'),
+    ('temperature', 'fahrenheit', '°F', '0.5555555555555555555555555556', (('fahrenheit', '1'),), 'Temperature'),
+    ('temperature', 'rankine', '°R', '0.5555555555555555555555555556', (('rankine', '1'),), 'Temperature'),
+    ('constants', 'meters_per_second', None, '1', (('meters', '1'), ('seconds', '-1')), 'Length_per_Time'),
+    ('constants', 'meters_cubed_per_kilogram_per_second_squared', None, '1', (('meters', '3'), ('kilograms', '-1'), ('seconds', '-2')), 'Length_cubed_per_Ma_per_Time_squared'),
+    ('constants', 'watts_per_meter_squared_per_kelvin_to_the_fourth', None, '1', (('kilograms', '1'), ('seconds', '-3'), ('kelvin', '-4')), 'Mass_per_Time_cubed_per_Temperature_to_the_fourth'),
+    ('constants', 'joules_per_kelvin_per_mole', None, '1', (('meters', '2'), ('kilograms', '1'), ('kelvin', '-1'), ('moles', '-1'), ('seconds', '-2')), 'Length_squared_Mass_per_Quantity_per_Temperature_per_Time_squared'),
+    ('constants', 'kilograms_per_mole', None, '1', (('kilograms', '1'), ('moles', '-1')), 'Mass_per_Quantity'),
+    ('constants', 'meters_per_second_squared', None, '1', (('meters', '1'), ('seconds', '-2')), 'Length_per_Time_squared'),
+    ('constants', 'joules_seconds', None, '1', (('meters', '2'), ('kilograms', '1'), ('seconds', '-1')), 'Length_squared_Mass_per_Time'),
+    ('constants', 'farads_per_meter', None, '1', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-3')), 'Time_to_the_fourth_Current_squared_per_Ma_per_Length_cubed'),
+    ('constants', 'newtons_per_ampere_squared', None, '1', (('kilograms', '1'), ('meters', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Length_Mass_per_Current_squared_per_Time_squared'),
+    ('constants', 'meters_cubed_kilograms_per_ampere_squared_per_second_to_the_fourth', None, '1', (('meters', '3'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-4')), 'Length_cubed_Mass_per_Current_squared_per_Time_to_the_fourth'),
+    ('data', 'bits', 'b', '1', (('bits', '1'),), 'Data'),
+    ('data', 'bytes', 'B', '8', (('bytes', '1'),), 'Data'),
+    ('data', 'nybbles', 'N', '4', (('nybbles', '1'),), 'Data'),
+    ('data', 'kibibytes', 'KiB', '8192', (('kibibytes', '1'),), 'Data'),
+    ('data', 'mebibytes', 'MiB', '8388608', (('mebibytes', '1'),), 'Data'),
+    ('data', 'gibibytes', 'GiB', '8589934592', (('gibibytes', '1'),), 'Data'),
+    ('data', 'tebibytes', 'TiB', '8796093022208', (('tebibytes', '1'),), 'Data'),
+    ('data', 'pebibytes', 'PiB', '9007199254740992', (('pebibytes', '1'),), 'Data'),
+    ('data', 'exbibytes', 'EiB', '9223372036854775808', (('exbibytes', '1'),), 'Data'),
+    ('derived', 'parsecs', 'pc', '30856775814913673.99198952281', (('parsecs', '1'),), 'Length'),
+    ('derived', 'lightyears', 'ly', '9.4607304725808E+15', (('lightyears', '1'),), 'Length'),
+    ('frequency', 'hertz', 'Hz', '1', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'rpm', 'rpm', '0.0166666666666666664353702032030923874117434024810791015625', (('minutes', '-1'),), 'Frequency'),
+    ('inductance', 'henry', 'H', '1', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('luminosity', 'candelas', 'cd', '1', (('candelas', '1'),), 'Luminous Intensity'),
+    ('magneticflux', 'weber', 'Wb', '1', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticfluxdensity', 'tesla', 'T', '1', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('resistance', 'ohms', 'Ω', '1', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'meters_squared_kilograms_per_kelvin_per_ampere_squared_per_second_cubed', None, '1', (('meters', '2'), ('kilograms', '1'), ('kelvin', '-1'), ('amperes', '-2'), ('seconds', '-3')), 'Length_squared_Mass_per_Temperature_per_Current_squared_per_Time_cubed'),
+    ('volume', 'meters_cubed', None, '1', (('meters', '3'),), 'Volume'),
+    ('volume', 'liters', 'L', '0.001', (('meters', '3'),), 'Volume'),
+    ('volume', 'milliliters', 'mL', '0.000001', (('meters', '3'),), 'Volume'),
+    ('volume', 'feet_cubed', None, '0.02831685', (('feet', '3'),), 'Volume'),
+    ('volume', 'fluid_ounces', 'fl oz', '0.00002957353', (('meters', '3'),), 'Volume'),
+    ('volume', 'imperial fluid ounce', None, '0.00002841306', (('meters', '3'),), 'Volume'),
+    ('volume', 'cups', 'c', '0.0002365882', (('meters', '3'),), 'Volume'),
+    ('volume', 'teaspoons', 'tsp', '0.000004928922', (('meters', '3'),), 'Volume'),
+    ('volume', 'tablespoons', 'tbsp', '0.00001478676', (('meters', '3'),), 'Volume'),
+    ('volume', 'gallons', 'gal', '0.003785412', (('meters', '3'),), 'Volume'),
+    ('volume', 'imperial_gallons', None, '0.00454609', (('meters', '3'),), 'Volume'),
+    ('length', 'yottameters', 'Ym', '1E+24', None, 'Length'),
+    ('length', 'zettameters', 'Zm', '1E+21', None, 'Length'),
+    ('length', 'exameters', 'Em', '1E+18', None, 'Length'),
+    ('length', 'petameters', 'Pm', '1E+15', None, 'Length'),
+    ('length', 'terameters', 'Tm', '1E+12', None, 'Length'),
+    ('length', 'gigameters', 'Gm', '1E+9', None, 'Length'),
+    ('length', 'megameters', 'Mm', '1E+6', None, 'Length'),
+    ('length', 'kilometers', 'km', '1E+3', None, 'Length'),
+    ('length', 'hectometers', 'hm', '1E+2', None, 'Length'),
+    ('length', 'dekameters', 'dam', '1E+1', None, 'Length'),
+    ('length', 'decimeters', 'dm', '0.1', None, 'Length'),
+    ('length', 'centimeters', 'cm', '0.01', None, 'Length'),
+    ('length', 'millimeters', 'mm', '0.001', None, 'Length'),
+    ('length', 'micrometers', 'μm', '0.000001', None, 'Length'),
+    ('length', 'nanometers', 'nm', '1E-9', None, 'Length'),
+    ('length', 'picometers', 'pm', '1E-12', None, 'Length'),
+    ('length', 'femtometers', 'fm', '1E-15', None, 'Length'),
+    ('length', 'attometers', 'am', '1E-18', None, 'Length'),
+    ('length', 'zeptometers', 'zm', '1E-21', None, 'Length'),
+    ('length', 'yoctometers', 'ym', '1E-24', None, 'Length'),
+    ('current', 'yottaamperes', 'YA', '1E+24', None, 'Current'),
+    ('current', 'zettaamperes', 'ZA', '1E+21', None, 'Current'),
+    ('current', 'exaamperes', 'EA', '1E+18', None, 'Current'),
+    ('current', 'petaamperes', 'PA', '1E+15', None, 'Current'),
+    ('current', 'teraamperes', 'TA', '1E+12', None, 'Current'),
+    ('current', 'gigaamperes', 'GA', '1E+9', None, 'Current'),
+    ('current', 'megaamperes', 'MA', '1E+6', None, 'Current'),
+    ('current', 'kiloamperes', 'kA', '1E+3', None, 'Current'),
+    ('current', 'hectoamperes', 'hA', '1E+2', None, 'Current'),
+    ('current', 'dekaamperes', 'daA', '1E+1', None, 'Current'),
+    ('current', 'deciamperes', 'dA', '0.1', None, 'Current'),
+    ('current', 'centiamperes', 'cA', '0.01', None, 'Current'),
+    ('current', 'milliamperes', 'mA', '0.001', None, 'Current'),
+    ('current', 'microamperes', 'μA', '0.000001', None, 'Current'),
+    ('current', 'nanoamperes', 'nA', '1E-9', None, 'Current'),
+    ('current', 'picoamperes', 'pA', '1E-12', None, 'Current'),
+    ('current', 'femtoamperes', 'fA', '1E-15', None, 'Current'),
+    ('current', 'attoamperes', 'aA', '1E-18', None, 'Current'),
+    ('current', 'zeptoamperes', 'zA', '1E-21', None, 'Current'),
+    ('current', 'yoctoamperes', 'yA', '1E-24', None, 'Current'),
+    ('time', 'yottaseconds', 'Ys', '1E+24', None, 'Time'),
+    ('time', 'zettaseconds', 'Zs', '1E+21', None, 'Time'),
+    ('time', 'exaseconds', 'Es', '1E+18', None, 'Time'),
+    ('time', 'petaseconds', 'Ps', '1E+15', None, 'Time'),
+    ('time', 'teraseconds', 'Ts', '1E+12', None, 'Time'),
+    ('time', 'gigaseconds', 'Gs', '1E+9', None, 'Time'),
+    ('time', 'megaseconds', 'Ms', '1E+6', None, 'Time'),
+    ('time', 'kiloseconds', 'ks', '1E+3', None, 'Time'),
+    ('time', 'hectoseconds', 'hs', '1E+2', None, 'Time'),
+    ('time', 'dekaseconds', 'das', '1E+1', None, 'Time'),
+    ('time', 'deciseconds', 'ds', '0.1', None, 'Time'),
+    ('time', 'centiseconds', 'cs', '0.01', None, 'Time'),
+    ('time', 'milliseconds', 'ms', '0.001', None, 'Time'),
+    ('time', 'microseconds', 'μs', '0.000001', None, 'Time'),
+    ('time', 'nanoseconds', 'ns', '1E-9', None, 'Time'),
+    ('time', 'picoseconds', 'ps', '1E-12', None, 'Time'),
+    ('time', 'femtoseconds', 'fs', '1E-15', None, 'Time'),
+    ('time', 'attoseconds', 'as', '1E-18', None, 'Time'),
+    ('time', 'zeptoseconds', 'zs', '1E-21', None, 'Time'),
+    ('time', 'yoctoseconds', 'ys', '1E-24', None, 'Time'),
+    ('charge', 'yottacoulombs', 'YC', '1E+24', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'zettacoulombs', 'ZC', '1E+21', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'exacoulombs', 'EC', '1E+18', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'petacoulombs', 'PC', '1E+15', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'teracoulombs', 'TC', '1E+12', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'gigacoulombs', 'GC', '1E+9', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'megacoulombs', 'MC', '1E+6', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'kilocoulombs', 'kC', '1E+3', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'hectocoulombs', 'hC', '1E+2', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'dekacoulombs', 'daC', '1E+1', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'decicoulombs', 'dC', '0.1', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'centicoulombs', 'cC', '0.01', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'millicoulombs', 'mC', '0.001', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'microcoulombs', 'μC', '0.000001', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'nanocoulombs', 'nC', '1E-9', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'picocoulombs', 'pC', '1E-12', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'femtocoulombs', 'fC', '1E-15', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'attocoulombs', 'aC', '1E-18', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'zeptocoulombs', 'zC', '1E-21', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('charge', 'yoctocoulombs', 'yC', '1E-24', (('amperes', '1'), ('seconds', '1')), 'Charge'),
+    ('mass', 'yottagrams', 'Yg', '1E+21', None, 'Mass'),
+    ('mass', 'zettagrams', 'Zg', '1E+18', None, 'Mass'),
+    ('mass', 'exagrams', 'Eg', '1E+15', None, 'Mass'),
+    ('mass', 'petagrams', 'Pg', '1E+12', None, 'Mass'),
+    ('mass', 'teragrams', 'Tg', '1E+9', None, 'Mass'),
+    ('mass', 'gigagrams', 'Gg', '1E+6', None, 'Mass'),
+    ('mass', 'megagrams', 'Mg', '1E+3', None, 'Mass'),
+    ('mass', 'hectograms', 'hg', '0.1', None, 'Mass'),
+    ('mass', 'dekagrams', 'dag', '0.01', None, 'Mass'),
+    ('mass', 'decigrams', 'dg', '0.0001', None, 'Mass'),
+    ('mass', 'centigrams', 'cg', '0.00001', None, 'Mass'),
+    ('mass', 'milligrams', 'mg', '0.000001', None, 'Mass'),
+    ('mass', 'micrograms', 'μg', '1E-9', None, 'Mass'),
+    ('mass', 'nanograms', 'ng', '1E-12', None, 'Mass'),
+    ('mass', 'picograms', 'pg', '1E-15', None, 'Mass'),
+    ('mass', 'femtograms', 'fg', '1E-18', None, 'Mass'),
+    ('mass', 'attograms', 'ag', '1E-21', None, 'Mass'),
+    ('mass', 'zeptograms', 'zg', '1E-24', None, 'Mass'),
+    ('mass', 'yoctograms', 'yg', '1E-27', None, 'Mass'),
+    ('force', 'yottanewtons', 'YN', '1E+24', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'zettanewtons', 'ZN', '1E+21', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'exanewtons', 'EN', '1E+18', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'petanewtons', 'PN', '1E+15', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'teranewtons', 'TN', '1E+12', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'giganewtons', 'GN', '1E+9', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'meganewtons', 'MN', '1E+6', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'kilonewtons', 'kN', '1E+3', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'hectonewtons', 'hN', '1E+2', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'dekanewtons', 'daN', '1E+1', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'decinewtons', 'dN', '0.1', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'centinewtons', 'cN', '0.01', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'millinewtons', 'mN', '0.001', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'micronewtons', 'μN', '0.000001', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'nanonewtons', 'nN', '1E-9', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'piconewtons', 'pN', '1E-12', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'femtonewtons', 'fN', '1E-15', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'attonewtons', 'aN', '1E-18', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'zeptonewtons', 'zN', '1E-21', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('force', 'yoctonewtons', 'yN', '1E-24', (('kilograms', '1'), ('meters', '1'), ('seconds', '-2')), 'Length_Mass_per_Time_squared'),
+    ('energy', 'yottajoules', 'YJ', '1E+24', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'zettajoules', 'ZJ', '1E+21', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'exajoules', 'EJ', '1E+18', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'petajoules', 'PJ', '1E+15', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'terajoules', 'TJ', '1E+12', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'gigajoules', 'GJ', '1E+9', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'megajoules', 'MJ', '1E+6', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'kilojoules', 'kJ', '1E+3', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'hectojoules', 'hJ', '1E+2', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'dekajoules', 'daJ', '1E+1', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'decijoules', 'dJ', '0.1', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'centijoules', 'cJ', '0.01', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'millijoules', 'mJ', '0.001', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'microjoules', 'μJ', '0.000001', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'nanojoules', 'nJ', '1E-9', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'picojoules', 'pJ', '1E-12', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'femtojoules', 'fJ', '1E-15', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'attojoules', 'aJ', '1E-18', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'zeptojoules', 'zJ', '1E-21', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('energy', 'yoctojoules', 'yJ', '1E-24', (('meters', '2'), ('kilograms', '1'), ('seconds', '-2')), 'Energy'),
+    ('voltage', 'yottavolts', 'YV', '1E+24', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'zettavolts', 'ZV', '1E+21', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'exavolts', 'EV', '1E+18', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'petavolts', 'PV', '1E+15', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'teravolts', 'TV', '1E+12', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'gigavolts', 'GV', '1E+9', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'megavolts', 'MV', '1E+6', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'kilovolts', 'kV', '1E+3', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'hectovolts', 'hV', '1E+2', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'dekavolts', 'daV', '1E+1', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'decivolts', 'dV', '0.1', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'centivolts', 'cV', '0.01', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'millivolts', 'mV', '0.001', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'microvolts', 'μV', '0.000001', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'nanovolts', 'nV', '1E-9', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'picovolts', 'pV', '1E-12', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'femtovolts', 'fV', '1E-15', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'attovolts', 'aV', '1E-18', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'zeptovolts', 'zV', '1E-21', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('voltage', 'yoctovolts', 'yV', '1E-24', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-3')), 'Potential'),
+    ('capacitance', 'yottafarads', 'YF', '1E+24', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'zettafarads', 'ZF', '1E+21', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'exafarads', 'EF', '1E+18', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'petafarads', 'PF', '1E+15', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'terafarads', 'TF', '1E+12', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'gigafarads', 'GF', '1E+9', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'megafarads', 'MF', '1E+6', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'kilofarads', 'kF', '1E+3', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'hectofarads', 'hF', '1E+2', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'dekafarads', 'daF', '1E+1', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'decifarads', 'dF', '0.1', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'centifarads', 'cF', '0.01', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'millifarads', 'mF', '0.001', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'microfarads', 'μF', '0.000001', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'nanofarads', 'nF', '1E-9', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'picofarads', 'pF', '1E-12', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'femtofarads', 'fF', '1E-15', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'attofarads', 'aF', '1E-18', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'zeptofarads', 'zF', '1E-21', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('capacitance', 'yoctofarads', 'yF', '1E-24', (('seconds', '4'), ('amperes', '2'), ('kilograms', '-1'), ('meters', '-2')), 'Capacitance'),
+    ('mole', 'yottamoles', 'Ymol', '1E+24', None, 'Quantity'),
+    ('mole', 'zettamoles', 'Zmol', '1E+21', None, 'Quantity'),
+    ('mole', 'examoles', 'Emol', '1E+18', None, 'Quantity'),
+    ('mole', 'petamoles', 'Pmol', '1E+15', None, 'Quantity'),
+    ('mole', 'teramoles', 'Tmol', '1E+12', None, 'Quantity'),
+    ('mole', 'gigamoles', 'Gmol', '1E+9', None, 'Quantity'),
+    ('mole', 'megamoles', 'Mmol', '1E+6', None, 'Quantity'),
+    ('mole', 'kilomoles', 'kmol', '1E+3', None, 'Quantity'),
+    ('mole', 'hectomoles', 'hmol', '1E+2', None, 'Quantity'),
+    ('mole', 'dekamoles', 'damol', '1E+1', None, 'Quantity'),
+    ('mole', 'decimoles', 'dmol', '0.1', None, 'Quantity'),
+    ('mole', 'centimoles', 'cmol', '0.01', None, 'Quantity'),
+    ('mole', 'millimoles', 'mmol', '0.001', None, 'Quantity'),
+    ('mole', 'micromoles', 'μmol', '0.000001', None, 'Quantity'),
+    ('mole', 'nanomoles', 'nmol', '1E-9', None, 'Quantity'),
+    ('mole', 'picomoles', 'pmol', '1E-12', None, 'Quantity'),
+    ('mole', 'femtomoles', 'fmol', '1E-15', None, 'Quantity'),
+    ('mole', 'attomoles', 'amol', '1E-18', None, 'Quantity'),
+    ('mole', 'zeptomoles', 'zmol', '1E-21', None, 'Quantity'),
+    ('mole', 'yoctomoles', 'ymol', '1E-24', None, 'Quantity'),
+    ('power', 'yottawatts', 'YW', '1E+24', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'zettawatts', 'ZW', '1E+21', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'exawatts', 'EW', '1E+18', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'petawatts', 'PW', '1E+15', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'terawatts', 'TW', '1E+12', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'gigawatts', 'GW', '1E+9', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'megawatts', 'MW', '1E+6', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'hectowatts', 'hW', '1E+2', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'dekawatts', 'daW', '1E+1', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'deciwatts', 'dW', '0.1', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'centiwatts', 'cW', '0.01', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'milliwatts', 'mW', '0.001', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'microwatts', 'μW', '0.000001', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'nanowatts', 'nW', '1E-9', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'picowatts', 'pW', '1E-12', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'femtowatts', 'fW', '1E-15', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'attowatts', 'aW', '1E-18', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'zeptowatts', 'zW', '1E-21', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('power', 'yoctowatts', 'yW', '1E-24', (('meters', '2'), ('kilograms', '1'), ('seconds', '-3')), 'Power'),
+    ('pressure', 'yottapascals', 'YPa', '1E+24', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'zettapascals', 'ZPa', '1E+21', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'exapascals', 'EPa', '1E+18', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'petapascals', 'PPa', '1E+15', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'terapascals', 'TPa', '1E+12', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'gigapascals', 'GPa', '1E+9', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'megapascals', 'MPa', '1E+6', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'kilopascals', 'kPa', '1E+3', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'hectopascals', 'hPa', '1E+2', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'dekapascals', 'daPa', '1E+1', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'decipascals', 'dPa', '0.1', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'centipascals', 'cPa', '0.01', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'millipascals', 'mPa', '0.001', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'micropascals', 'μPa', '0.000001', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'nanopascals', 'nPa', '1E-9', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'picopascals', 'pPa', '1E-12', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'femtopascals', 'fPa', '1E-15', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'attopascals', 'aPa', '1E-18', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'zeptopascals', 'zPa', '1E-21', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('pressure', 'yoctopascals', 'yPa', '1E-24', (('kilograms', '1'), ('meters', '-1'), ('seconds', '-2')), 'Pressure'),
+    ('temperature', 'yottakelvin', 'YK', '1E+24', None, 'Temperature'),
+    ('temperature', 'zettakelvin', 'ZK', '1E+21', None, 'Temperature'),
+    ('temperature', 'exakelvin', 'EK', '1E+18', None, 'Temperature'),
+    ('temperature', 'petakelvin', 'PK', '1E+15', None, 'Temperature'),
+    ('temperature', 'terakelvin', 'TK', '1E+12', None, 'Temperature'),
+    ('temperature', 'gigakelvin', 'GK', '1E+9', None, 'Temperature'),
+    ('temperature', 'megakelvin', 'MK', '1E+6', None, 'Temperature'),
+    ('temperature', 'kilokelvin', 'kK', '1E+3', None, 'Temperature'),
+    ('temperature', 'hectokelvin', 'hK', '1E+2', None, 'Temperature'),
+    ('temperature', 'dekakelvin', 'daK', '1E+1', None, 'Temperature'),
+    ('temperature', 'decikelvin', 'dK', '0.1', None, 'Temperature'),
+    ('temperature', 'centikelvin', 'cK', '0.01', None, 'Temperature'),
+    ('temperature', 'millikelvin', 'mK', '0.001', None, 'Temperature'),
+    ('temperature', 'microkelvin', 'μK', '0.000001', None, 'Temperature'),
+    ('temperature', 'nanokelvin', 'nK', '1E-9', None, 'Temperature'),
+    ('temperature', 'picokelvin', 'pK', '1E-12', None, 'Temperature'),
+    ('temperature', 'femtokelvin', 'fK', '1E-15', None, 'Temperature'),
+    ('temperature', 'attokelvin', 'aK', '1E-18', None, 'Temperature'),
+    ('temperature', 'zeptokelvin', 'zK', '1E-21', None, 'Temperature'),
+    ('temperature', 'yoctokelvin', 'yK', '1E-24', None, 'Temperature'),
+    ('data', 'yottabytes', 'YB', '8E+24', None, 'Data'),
+    ('data', 'zettabytes', 'ZB', '8E+21', None, 'Data'),
+    ('data', 'exabytes', 'EB', '8E+18', None, 'Data'),
+    ('data', 'petabytes', 'PB', '8E+15', None, 'Data'),
+    ('data', 'terabytes', 'TB', '8E+12', None, 'Data'),
+    ('data', 'gigabytes', 'GB', '8E+9', None, 'Data'),
+    ('data', 'megabytes', 'MB', '8E+6', None, 'Data'),
+    ('data', 'kilobytes', 'kB', '8E+3', None, 'Data'),
+    ('data', 'hectobytes', 'hB', '8E+2', None, 'Data'),
+    ('data', 'dekabytes', 'daB', '8E+1', None, 'Data'),
+    ('data', 'decibytes', 'dB', '0.8', None, 'Data'),
+    ('data', 'centibytes', 'cB', '0.08', None, 'Data'),
+    ('data', 'millibytes', 'mB', '0.008', None, 'Data'),
+    ('data', 'microbytes', 'μB', '0.000008', None, 'Data'),
+    ('data', 'nanobytes', 'nB', '8E-9', None, 'Data'),
+    ('data', 'picobytes', 'pB', '8E-12', None, 'Data'),
+    ('data', 'femtobytes', 'fB', '8E-15', None, 'Data'),
+    ('data', 'attobytes', 'aB', '8E-18', None, 'Data'),
+    ('data', 'zeptobytes', 'zB', '8E-21', None, 'Data'),
+    ('data', 'yoctobytes', 'yB', '8E-24', None, 'Data'),
+    ('derived', 'yottaparsecs', 'Ypc', '3.085677581491367399198952281E+40', None, 'Length'),
+    ('derived', 'zettaparsecs', 'Zpc', '3.085677581491367399198952281E+37', None, 'Length'),
+    ('derived', 'exaparsecs', 'Epc', '3.085677581491367399198952281E+34', None, 'Length'),
+    ('derived', 'petaparsecs', 'Ppc', '3.085677581491367399198952281E+31', None, 'Length'),
+    ('derived', 'teraparsecs', 'Tpc', '3.085677581491367399198952281E+28', None, 'Length'),
+    ('derived', 'gigaparsecs', 'Gpc', '30856775814913673991989522.81', None, 'Length'),
+    ('derived', 'megaparsecs', 'Mpc', '30856775814913673991989.52281', None, 'Length'),
+    ('derived', 'kiloparsecs', 'kpc', '30856775814913673991.98952281', None, 'Length'),
+    ('derived', 'hectoparsecs', 'hpc', '3085677581491367399.198952281', None, 'Length'),
+    ('derived', 'dekaparsecs', 'dapc', '308567758149136739.9198952281', None, 'Length'),
+    ('derived', 'deciparsecs', 'dpc', '3085677581491367.399198952281', None, 'Length'),
+    ('derived', 'centiparsecs', 'cpc', '308567758149136.7399198952281', None, 'Length'),
+    ('derived', 'milliparsecs', 'mpc', '30856775814913.67399198952281', None, 'Length'),
+    ('derived', 'microparsecs', 'μpc', '30856775814.91367399198952281', None, 'Length'),
+    ('derived', 'nanoparsecs', 'npc', '30856775.81491367399198952281', None, 'Length'),
+    ('derived', 'picoparsecs', 'ppc', '30856.77581491367399198952281', None, 'Length'),
+    ('derived', 'femtoparsecs', 'fpc', '30.85677581491367399198952281', None, 'Length'),
+    ('derived', 'attoparsecs', 'apc', '0.03085677581491367399198952281', None, 'Length'),
+    ('derived', 'zeptoparsecs', 'zpc', '0.00003085677581491367399198952281', None, 'Length'),
+    ('derived', 'yoctoparsecs', 'ypc', '3.085677581491367399198952281E-8', None, 'Length'),
+    ('derived', 'yottalightyears', 'Yly', '9.4607304725808E+39', None, 'Length'),
+    ('derived', 'zettalightyears', 'Zly', '9.4607304725808E+36', None, 'Length'),
+    ('derived', 'exalightyears', 'Ely', '9.4607304725808E+33', None, 'Length'),
+    ('derived', 'petalightyears', 'Ply', '9.4607304725808E+30', None, 'Length'),
+    ('derived', 'teralightyears', 'Tly', '9.4607304725808E+27', None, 'Length'),
+    ('derived', 'gigalightyears', 'Gly', '9.4607304725808E+24', None, 'Length'),
+    ('derived', 'megalightyears', 'Mly', '9.4607304725808E+21', None, 'Length'),
+    ('derived', 'kilolightyears', 'kly', '9.4607304725808E+18', None, 'Length'),
+    ('derived', 'hectolightyears', 'hly', '9.4607304725808E+17', None, 'Length'),
+    ('derived', 'dekalightyears', 'daly', '9.4607304725808E+16', None, 'Length'),
+    ('derived', 'decilightyears', 'dly', '9.4607304725808E+14', None, 'Length'),
+    ('derived', 'centilightyears', 'cly', '94607304725808', None, 'Length'),
+    ('derived', 'millilightyears', 'mly', '9460730472580.8', None, 'Length'),
+    ('derived', 'microlightyears', 'μly', '9460730472.5808', None, 'Length'),
+    ('derived', 'nanolightyears', 'nly', '9460730.4725808', None, 'Length'),
+    ('derived', 'picolightyears', 'ply', '9460.7304725808', None, 'Length'),
+    ('derived', 'femtolightyears', 'fly', '9.4607304725808', None, 'Length'),
+    ('derived', 'attolightyears', 'aly', '0.0094607304725808', None, 'Length'),
+    ('derived', 'zeptolightyears', 'zly', '0.0000094607304725808', None, 'Length'),
+    ('derived', 'yoctolightyears', 'yly', '9.4607304725808E-9', None, 'Length'),
+    ('frequency', 'yottahertz', 'YHz', '1E+24', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'zettahertz', 'ZHz', '1E+21', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'exahertz', 'EHz', '1E+18', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'petahertz', 'PHz', '1E+15', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'terahertz', 'THz', '1E+12', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'gigahertz', 'GHz', '1E+9', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'megahertz', 'MHz', '1E+6', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'kilohertz', 'kHz', '1E+3', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'hectohertz', 'hHz', '1E+2', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'dekahertz', 'daHz', '1E+1', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'decihertz', 'dHz', '0.1', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'centihertz', 'cHz', '0.01', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'millihertz', 'mHz', '0.001', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'microhertz', 'μHz', '0.000001', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'nanohertz', 'nHz', '1E-9', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'picohertz', 'pHz', '1E-12', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'femtohertz', 'fHz', '1E-15', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'attohertz', 'aHz', '1E-18', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'zeptohertz', 'zHz', '1E-21', (('seconds', '-1'),), 'Frequency'),
+    ('frequency', 'yoctohertz', 'yHz', '1E-24', (('seconds', '-1'),), 'Frequency'),
+    ('inductance', 'yottahenry', 'YH', '1E+24', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'zettahenry', 'ZH', '1E+21', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'exahenry', 'EH', '1E+18', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'petahenry', 'PH', '1E+15', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'terahenry', 'TH', '1E+12', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'gigahenry', 'GH', '1E+9', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'megahenry', 'MH', '1E+6', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'kilohenry', 'kH', '1E+3', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'hectohenry', 'hH', '1E+2', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'dekahenry', 'daH', '1E+1', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'decihenry', 'dH', '0.1', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'centihenry', 'cH', '0.01', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'millihenry', 'mH', '0.001', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'microhenry', 'μH', '0.000001', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'nanohenry', 'nH', '1E-9', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'picohenry', 'pH', '1E-12', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'femtohenry', 'fH', '1E-15', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'attohenry', 'aH', '1E-18', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'zeptohenry', 'zH', '1E-21', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('inductance', 'yoctohenry', 'yH', '1E-24', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-2')), 'Inductance'),
+    ('luminosity', 'yottacandelas', 'Ycd', '1E+24', None, 'Luminous Intensity'),
+    ('luminosity', 'zettacandelas', 'Zcd', '1E+21', None, 'Luminous Intensity'),
+    ('luminosity', 'exacandelas', 'Ecd', '1E+18', None, 'Luminous Intensity'),
+    ('luminosity', 'petacandelas', 'Pcd', '1E+15', None, 'Luminous Intensity'),
+    ('luminosity', 'teracandelas', 'Tcd', '1E+12', None, 'Luminous Intensity'),
+    ('luminosity', 'gigacandelas', 'Gcd', '1E+9', None, 'Luminous Intensity'),
+    ('luminosity', 'megacandelas', 'Mcd', '1E+6', None, 'Luminous Intensity'),
+    ('luminosity', 'kilocandelas', 'kcd', '1E+3', None, 'Luminous Intensity'),
+    ('luminosity', 'hectocandelas', 'hcd', '1E+2', None, 'Luminous Intensity'),
+    ('luminosity', 'dekacandelas', 'dacd', '1E+1', None, 'Luminous Intensity'),
+    ('luminosity', 'decicandelas', 'dcd', '0.1', None, 'Luminous Intensity'),
+    ('luminosity', 'centicandelas', 'ccd', '0.01', None, 'Luminous Intensity'),
+    ('luminosity', 'millicandelas', 'mcd', '0.001', None, 'Luminous Intensity'),
+    ('luminosity', 'microcandelas', 'μcd', '0.000001', None, 'Luminous Intensity'),
+    ('luminosity', 'nanocandelas', 'ncd', '1E-9', None, 'Luminous Intensity'),
+    ('luminosity', 'picocandelas', 'pcd', '1E-12', None, 'Luminous Intensity'),
+    ('luminosity', 'femtocandelas', 'fcd', '1E-15', None, 'Luminous Intensity'),
+    ('luminosity', 'attocandelas', 'acd', '1E-18', None, 'Luminous Intensity'),
+    ('luminosity', 'zeptocandelas', 'zcd', '1E-21', None, 'Luminous Intensity'),
+    ('luminosity', 'yoctocandelas', 'ycd', '1E-24', None, 'Luminous Intensity'),
+    ('magneticflux', 'yottaweber', 'YWb', '1E+24', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'zettaweber', 'ZWb', '1E+21', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'exaweber', 'EWb', '1E+18', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'petaweber', 'PWb', '1E+15', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'teraweber', 'TWb', '1E+12', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'gigaweber', 'GWb', '1E+9', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'megaweber', 'MWb', '1E+6', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'kiloweber', 'kWb', '1E+3', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'hectoweber', 'hWb', '1E+2', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'dekaweber', 'daWb', '1E+1', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'deciweber', 'dWb', '0.1', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'centiweber', 'cWb', '0.01', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'milliweber', 'mWb', '0.001', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'microweber', 'μWb', '0.000001', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'nanoweber', 'nWb', '1E-9', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'picoweber', 'pWb', '1E-12', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'femtoweber', 'fWb', '1E-15', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'attoweber', 'aWb', '1E-18', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'zeptoweber', 'zWb', '1E-21', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticflux', 'yoctoweber', 'yWb', '1E-24', (('meters', '2'), ('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time'),
+    ('magneticfluxdensity', 'yottatesla', 'YT', '1E+24', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'zettatesla', 'ZT', '1E+21', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'exatesla', 'ET', '1E+18', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'petatesla', 'PT', '1E+15', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'teratesla', 'TT', '1E+12', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'gigatesla', 'GT', '1E+9', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'megatesla', 'MT', '1E+6', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'kilotesla', 'kT', '1E+3', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'hectotesla', 'hT', '1E+2', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'dekatesla', 'daT', '1E+1', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'decitesla', 'dT', '0.1', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'centitesla', 'cT', '0.01', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'millitesla', 'mT', '0.001', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'microtesla', 'μT', '0.000001', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'nanotesla', 'nT', '1E-9', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'picotesla', 'pT', '1E-12', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'femtotesla', 'fT', '1E-15', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'attotesla', 'aT', '1E-18', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'zeptotesla', 'zT', '1E-21', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('magneticfluxdensity', 'yoctotesla', 'yT', '1E-24', (('kilograms', '1'), ('amperes', '-1'), ('seconds', '-2')), 'Potential_Time_per_Length_squared'),
+    ('resistance', 'yottaohms', 'YΩ', '1E+24', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'zettaohms', 'ZΩ', '1E+21', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'exaohms', 'EΩ', '1E+18', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'petaohms', 'PΩ', '1E+15', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'teraohms', 'TΩ', '1E+12', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'gigaohms', 'GΩ', '1E+9', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'megaohms', 'MΩ', '1E+6', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'kiloohms', 'kΩ', '1E+3', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'hectoohms', 'hΩ', '1E+2', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'dekaohms', 'daΩ', '1E+1', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'deciohms', 'dΩ', '0.1', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'centiohms', 'cΩ', '0.01', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'milliohms', 'mΩ', '0.001', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'microohms', 'μΩ', '0.000001', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'nanoohms', 'nΩ', '1E-9', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'picoohms', 'pΩ', '1E-12', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'femtoohms', 'fΩ', '1E-15', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'attoohms', 'aΩ', '1E-18', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'zeptoohms', 'zΩ', '1E-21', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('resistance', 'yoctoohms', 'yΩ', '1E-24', (('meters', '2'), ('kilograms', '1'), ('amperes', '-2'), ('seconds', '-3')), 'Resistance'),
+    ('volume', 'yottaliters', 'YL', '1E+21', (('meters', '3'),), 'Volume'),
+    ('volume', 'zettaliters', 'ZL', '1E+18', (('meters', '3'),), 'Volume'),
+    ('volume', 'exaliters', 'EL', '1E+15', (('meters', '3'),), 'Volume'),
+    ('volume', 'petaliters', 'PL', '1E+12', (('meters', '3'),), 'Volume'),
+    ('volume', 'teraliters', 'TL', '1E+9', (('meters', '3'),), 'Volume'),
+    ('volume', 'gigaliters', 'GL', '1E+6', (('meters', '3'),), 'Volume'),
+    ('volume', 'megaliters', 'ML', '1E+3', (('meters', '3'),), 'Volume'),
+    ('volume', 'kiloliters', 'kL', '1', (('meters', '3'),), 'Volume'),
+    ('volume', 'hectoliters', 'hL', '0.1', (('meters', '3'),), 'Volume'),
+    ('volume', 'dekaliters', 'daL', '0.01', (('meters', '3'),), 'Volume'),
+    ('volume', 'deciliters', 'dL', '0.0001', (('meters', '3'),), 'Volume'),
+    ('volume', 'centiliters', 'cL', '0.00001', (('meters', '3'),), 'Volume'),
+    ('volume', 'microliters', 'μL', '1E-9', (('meters', '3'),), 'Volume'),
+    ('volume', 'nanoliters', 'nL', '1E-12', (('meters', '3'),), 'Volume'),
+    ('volume', 'picoliters', 'pL', '1E-15', (('meters', '3'),), 'Volume'),
+    ('volume', 'femtoliters', 'fL', '1E-18', (('meters', '3'),), 'Volume'),
+    ('volume', 'attoliters', 'aL', '1E-21', (('meters', '3'),), 'Volume'),
+    ('volume', 'zeptoliters', 'zL', '1E-24', (('meters', '3'),), 'Volume'),
+    ('volume', 'yoctoliters', 'yL', '1E-27', (('meters', '3'),), 'Volume'),
+)
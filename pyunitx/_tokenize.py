@@ -0,0 +1,143 @@
+"""Single-pass tokenizers for the two ways units are spelled out in text.
+
+Conversion method names spell units out in full, like
+``kilometers_per_hour_squared``. The ``uconvert`` tool takes symbols, like
+``J/kg.K^-1``. Both are read here by walking a prefix trie of the known
+spellings, so reading a spec takes one pass over it no matter how many units
+exist.
+"""
+from typing import Tuple, List, Optional
+
+_EXPONENT_SUFFIXES = (
+    ("_squared", 2),
+    ("_cubed", 3),
+    ("_to_the_fourth", 4),
+    ("_to_the_fifth", 5),
+    # that's the highest I've ever seen
+)
+
+
+class Trie:
+    """A prefix tree mapping spellings to the name of the unit they spell."""
+    __slots__ = ("root",)
+
+    def __init__(self):
+        self.root = {}
+
+    def insert(self, word: str, value: str):
+        node = self.root
+        for char in word:
+            node = node.setdefault(char, {})
+        # No character is None, so it can mark the end of a word
+        node[None] = value
+
+    def get(self, word: str) -> Optional[str]:
+        node = self.root
+        for char in word:
+            node = node.get(char)
+            if node is None:
+                return None
+        return node.get(None)
+
+    def prefixes(self, text: str, start: int) -> List[Tuple[int, str]]:
+        """Find every word that text continues with from the given position.
+
+        :return: Pairs of (end position, value), shortest first.
+        """
+        found = []
+        node = self.root
+        for i in range(start, len(text)):
+            node = node.get(text[i])
+            if node is None:
+                break
+            if None in node:
+                found.append((i + 1, node[None]))
+        return found
+
+
+def is_compound_name(name: str) -> bool:
+    """Check if a name is made up of the names of other units.
+
+    Names like ``meters_per_second`` aren't indexed as words of their own, as
+    a longer spec like ``meters_per_second_squared`` would then be ambiguous.
+    """
+    return (name.startswith("per_")
+            or "_per_" in name
+            or "_squared" in name
+            or "_cubed" in name
+            or "_to_the_" in name)
+
+
+def tokenize_names(spec: str, names: Trie) -> Tuple[Tuple[str, int], ...]:
+    """Read a spec like ``meters_per_second_squared``.
+
+    :param spec: Unit names joined by underscores, each optionally prefixed
+        with ``per_`` and suffixed with an exponent like ``_squared``.
+    :param names: Spellings of units, both plural and singular.
+    :raises KeyError: If part of the spec isn't a known unit.
+    :return: Pairs of (unit name, exponent).
+    """
+    pairs = []
+    pos = 0
+    length = len(spec)
+    while pos < length:
+        power = 1
+        if spec.startswith("per_", pos):
+            power = -1
+            pos += 4
+        for end, name in reversed(names.prefixes(spec, pos)):
+            exponent, after = _read_exponent_suffix(spec, end)
+            if after == length or spec[after] == "_":
+                pairs.append((name, power * exponent))
+                pos = after + 1
+                break
+        else:
+            word = spec[pos:].split("_", 1)[0]
+            raise KeyError(f"The requested unit {word} does not exist")
+    return tuple(pairs)
+
+
+def _read_exponent_suffix(spec: str, pos: int) -> Tuple[int, int]:
+    for suffix, exponent in _EXPONENT_SUFFIXES:
+        if spec.startswith(suffix, pos):
+            return exponent, pos + len(suffix)
+    return 1, pos
+
+
+def tokenize_abbreviations(spec: str, abbreviations: Trie) -> Tuple[Tuple[str, int], ...]:
+    """Read a spec like ``J/kg.K^-1``.
+
+    :param spec: Unit symbols joined by ``.`` to multiply or ``/`` to divide,
+        each optionally followed by an integer exponent like ``^-2``.
+    :param abbreviations: Symbols of units.
+    :raises KeyError: If part of the spec isn't a known unit symbol.
+    :return: Pairs of (unit name, exponent).
+    """
+    pairs = []
+    pos = 0
+    length = len(spec)
+    while pos < length:
+        power = 1
+        if spec[pos] in "./":
+            if spec[pos] == "/":
+                power = -1
+            pos += 1
+        for end, name in reversed(abbreviations.prefixes(spec, pos)):
+            if end == length or spec[end] in "^./":
+                pos = end
+                break
+        else:
+            word = spec[pos:]
+            for i, char in enumerate(word):
+                if char in "^./":
+                    word = word[:i]
+                    break
+            raise KeyError(f"{word} is not a recognized unit")
+        if pos < length and spec[pos] == "^":
+            start = pos + 1
+            pos = start + 1 if spec[start:start + 1] == "-" else start
+            while pos < length and spec[pos].isdigit():
+                pos += 1
+            power *= int(spec[start:pos])
+        pairs.append((name, power))
+    return tuple(pairs)
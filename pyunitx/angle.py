@@ -5,7 +5,8 @@ from collections.abc import Sequence
 from decimal import Decimal
 from numbers import Number
 
-from pyunitx._api import make_dimension, make_unit, Compound
+from pyunitx._api import (make_dimension, make_unit, Compound, _set_composition, _in_backend,
+                          _scale_in, _precision, _rescale, _EXACT)
 
 __all__ = [
     "Angle",
@@ -56,15 +57,32 @@ radians = make_unit(
     abbrev="rad",
     doc="""Radians are the most natural unit of angle."""
 )
-radians.composition = Compound(())
+_set_composition(radians, Compound(()))
 
 
-def __to_rad(deg):
+def __to_rad(deg, precision: typing.Optional[int] = None):
     """Convert this value to radians.
 
+    :param precision: The number of significant digits to calculate with,
+        instead of the current precision.
     :return: The radian value, which is a dimensionless quantity.
     """
-    return deg.value * deg.scale * Decimal(math.pi) / 180
+    if precision is not None:
+        with _precision(precision):
+            return __to_rad(deg)
+    return _rescale(_in_backend(deg.value), *_radian_factor(type(deg)))
+
+
+def _radian_factor(unit) -> typing.Tuple[Number, Number]:
+    """Find what converts values of an angle unit to radians.
+
+    :return: The scale and the divisor that a value is converted with, like
+        for :func:`_rescale <pyunitx._api._rescale>`, in the current backend.
+    """
+    scale, pi = _scale_in(unit), _in_backend(Decimal(math.pi))
+    if type(scale) is Decimal:
+        return _EXACT.multiply(scale, pi), Decimal(180)
+    return scale * pi, _in_backend(180)
 
 
 def __from_rad(rad):
@@ -0,0 +1,314 @@
+"""Many measurements of one unit, with the values held in a NumPy array.
+
+A column of readings as individual measurements is an object and a number
+each, and every operation works out its resulting unit again. A
+:class:`QuantityArray` instead pairs one unit class with an array of plain
+numbers. Operations work out the resulting unit once for the whole array, the
+same way they would for a single measurement, and then run over the values as
+ordinary NumPy operations::
+
+    >>> from pyunitx.arrays import QuantityArray
+    >>> from pyunitx.length import meters
+    >>> from pyunitx.time import seconds
+    >>> distances = QuantityArray(meters, [100, 200, 400])
+    >>> distances / seconds(20)
+    QuantityArray(meters_per_second, [ 5. 10. 20.])
+    >>> (distances / seconds(20)).to_kilometers_per_hour()
+    QuantityArray(kilometers_per_hour, [18. 36. 72.])
+
+This needs NumPy, which can be installed along with this package as
+``pip install pyunitx[numpy]``.
+"""
+from decimal import Decimal
+from typing import Type, Iterable, Optional
+
+import numpy as np
+from numpy.lib.mixins import NDArrayOperatorsMixin
+
+from pyunitx._api import (UnitBase, BACKEND_FLOAT, _RESULT_UNITS, _NUMBERS, _conversion,
+                          _require_unit, using_backend)
+
+
+class QuantityArray(NDArrayOperatorsMixin):
+    """An array of measurements that all have the same unit.
+
+    The arithmetic and comparison operators work elementwise like they do
+    for NumPy arrays, with the unit of the result worked out once for the
+    whole array (see :meth:`__array_ufunc__`). Multiplying or dividing units
+    that cancel completely gives a plain NumPy array. Adding or comparing
+    needs both sides to be the same unit, as with single measurements.
+
+    Indexing with an integer gives a single measurement, and anything else
+    gives another array. Single measurements taken from a float array, by
+    indexing or by functions like ``np.mean``, keep their values as floats. Conversions are called the same way as for single
+    measurements, like ``array.to_feet()``.
+
+    :param unit: The unit class of every measurement, like
+        :class:`meters <pyunitx.length.meters>`.
+    :param values: The values of the measurements, anything
+        :external:py:func:`numpy.asarray` accepts.
+    :param dtype: The data type of the values. Use ``object`` to keep exact
+        :external:py:class:`decimal.Decimal` values at the cost of speed.
+    """
+    __slots__ = ["unit", "values"]
+
+    def __init__(self, unit: Type[UnitBase], values, dtype=float):
+        self.unit = unit
+        self.values = np.asarray(values, dtype=dtype)
+
+    @classmethod
+    def from_measurements(cls, measurements: Iterable[UnitBase],
+                          dtype=float) -> 'QuantityArray':
+        """Gather measurements of the same unit into an array.
+
+        :param measurements: The measurements, all of them in the same unit.
+        :param dtype: The data type of the values.
+        :raises ValueError: If there are no measurements to tell the unit from.
+        :raises ImplicitConversionError: If the measurements have different
+            units of the same dimension.
+        :raises OperationError: If the measurements are of different dimensions.
+        :return: An array of the measurements' values.
+        """
+        measurements = list(measurements)
+        if not measurements:
+            raise ValueError("The unit of an empty array can't be known")
+        unit = type(measurements[0])
+        for m in measurements:
+            _require_unit(unit, type(m), "combine")
+        return cls(unit, [m.value for m in measurements], dtype)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, key):
+        return _wrap(self.unit, self.values[key])
+
+    def __str__(self):
+        return f"{self.values} {self.unit.abbreviation}"
+
+    def __repr__(self):
+        return f"QuantityArray({self.unit.__name__}, {self.values})"
+
+    def _scalar(self, value):
+        # Plain values have to be the type of the array elements, as NumPy
+        # doesn't know how to combine floats with Decimals
+        return self.values.dtype.type(value)
+
+    def _operand(self, other):
+        """Split another operand into its unit and its values.
+
+        :return: The unit, or None for plain numbers, and the values.
+        """
+        if isinstance(other, QuantityArray):
+            return other.unit, other.values
+        if isinstance(other, UnitBase):
+            return type(other), self._scalar(other.value)
+        if isinstance(other, _NUMBERS):
+            return None, self._scalar(other)
+        return None, other
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """Apply a NumPy ufunc to the values, and work out the unit of the result.
+
+        The arithmetic operators go through here as well. Ufuncs that need all
+        their operands to be the same unit, like ``np.add``, ``np.maximum``,
+        ``np.hypot``, and the comparisons, raise
+        :class:`ImplicitConversionError <pyunitx._exceptions.ImplicitConversionError>`
+        if given different units of the same dimension, and
+        :class:`OperationError <pyunitx._exceptions.OperationError>` if given
+        different dimensions or plain numbers. ``np.multiply``, ``np.divide``,
+        ``np.power``, ``np.sqrt``, ``np.square``, and ``np.reciprocal`` combine
+        the units like the operators on single measurements do. Comparisons
+        and tests like ``np.isnan`` give plain arrays.
+
+        The ``outer`` method works out the unit the same way. ``reduce``,
+        ``accumulate``, and ``reduceat`` are only supported for the ufuncs that
+        keep the unit, like ``np.add.reduce``.
+
+        Other ufuncs, like ``np.exp``, aren't meaningful for a quantity with
+        units so aren't supported. Neither are the ``at`` method and the
+        ``out`` argument, which change arrays in place.
+        """
+        if "out" in kwargs or method == "at":
+            return NotImplemented
+        units, values = zip(*(self._operand(x) for x in inputs))
+        if method in ("reduce", "accumulate", "reduceat"):
+            # Combining the elements of one array only makes sense when the unit
+            # stays put. The indices reduceat takes aren't measurements.
+            if ufunc not in _SAME_UNIT:
+                return NotImplemented
+            unit = units[0]
+        elif method not in ("__call__", "outer"):
+            return NotImplemented
+        elif ufunc in _SAME_UNIT or ufunc in _COMPARISONS:
+            unit = next(u for u in units if u is not None)
+            for other in units:
+                _require_unit(unit, other, ufunc.__name__)
+            if ufunc in _COMPARISONS:
+                unit = None
+        elif ufunc in _UNARY_SAME_UNIT:
+            unit = units[0]
+        elif ufunc in _UNITLESS:
+            unit = None
+        elif ufunc in _POWERS:
+            unit = _result_unit(units[0], _POWERS[ufunc], "**")
+        elif ufunc is np.power:
+            exponent = inputs[1]
+            if units[1] is not None or np.ndim(exponent) != 0:
+                return NotImplemented
+            if isinstance(exponent, str):
+                exponent = Decimal(exponent)
+            elif isinstance(exponent, np.generic):
+                exponent = exponent.item()
+            values = (values[0], self._scalar(exponent))
+            unit = _result_unit(units[0], exponent, "**")
+        elif ufunc is np.multiply:
+            left, right = units
+            if left is None or right is None:
+                unit = left or right
+            else:
+                unit = _result_unit(left, right, "*")
+        elif ufunc is np.divide:
+            left, right = units
+            if right is None:
+                unit = left
+            elif left is None:
+                unit = _result_unit(right, -1, "**")
+            else:
+                unit = _result_unit(left, right, "/")
+        else:
+            return NotImplemented
+        return _wrap(unit, getattr(ufunc, method)(*values, **kwargs))
+
+    def __array_function__(self, func, types, args, kwargs):
+        """Apply a NumPy function like ``np.sum`` or ``np.concatenate`` to the
+        values, and give the result the right unit.
+
+        Supported are:
+
+        * ``np.sum``, ``np.mean``, ``np.median``, ``np.std``, ``np.min``,
+          ``np.max``, ``np.ptp``, ``np.cumsum``, ``np.diff``, ``np.sort``,
+          ``np.round``, ``np.ravel``, ``np.reshape``, and ``np.transpose``,
+          which keep the unit
+        * ``np.var``, which squares the unit
+        * ``np.concatenate`` and ``np.stack``, which need all the arrays to
+          have the same unit
+        * ``np.argmin``, ``np.argmax``, and ``np.argsort``, which give indices
+        * ``np.isclose``, ``np.allclose``, and ``np.array_equal``, which need
+          the same unit, and take any tolerances in that unit. Either side
+          can be a single measurement.
+
+        Other functions raise :external:py:class:`TypeError`, as there's no
+        telling what they would do to the unit.
+        """
+        handler = _FUNCTIONS.get(func)
+        if handler is None:
+            return NotImplemented
+        if not all(issubclass(t, (QuantityArray, np.ndarray)) for t in types):
+            return NotImplemented
+        return handler(func, *args, **kwargs)
+
+    def __getattr__(self, key: str):
+        """Convert the whole array with ``array.to_*()``.
+
+        The conversion is the same one a single measurement of the unit would
+        use. It's applied once to find the factor, which then multiplies all
+        the values.
+
+        :param key: The method name.
+        :raise AttributeError: If the requested method doesn't look like a
+            conversion function, or if there isn't a conversion function by that
+            name.
+        """
+        if key.startswith("to_") and not hasattr(UnitBase, key):
+            def convert(precision: Optional[int] = None) -> 'QuantityArray':
+                unit, scale, divisor = _conversion(self.unit, key, precision)
+                factor = self._scalar(scale) / self._scalar(divisor)
+                return _wrap(unit, self.values * factor)
+
+            return convert
+        raise AttributeError(key)
+
+
+_SAME_UNIT = {np.add, np.subtract, np.maximum, np.minimum, np.fmax, np.fmin, np.hypot}
+_COMPARISONS = {np.equal, np.not_equal, np.less, np.less_equal, np.greater, np.greater_equal}
+_UNARY_SAME_UNIT = {np.negative, np.positive, np.absolute, np.fabs, np.rint, np.floor,
+                    np.ceil, np.trunc}
+_UNITLESS = {np.isnan, np.isinf, np.isfinite, np.sign, np.signbit}
+_POWERS = {np.sqrt: Decimal("0.5"), np.square: 2, np.reciprocal: -1}
+_FUNCTIONS = {}
+
+
+def _implements(*functions):
+    def register(handler):
+        for function in functions:
+            _FUNCTIONS[function] = handler
+        return handler
+
+    return register
+
+
+@_implements(np.sum, np.mean, np.median, np.std, np.min, np.max, np.ptp, np.cumsum, np.diff,
+             np.sort, np.round, np.ravel, np.reshape, np.transpose)
+def _keep_unit(func, a: QuantityArray, *args, **kwargs):
+    return _wrap(a.unit, func(a.values, *args, **kwargs))
+
+
+@_implements(np.var)
+def _square_unit(func, a: QuantityArray, *args, **kwargs):
+    return _wrap(_result_unit(a.unit, 2, "**"), func(a.values, *args, **kwargs))
+
+
+@_implements(np.concatenate, np.stack)
+def _join(func, arrays, *args, **kwargs):
+    arrays = list(arrays)
+    unit = _common_unit(arrays, func.__name__)
+    return _wrap(unit, func([a.values for a in arrays], *args, **kwargs))
+
+
+@_implements(np.argmin, np.argmax, np.argsort)
+def _indices(func, a: QuantityArray, *args, **kwargs):
+    return func(a.values, *args, **kwargs)
+
+
+@_implements(np.isclose, np.allclose, np.array_equal)
+def _compare(func, a, b, *args, **kwargs):
+    _common_unit([a, b], func.__name__)
+    array = a if isinstance(a, QuantityArray) else b
+    return func(array._operand(a)[1], array._operand(b)[1], *args, **kwargs)
+
+
+def _common_unit(arrays, operation: str) -> Type[UnitBase]:
+    unit = next(a.unit for a in arrays if isinstance(a, QuantityArray))
+    for a in arrays:
+        other = type(a) if isinstance(a, UnitBase) else getattr(a, "unit", None)
+        _require_unit(unit, other, operation)
+    return unit
+
+
+def _result_unit(left: Type[UnitBase], right, operation: str) -> Optional[Type[UnitBase]]:
+    result_unit, _ = _RESULT_UNITS.lookup(left, right, operation)
+    return result_unit
+
+
+def _wrap(unit: Optional[Type[UnitBase]], values):
+    """Attach a unit to the result of a NumPy operation.
+
+    :return: The values as they are if there's no unit, an array if there's
+        more than one value, or otherwise a single measurement.
+    """
+    if unit is None:
+        return values
+    if isinstance(values, np.ndarray):
+        return QuantityArray(unit, values, values.dtype)
+    if isinstance(values, np.generic):
+        values = values.item()
+    if isinstance(values, float):
+        # As a Decimal, a float would keep the whole of its binary expansion
+        with using_backend(BACKEND_FLOAT):
+            return unit(values)
+    return unit(values)
@@ -1,4 +1,4 @@
-from pyunitx._api import make_compound_dimension, make_compound_unit, si_unit
+from pyunitx._api import make_compound_dimension, make_compound_unit, si_unit, _lazy_getattr
 from pyunitx.charge import coulombs, Charge
 from pyunitx.voltage import volts, Potential
 
@@ -20,7 +20,7 @@ farads = make_compound_unit(
 )
 
 generated = si_unit(base_unit=farads)
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 __all__ = [
     "Capacitance",
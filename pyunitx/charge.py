@@ -1,4 +1,4 @@
-from pyunitx._api import make_compound_dimension, make_compound_unit, si_unit
+from pyunitx._api import make_compound_dimension, make_compound_unit, si_unit, _lazy_getattr
 from pyunitx.current import Current, amperes
 from pyunitx.time import Time, seconds
 
@@ -18,7 +18,7 @@ coulombs = make_compound_unit(
 )
 
 generated = si_unit(base_unit=coulombs)
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 fundamental_charge = make_compound_unit(
     name="fundamental_charge",
@@ -1,4 +1,4 @@
-from pyunitx._api import si_unit, make_unit, make_dimension
+from pyunitx._api import si_unit, make_unit, make_dimension, _lazy_getattr
 
 Current = make_dimension("Current")
 
@@ -14,7 +14,7 @@ amperes = make_unit(
 )
 
 generated = si_unit(base_unit=amperes)
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 __all__ = [
     "Current",
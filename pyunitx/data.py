@@ -1,4 +1,4 @@
-from pyunitx._api import make_unit, make_dimension, si_unit
+from pyunitx._api import make_unit, make_dimension, si_unit, _lazy_getattr
 
 Data = make_dimension("Data")
 
@@ -114,7 +114,7 @@ exbibytes = make_unit(
 )
 
 generated = si_unit(base_unit=bytes)
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 __all__ = [
     "Data",
@@ -1,4 +1,4 @@
-from pyunitx._api import make_unit, si_unit
+from pyunitx._api import make_unit, si_unit, _lazy_getattr
 from pyunitx.angle import arcseconds
 from pyunitx.constants import c
 from pyunitx.length import Length, au
@@ -24,7 +24,6 @@ parsecs = make_unit(
 )
 
 si_parsec = si_unit(base_unit=parsecs)
-globals().update(si_parsec)
 
 lightyears = make_unit(
     name="lightyears",
@@ -40,7 +39,7 @@ lightyears = make_unit(
 )
 
 si_lightyear = si_unit(base_unit=lightyears)
-globals().update(si_lightyear)
+__getattr__ = _lazy_getattr(__name__, si_parsec, si_lightyear)
 
 __all__ = [
     "parsecs",
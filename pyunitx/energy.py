@@ -1,4 +1,4 @@
-from pyunitx._api import make_compound_dimension, make_compound_unit, si_unit
+from pyunitx._api import make_compound_dimension, make_compound_unit, si_unit, _lazy_getattr
 from pyunitx.force import pounds
 from pyunitx.length import Length, meters, feet
 from pyunitx.mass import Mass, kilograms
@@ -18,7 +18,7 @@ joules = make_compound_unit(
 )
 
 generated = si_unit(base_unit=joules)
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 calorie = make_compound_unit(
     name="calorie",
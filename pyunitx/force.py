@@ -1,4 +1,4 @@
-from pyunitx._api import make_compound_dimension, make_compound_unit, si_unit
+from pyunitx._api import make_compound_dimension, make_compound_unit, si_unit, _lazy_getattr
 from pyunitx.length import Length, meters, feet
 from pyunitx.mass import Mass, kilograms, slugs
 from pyunitx.time import Time, seconds
@@ -14,7 +14,7 @@ newtons = make_compound_unit(
 )
 
 generated = si_unit(base_unit=newtons)
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 kgf = kilograms_force = make_compound_unit(
     name="kilograms_force",
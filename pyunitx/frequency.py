@@ -1,4 +1,4 @@
-from pyunitx._api import make_compound_dimension, make_compound_unit, si_unit
+from pyunitx._api import make_compound_dimension, make_compound_unit, si_unit, _lazy_getattr
 from pyunitx.time import Time, seconds, minutes
 
 Frequency = make_compound_dimension({Time: -1}, "Frequency")
@@ -15,7 +15,7 @@ hertz = make_compound_unit(
 )
 
 generated = si_unit(base_unit=hertz)
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 rpm = make_compound_unit(
     name="rpm",
@@ -1,4 +1,4 @@
-from pyunitx._api import make_dimension, make_unit, si_unit
+from pyunitx._api import make_dimension, make_unit, si_unit, _lazy_getattr
 
 Length = make_dimension("Length")
 
@@ -14,7 +14,7 @@ meters = make_unit(
 )
 
 generated = si_unit(base_unit=meters)
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 feet = make_unit(
     name="feet",
@@ -1,4 +1,4 @@
-from pyunitx._api import make_dimension, make_unit, si_unit
+from pyunitx._api import make_dimension, make_unit, si_unit, _lazy_getattr
 
 LuminousIntensity = make_dimension("Luminous Intensity")
 
@@ -15,7 +15,7 @@ candelas = make_unit(
 )
 
 generated = si_unit(base_unit=candelas)
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 __all__ = [
     "LuminousIntensity",
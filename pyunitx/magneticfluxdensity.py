@@ -1,4 +1,4 @@
-from pyunitx._api import make_compound_dimension, make_compound_unit, si_unit
+from pyunitx._api import make_compound_dimension, make_compound_unit, si_unit, _lazy_getattr
 from pyunitx.length import Length, meters
 from pyunitx.time import Time, seconds
 from pyunitx.voltage import Potential, volts
@@ -17,7 +17,7 @@ tesla = make_compound_unit(
 )
 
 generated = si_unit(base_unit=tesla)
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 __all__ = [
     "MagneticFluxDensity",
@@ -1,4 +1,4 @@
-from pyunitx._api import make_dimension, make_unit, si_unit
+from pyunitx._api import make_dimension, make_unit, si_unit, _lazy_getattr
 
 Mass = make_dimension("Mass")
 
@@ -20,7 +20,7 @@ grams = make_unit(
 )
 
 generated = si_unit(base_unit=grams, skip=["kilo"])
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 tonnes = make_unit(
     name="tonnes",
@@ -1,4 +1,4 @@
-from pyunitx._api import make_dimension, make_unit, si_unit
+from pyunitx._api import make_dimension, make_unit, si_unit, _lazy_getattr
 
 Quantity = make_dimension("Quantity")
 
@@ -25,7 +25,7 @@ pound_moles = make_unit(
     """
 )
 generated = si_unit(base_unit=moles)
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 __all__ = [
     "Quantity",
@@ -1,4 +1,4 @@
-from pyunitx._api import make_compound_dimension, make_compound_unit, si_unit
+from pyunitx._api import make_compound_dimension, make_compound_unit, si_unit, _lazy_getattr
 from pyunitx.energy import Energy, joules
 from pyunitx.force import pounds
 from pyunitx.length import feet
@@ -19,7 +19,7 @@ watts = make_compound_unit(
 )
 
 generated = si_unit(base_unit=watts)
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 kilowatts = make_compound_unit(
     name="kilowatts",
@@ -1,6 +1,6 @@
 from decimal import Decimal
 
-from pyunitx._api import make_compound_dimension, make_compound_unit, si_unit
+from pyunitx._api import make_compound_dimension, make_compound_unit, si_unit, _lazy_getattr
 from pyunitx.force import Force, pounds, newtons
 from pyunitx.length import Length, meters, inches
 
@@ -15,7 +15,7 @@ pascals = make_compound_unit(
 )
 
 generated = si_unit(base_unit=pascals)
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 bars = make_compound_unit(
     scale="1e5",
@@ -2,7 +2,7 @@ import enum
 from decimal import Decimal
 from typing import Union, Tuple, Iterable
 
-from pyunitx._api import make_compound_unit, make_compound_dimension, si_unit
+from pyunitx._api import make_compound_unit, make_compound_dimension, si_unit, _lazy_getattr
 from pyunitx.current import Current, amperes
 from pyunitx.temperature import kelvin
 from pyunitx.voltage import Potential, volts
@@ -21,7 +21,7 @@ ohms = make_compound_unit(
 )
 
 generated = si_unit(base_unit=ohms)
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 
 class Color(enum.Enum):
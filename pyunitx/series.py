@@ -0,0 +1,285 @@
+"""Many measurements of one unit, without any dependencies.
+
+A :class:`MeasurementSeries` stores one unit class and a list of plain
+numbers, so a column of readings doesn't need a measurement object or a
+flyweight cache entry for each one. Operations work out the resulting unit
+once for the whole series, and then go over the values. The values keep the
+type of the numeric backend, exact :external:py:class:`decimal.Decimal` by
+default::
+
+    >>> from pyunitx.series import MeasurementSeries
+    >>> from pyunitx.length import meters
+    >>> from pyunitx.time import seconds
+    >>> distances = MeasurementSeries(meters, ["100", "200", "400.5"])
+    >>> distances / seconds(20)
+    MeasurementSeries(meters_per_second, [Decimal('5'), Decimal('10'), Decimal('20.025')])
+
+For large amounts of floating-point data,
+:class:`QuantityArray <pyunitx.arrays.QuantityArray>` does the same with NumPy.
+"""
+from decimal import Decimal
+from itertools import repeat
+from typing import Type, Iterable, Optional, List
+
+from pyunitx._api import (UnitBase, _RESULT_UNITS, _NUMBERS, _BACKEND_TYPES, _Backend, _backend,
+                          _conversion, _require_unit, _rescaler)
+
+
+class MeasurementSeries:
+    """A sequence of measurements that all have the same unit.
+
+    The arithmetic operators work elementwise between two series of the same
+    length, or between a series and a single measurement or number. Adding
+    needs both sides to be the same unit, as with single measurements.
+    Multiplying or dividing units that cancel completely gives a list of
+    plain numbers.
+
+    Indexing with an integer creates a single measurement, and slicing gives
+    another series. Conversions are called the same way as for single
+    measurements, like ``series.to_feet()``.
+
+    :param unit: The unit class of every measurement, like
+        :class:`meters <pyunitx.length.meters>`.
+    :param values: The values of the measurements, in any form the current
+        numeric backend accepts.
+    """
+    __slots__ = ["unit", "values"]
+
+    def __init__(self, unit: Type[UnitBase], values: Iterable = ()):
+        convert = _backend().convert
+        self.unit = unit
+        self.values = [convert(v) for v in values]
+
+    @classmethod
+    def _of(cls, unit: Type[UnitBase], values: List) -> 'MeasurementSeries':
+        # The values are already numbers of the right type
+        series = cls.__new__(cls)
+        series.unit = unit
+        series.values = values
+        return series
+
+    @classmethod
+    def from_measurements(cls, measurements: Iterable[UnitBase]) -> 'MeasurementSeries':
+        """Gather measurements of the same unit into a series.
+
+        :param measurements: The measurements, all of them in the same unit.
+        :raises ValueError: If there are no measurements to tell the unit from.
+        :raises ImplicitConversionError: If the measurements have different
+            units of the same dimension.
+        :raises OperationError: If the measurements are of different dimensions.
+        :return: A series of the measurements' values.
+        """
+        measurements = list(measurements)
+        if not measurements:
+            raise ValueError("The unit of an empty series can't be known")
+        unit = type(measurements[0])
+        for m in measurements:
+            _require_unit(unit, type(m), "combine")
+        return cls(unit, [m.value for m in measurements])
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        unit = self.unit
+        for value in self.values:
+            yield unit(value)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return MeasurementSeries._of(self.unit, self.values[key])
+        return self.unit(self.values[key])
+
+    def __eq__(self, other):
+        """Check if this series has the same unit and values as another.
+
+        :param other: Another series.
+        :return: Whether the two series are identical.
+        """
+        if not isinstance(other, MeasurementSeries):
+            return NotImplemented
+        return self.unit is other.unit and self.values == other.values
+
+    def __str__(self):
+        return f"[{', '.join(str(v) for v in self.values)}] {self.unit.abbreviation}"
+
+    def __repr__(self):
+        return f"MeasurementSeries({self.unit.__name__}, {self.values!r})"
+
+    def _backend(self) -> _Backend:
+        # The backend the values came from, which may not be the current one
+        if self.values:
+            return _BACKEND_TYPES.get(type(self.values[0])) or _backend()
+        return _backend()
+
+    def _operand(self, other):
+        """Split another operand into its unit and its values.
+
+        :raises ValueError: If the other is a series of a different length.
+        :return: The unit, or None for plain numbers, and the values to pair
+            with this series' values. Both are None if the operand isn't
+            supported.
+        """
+        if isinstance(other, MeasurementSeries):
+            if len(other) != len(self):
+                raise ValueError("Series of different lengths can't be combined")
+            if other._backend() is self._backend():
+                return other.unit, other.values
+            convert = self._backend().convert
+            return other.unit, [convert(v) for v in other.values]
+        if isinstance(other, UnitBase):
+            return type(other), repeat(self._backend().convert(other.value))
+        if isinstance(other, _NUMBERS):
+            return None, repeat(self._backend().convert(other))
+        return None, None
+
+    def _combine(self, left: Type[UnitBase], right, operation: str, values: List):
+        result_unit, _ = _RESULT_UNITS.lookup(left, right, operation)
+        if result_unit is None:
+            return values
+        return MeasurementSeries._of(result_unit, values)
+
+    def __add__(self, other) -> 'MeasurementSeries':
+        """Add measurements of the same unit to each element.
+
+        :param other: Another series, or a single measurement, of the same unit.
+        :raises ImplicitConversionError: If the other is a different unit of
+            the same dimension.
+        :raises OperationError: If the other is of a different dimension.
+        :raises ValueError: If the other is a series of a different length.
+        :return: A series of the sums.
+        """
+        unit, values = self._operand(other)
+        if values is None:
+            return NotImplemented
+        _require_unit(self.unit, unit, "add")
+        return MeasurementSeries._of(self.unit, [a + b for a, b in zip(self.values, values)])
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other) -> 'MeasurementSeries':
+        """Subtract measurements of the same unit from each element.
+
+        :param other: Another series, or a single measurement, of the same unit.
+        :raises ImplicitConversionError: If the other is a different unit of
+            the same dimension.
+        :raises OperationError: If the other is of a different dimension.
+        :raises ValueError: If the other is a series of a different length.
+        :return: A series of the differences.
+        """
+        unit, values = self._operand(other)
+        if values is None:
+            return NotImplemented
+        _require_unit(self.unit, unit, "subtract")
+        return MeasurementSeries._of(self.unit, [a - b for a, b in zip(self.values, values)])
+
+    def __rsub__(self, other):
+        unit, values = self._operand(other)
+        if values is None:
+            return NotImplemented
+        _require_unit(self.unit, unit, "subtract")
+        return MeasurementSeries._of(self.unit, [b - a for a, b in zip(self.values, values)])
+
+    def __mul__(self, other):
+        """Multiply each element by a measurement, a number, or the elements of
+        another series.
+
+        The unit of the result is worked out once for the whole series.
+
+        :param other: A series, a single measurement, or a plain number.
+        :raises TypeError: If base units are incompatible.
+        :raises ValueError: If the other is a series of a different length.
+        :return: A series of the products, or a list of numbers if the units
+            cancel.
+        """
+        unit, values = self._operand(other)
+        if values is None:
+            return NotImplemented
+        products = [a * b for a, b in zip(self.values, values)]
+        if unit is None:
+            return MeasurementSeries._of(self.unit, products)
+        return self._combine(self.unit, unit, "*", products)
+
+    def __rmul__(self, other):
+        unit, values = self._operand(other)
+        if values is None:
+            return NotImplemented
+        products = [b * a for a, b in zip(self.values, values)]
+        if unit is None:
+            return MeasurementSeries._of(self.unit, products)
+        return self._combine(unit, self.unit, "*", products)
+
+    def __truediv__(self, other):
+        """Divide each element by a measurement, a number, or the elements of
+        another series.
+
+        The unit of the result is worked out once for the whole series.
+
+        :param other: A series, a single measurement, or a plain number.
+        :raises TypeError: If base units are incompatible.
+        :raises ValueError: If the other is a series of a different length.
+        :return: A series of the quotients, or a list of numbers if the units
+            cancel.
+        """
+        unit, values = self._operand(other)
+        if values is None:
+            return NotImplemented
+        quotients = [a / b for a, b in zip(self.values, values)]
+        if unit is None:
+            return MeasurementSeries._of(self.unit, quotients)
+        return self._combine(self.unit, unit, "/", quotients)
+
+    def __rtruediv__(self, other):
+        unit, values = self._operand(other)
+        if values is None:
+            return NotImplemented
+        quotients = [b / a for a, b in zip(self.values, values)]
+        if unit is None:
+            return self._combine(self.unit, -1, "**", quotients)
+        return self._combine(unit, self.unit, "/", quotients)
+
+    def __pow__(self, other) -> 'MeasurementSeries':
+        """Raise each element to a power.
+
+        :param other: The power, as for a single measurement.
+        :return: A series with the values and units raised to the power.
+        """
+        if isinstance(other, str):
+            other = Decimal(other)
+        power = self._backend().power
+        return self._combine(self.unit, other, "**", [power(v, other) for v in self.values])
+
+    def __neg__(self):
+        return MeasurementSeries._of(self.unit, [-v for v in self.values])
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return MeasurementSeries._of(self.unit, [abs(v) for v in self.values])
+
+    def __getattr__(self, key: str):
+        """Convert the whole series with ``series.to_*()``.
+
+        The conversion is the same one a single measurement of the unit would
+        use. It's applied once to find the factor, which then multiplies all
+        the values.
+
+        :param key: The method name.
+        :raise AttributeError: If the requested method doesn't look like a
+            conversion function, or if there isn't a conversion function by that
+            name.
+        """
+        if key.startswith("to_") and not hasattr(UnitBase, key):
+            def convert(precision: Optional[int] = None) -> 'MeasurementSeries':
+                unit, scale, divisor = _conversion(self.unit, key, precision)
+                convert = self._backend().convert
+                rescale = _rescaler(convert(scale), convert(divisor), precision)
+                values = [rescale(v) for v in self.values]
+                if unit is None:
+                    return values
+                return MeasurementSeries._of(unit, values)
+
+            return convert
+        raise AttributeError(key)
@@ -1,7 +1,17 @@
-"""Conversions between these units are deltas, as the systems have different zeros."""
+"""Conversions between these units are deltas, as the systems have different zeros.
+
+To convert readings of absolute temperature between the scales, taking their
+zeros into account, use :func:`convert_absolute`.
+"""
+import decimal
+import sys
 from decimal import Decimal
+from typing import Type, Tuple
 
-from pyunitx._api import make_dimension, make_unit, si_unit
+from pyunitx._api import (make_dimension, make_unit, si_unit, _lazy_getattr, UnitBase, Number,
+                          _backend, _conversion_factor, _coerced, _require_unit)
+from pyunitx._exceptions import ImplicitConversionError
+from pyunitx.series import MeasurementSeries
 
 Temperature = make_dimension("Temperature")
 
@@ -24,7 +34,7 @@ kelvin = make_unit(
 )
 
 generated = si_unit(base_unit=kelvin)
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 celsius = make_unit(
     name="celsius",
@@ -39,10 +49,7 @@ celsius = make_unit(
     zero has been provided in each of the non-absolute units.
     
     To convert from a direct measurement in degrees Celsius to one in Kelvin,
-    use ``(<celsius measurement> - absolute_zero_celsius).to_kelvin()``.
-    The ``to_kelvin`` at the end is of course not strictly necessary, depending
-    on how you are interpreting the results, but is certainly in line with 
-    intention.
+    use ``convert_absolute(<celsius measurement>, kelvin)``.
     """
 )
 fahrenheit = make_unit(
@@ -58,11 +65,7 @@ fahrenheit = make_unit(
     absolute zero has been provided in each of the non-absolute units.
     
     To convert from a direct measurement in degrees Fahrenheit to one in degrees 
-    Rankine, use 
-    ``(<fahrenheit measurement> - absolute_zero_fahrenheit).to_rankine()``.
-    The ``to_rankine`` at the end is of course not strictly necessary, depending
-    on how you are interpreting the results, but is certainly in line with 
-    intention.
+    Rankine, use ``convert_absolute(<fahrenheit measurement>, rankine)``.
     """
 )
 rankine = make_unit(
@@ -83,12 +86,107 @@ rankine = make_unit(
     """
 )
 
-absolute_zero_celsius = celsius("-273.15")
-absolute_zero_fahrenheit = fahrenheit("-459.67")
+# The value of absolute zero on each scale that doesn't start there
+_ABSOLUTE_ZEROS = {
+    celsius: Decimal("-273.15"),
+    fahrenheit: Decimal("-459.67"),
+}
+
+absolute_zero_celsius = celsius(_ABSOLUTE_ZEROS[celsius])
+absolute_zero_fahrenheit = fahrenheit(_ABSOLUTE_ZEROS[fahrenheit])
+
+
+def absolute_conversion(src: Type[UnitBase], dst: Type[UnitBase]) -> Tuple[Number, Number]:
+    """Get the numbers that convert absolute temperatures from one scale to another.
+
+    A reading ``x`` on the ``src`` scale is ``scale * x + offset`` on the
+    ``dst`` scale. For instance, ``absolute_conversion(celsius, fahrenheit)``
+    is ``(1.8, 32)``. The pair is worked out once for each pair of scales,
+    numeric backend, and precision.
+
+    :param src: The temperature unit to convert from.
+    :param dst: The temperature unit to convert to.
+    :raises ImplicitConversionError: If either unit isn't a temperature.
+    :return: The scale and the offset, in the current numeric backend.
+    """
+    if src.dimension is not Temperature or dst.dimension is not Temperature:
+        raise ImplicitConversionError(src, dst)
+    backend = _backend()
+    key = ("absolute", src, dst, backend.name, decimal.getcontext().prec)
+    try:
+        return Temperature.factors[key]
+    except KeyError:
+        scale = _conversion_factor(src, dst)
+        src_zero = backend.convert(_ABSOLUTE_ZEROS.get(src, 0))
+        dst_zero = backend.convert(_ABSOLUTE_ZEROS.get(dst, 0))
+        conversion = Temperature.factors[key] = (scale, dst_zero - src_zero * scale)
+        return conversion
+
+
+def convert_absolute(temperatures, to: Type[UnitBase]):
+    """Convert absolute temperatures to another scale.
+
+    Unlike ``to_*``, this accounts for the scales having different zeros, so
+    ``convert_absolute(celsius(25), kelvin) == kelvin("298.15")``.
+
+    The temperatures can be a single measurement, a
+    :class:`MeasurementSeries <pyunitx.series.MeasurementSeries>`, or a
+    :class:`QuantityArray <pyunitx.arrays.QuantityArray>`. Each value is
+    converted with one multiply and add, fused into a single rounding for
+    :external:py:class:`decimal.Decimal` values.
+
+    :param temperatures: The temperatures to convert.
+    :param to: The temperature unit to convert to.
+    :raises ImplicitConversionError: If the units aren't temperatures.
+    :raises TypeError: If given something other than the above.
+    :return: The converted temperatures, in the same form they were given.
+    """
+    if isinstance(temperatures, UnitBase):
+        scale, offset = absolute_conversion(type(temperatures), to)
+        value, scale = _coerced(temperatures.value, scale)
+        _, offset = _coerced(value, offset)
+        return to(_fused(value, scale, offset))
+    if isinstance(temperatures, MeasurementSeries):
+        scale, offset = absolute_conversion(temperatures.unit, to)
+        convert = temperatures._backend().convert
+        scale, offset = convert(scale), convert(offset)
+        if temperatures.values and type(temperatures.values[0]) is Decimal:
+            values = [_fma(v, scale, offset) for v in temperatures.values]
+        else:
+            values = [v * scale + offset for v in temperatures.values]
+        return MeasurementSeries._of(to, values)
+    arrays = sys.modules.get("pyunitx.arrays")
+    if arrays is not None and isinstance(temperatures, arrays.QuantityArray):
+        scale, offset = absolute_conversion(temperatures.unit, to)
+        values = temperatures.values * temperatures._scalar(scale)
+        values += temperatures._scalar(offset)
+        return arrays.QuantityArray(to, values, values.dtype)
+    raise TypeError(f"Can't convert {type(temperatures).__name__} as temperatures")
+
+
+def _fused(value: Number, scale: Number, offset: Number) -> Number:
+    if type(value) is Decimal:
+        return _fma(value, scale, offset)
+    return value * scale + offset
+
+
+def _fma(value: Decimal, scale: Decimal, offset: Decimal) -> Decimal:
+    result = value.fma(scale, offset)
+    # A zero keeps the exponent of the terms that cancelled, like 0E-27
+    return result if result else result.normalize()
 
 
 def celsius_to_kelvin_absolute(degc: celsius) -> kelvin:
-    return (degc - absolute_zero_celsius).to_kelvin()
+    """Convert an absolute temperature in degrees Celsius to kelvin.
+
+    This is ``convert_absolute(degc, kelvin)`` for Celsius only.
+
+    :param degc: The temperature in degrees Celsius.
+    :raises UnitException: If the temperature isn't in degrees Celsius.
+    :return: The temperature in kelvin.
+    """
+    _require_unit(celsius, type(degc), "convert")
+    return convert_absolute(degc, kelvin)
 
 
 __all__ = [
@@ -99,6 +197,8 @@ __all__ = [
     "rankine",
     "absolute_zero_celsius",
     "absolute_zero_fahrenheit",
+    "absolute_conversion",
+    "convert_absolute",
     "celsius_to_kelvin_absolute",
     *generated.keys()
 ]
@@ -8,7 +8,7 @@ seconds or even dates.
 
 from decimal import Decimal
 
-from pyunitx._api import make_dimension, make_unit, si_unit
+from pyunitx._api import make_dimension, make_unit, si_unit, _lazy_getattr
 
 Time = make_dimension("Time")
 seconds = make_unit(
@@ -24,7 +24,7 @@ seconds = make_unit(
 )
 
 generated = si_unit(base_unit=seconds)
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 minutes = make_unit(
     name="minutes",
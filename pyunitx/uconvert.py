@@ -1,10 +1,7 @@
 import argparse
 import decimal
-import re
 
-from pyunitx._api import _EXTANT_UNITS, Compound, _base_scale, make_compound_unit
-
-_EXTANT_ABBREVS = {unit.abbreviation: unit for name, unit in _EXTANT_UNITS.items()}
+from pyunitx._api import Compound, _base_scale, make_compound_unit, _parse_abbreviations
 
 
 def parse_args():
@@ -25,21 +22,9 @@ def parse_args():
 
 
 def parse_unit(spec):
-    pattern = re.compile(r"([./])?([\w ]+)(\^-?\d+)?")
-    pairs = []
-    for match in re.finditer(pattern, spec):
-        name = match.group(2)
-        if name not in _EXTANT_ABBREVS:
-            raise KeyError(f"{name} is not a recognized unit")
-        if match.group(3):
-            power = int(match.group(3)[1:])
-        else:
-            power = 1
-        if match.group(1) == '/':
-            power *= -1
-        pairs.append((_EXTANT_ABBREVS[name], power))
-    defined_scale = _base_scale(tuple(pairs))
-    return Compound(tuple(pairs)), defined_scale
+    pairs = _parse_abbreviations(spec)
+    defined_scale = _base_scale(pairs)
+    return Compound(pairs), defined_scale
 
 
 def main():
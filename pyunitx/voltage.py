@@ -1,4 +1,4 @@
-from pyunitx._api import make_compound_unit, make_compound_dimension, si_unit
+from pyunitx._api import make_compound_unit, make_compound_dimension, si_unit, _lazy_getattr
 from pyunitx.charge import Charge, coulombs
 from pyunitx.energy import Energy, joules
 
@@ -15,7 +15,7 @@ volts = make_compound_unit(
 )
 
 generated = si_unit(base_unit=volts)
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 __all__ = [
     "Potential",
@@ -1,4 +1,4 @@
-from pyunitx._api import make_compound_dimension, make_compound_unit, si_unit
+from pyunitx._api import make_compound_dimension, make_compound_unit, si_unit, _lazy_getattr
 from pyunitx.length import Length, meters, feet
 
 Volume = make_compound_dimension({Length: 3}, "Volume")
@@ -26,7 +26,7 @@ milliliters = make_compound_unit(
 )
 
 generated = si_unit(base_unit=liters, skip=["milli"])
-globals().update(generated)
+__getattr__ = _lazy_getattr(__name__, generated)
 
 feet_cubed = make_compound_unit(
     scale=".02831685",
@@ -3,7 +3,7 @@ from decimal import Decimal
 
 import pytest
 
-from pyunitx.angle import degrees, arcseconds
+from pyunitx.angle import degrees, arcseconds, radians
 from pyunitx.energy import joules
 from pyunitx.time import seconds
 
@@ -52,3 +52,9 @@ def test_compound_to_radians():
     flux = joules(1) / arcseconds(1) ** 2
     expected = joules((arcseconds.scale ** -2) * (180 / Decimal(math.pi)) ** 2)
     assert flux.to_joules_per_radian_squared().equivalent_to(expected)
+
+
+def test_convert_many_to_radians():
+    converted = degrees.convert_many([180, 90], to=radians)
+
+    assert [float(v) for v in converted] == pytest.approx([math.pi, math.pi / 2])
@@ -1,8 +1,31 @@
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from fractions import Fraction
 
 import pytest
 
-from pyunitx._api import make_unit, make_dimension, make_compound_unit
+import pyunitx
+
+from pyunitx._api import (make_unit,
+                          make_dimension,
+                          make_compound_unit,
+                          si_unit,
+                          result_cache_info,
+                          set_flyweight_policy,
+                          flyweight_info,
+                          FLYWEIGHT_OFF,
+                          FLYWEIGHT_LRU,
+                          FLYWEIGHT_WEAK,
+                          using_backend,
+                          get_backend,
+                          BACKEND_DECIMAL,
+                          BACKEND_FLOAT,
+                          BACKEND_FRACTION,
+                          _UNIT_INDEX,
+                          _EXTANT_UNITS, )
 
 
 @pytest.fixture
@@ -40,3 +63,206 @@ def test_equivalent_scale(base_unit_1, base_unit_2):
     )
 
     assert unit_dec is unit_str
+
+
+def test_compound_lookup_finds_named(base_unit_1, base_unit_2):
+    named = make_compound_unit(
+        name="test_named",
+        scale=1,
+        abbrev="N",
+        exponents={base_unit_1: 1, base_unit_2: -1}
+    )
+
+    assert type(base_unit_1(4) / base_unit_2(1)) is named
+
+
+def test_redefined_unit_leaves_index(BaseDim1):
+    old = make_unit(name="redefined_unit", dimension=BaseDim1, scale=3, abbrev="r")
+    new = make_unit(name="redefined_unit", dimension=BaseDim1, scale=3, abbrev="r")
+
+    assert (old.composition, old.scale) not in _UNIT_INDEX
+    assert make_compound_unit(scale=3, exponents={new: 1}) is new
+
+
+def test_result_cache_counts(base_unit_1, base_unit_2):
+    # Loading the rest of the registry does arithmetic of its own
+    pyunitx._load_registry()
+    before = result_cache_info()
+    first = base_unit_1(2) * base_unit_2(3)
+    second = base_unit_1(4) * base_unit_2(5)
+    after = result_cache_info()
+
+    assert type(first) is type(second)
+    assert second.value == 20
+    assert after.misses == before.misses + 1
+    assert after.hits == before.hits + 1
+
+
+def test_flyweight_policies(base_unit_1):
+    set_flyweight_policy(FLYWEIGHT_OFF, unit=base_unit_1)
+    assert base_unit_1(1) is not base_unit_1(1)
+
+    set_flyweight_policy(FLYWEIGHT_LRU, maxsize=2, unit=base_unit_1)
+    first = base_unit_1(1)
+    assert base_unit_1(1) is first
+    base_unit_1(2)
+    base_unit_1(3)
+    assert base_unit_1(1) is not first
+    info = flyweight_info(base_unit_1)
+    assert info.currsize == 2
+    assert info.hits == 1
+    assert info.misses == 4
+
+    set_flyweight_policy(FLYWEIGHT_WEAK, unit=base_unit_1)
+    kept = base_unit_1(5)
+    assert base_unit_1(5) is kept
+    assert flyweight_info(base_unit_1).hit_rate == 0.5
+
+
+def test_flyweight_policy_unknown(base_unit_1):
+    with pytest.raises(ValueError):
+        set_flyweight_policy("forever", unit=base_unit_1)
+
+
+def test_si_unit_lazy(BaseDim1):
+    widgets = make_unit(name="widgets", dimension=BaseDim1, scale=1, abbrev="wd")
+    generated = si_unit(base_unit=widgets)
+
+    assert "kilowidgets" in generated
+    assert "kilowidgets" not in _EXTANT_UNITS
+    kilo = generated["kilowidgets"]
+    assert kilo.__name__ == "kilowidgets"
+    assert kilo.abbreviation == "kwd"
+    assert generated["kilowidgets"] is kilo
+    assert widgets(2500).to_natural_si() == kilo("2.5")
+    assert "megawidgets" not in _EXTANT_UNITS
+    assert widgets("2.5e6").to_natural_si().abbreviation == "Mwd"
+
+
+def test_si_unit_lazy_compound(base_unit_1, base_unit_2):
+    rate = make_compound_unit(
+        name="rates",
+        scale=1,
+        abbrev="rt",
+        exponents={base_unit_1: 1, base_unit_2: -1}
+    )
+    generated = si_unit(base_unit=rate)
+    assert "kilorates" not in _EXTANT_UNITS
+
+    found = make_compound_unit(scale=1000, exponents=rate.composition.to_pairs())
+    assert found.__name__ == "kilorates"
+    assert generated["kilorates"] is found
+
+
+def _run_fresh(code: str) -> str:
+    # The test process has already imported everything
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            check=True)
+    return result.stdout.strip()
+
+
+def test_import_is_lazy():
+    out = _run_fresh(
+        "import sys, pyunitx\n"
+        "print('pyunitx.length' in sys.modules)\n"
+        "print(pyunitx.length.meters(1))\n"
+        "print('pyunitx.length' in sys.modules, 'pyunitx.energy' in sys.modules)"
+    )
+    assert out.splitlines() == ["False", "1 m", "True False"]
+
+
+def test_star_import():
+    out = _run_fresh(
+        "from pyunitx import *\n"
+        "print(length.meters(1), time.seconds(2))\n"
+        "print(make_unit.__name__, precision.__name__)"
+    )
+    assert out.splitlines() == ["1 m 2 s", "make_unit precision"]
+
+
+def test_lazy_import_recognizes_named_units():
+    out = _run_fresh(
+        "from pyunitx.length import meters\n"
+        "from pyunitx.time import seconds\n"
+        "print(type(meters(1) * meters(1)).__name__)\n"
+        "print(meters(1).to_miles())"
+    )
+    assert out.splitlines()[0] == "meters_squared"
+    assert out.splitlines()[1].endswith("mi")
+
+
+def _race(function, threads=8):
+    barrier = threading.Barrier(threads)
+
+    def run(_):
+        barrier.wait()
+        return function()
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(threads) as pool:
+            return list(pool.map(run, range(threads)))
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def test_concurrent_compound_is_one_class(base_unit_1, base_unit_2):
+    results = _race(lambda: make_compound_unit(scale=7, exponents={base_unit_1: 3,
+                                                                    base_unit_2: -2}))
+    assert all(unit is results[0] for unit in results)
+
+
+def test_concurrent_prefixed_is_one_class(BaseDim2):
+    gadgets = make_unit(name="gadgets", dimension=BaseDim2, scale=1, abbrev="gd")
+    generated = si_unit(base_unit=gadgets)
+
+    results = _race(lambda: generated["megagadgets"])
+    assert all(unit is results[0] for unit in results)
+    assert results[0].__name__ == "megagadgets"
+
+
+def test_float_backend(base_unit_1, base_unit_2):
+    with using_backend(BACKEND_FLOAT):
+        assert get_backend() == BACKEND_FLOAT
+        product = base_unit_1(3) * base_unit_2("0.5")
+        assert type(product.value) is float
+        assert product.value == 1.5
+    assert get_backend() == BACKEND_DECIMAL
+    assert type(base_unit_1(3).value) is Decimal
+
+
+def test_fraction_backend_is_exact(base_unit_1):
+    make_unit(name="strides", dimension=base_unit_1.dimension, scale="0.3048", abbrev="st")
+    with using_backend(BACKEND_FRACTION):
+        converted = base_unit_1(1).to_strides()
+        assert converted.value == Fraction(1250, 381)
+        assert (base_unit_1(9) ** Fraction(1, 2)).value == 3
+
+
+def test_backends_mix(base_unit_1):
+    with using_backend(BACKEND_FLOAT):
+        f = base_unit_1(2)
+    d = base_unit_1(1)
+    assert f is not base_unit_1(2)
+    total = f + d
+    assert type(total.value) is Decimal
+    assert total == base_unit_1(3)
+    assert d < f
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        with using_backend("complex"):
+            pass
+
+
+def test_result_unit_scale_ignores_precision(BaseDim1, BaseDim2, base_unit_1, base_unit_2):
+    long_units = make_unit(name="long_units", dimension=BaseDim1, scale=1000, abbrev="lu")
+    slow_units = make_unit(name="slow_units", dimension=BaseDim2, scale=3600, abbrev="su")
+    with pyunitx.precision(5):
+        made = type(long_units(1) / slow_units(1))
+    assert made.scale == Decimal(1000) / Decimal(3600)
+    rate = long_units(36) / slow_units(1)
+    assert type(rate) is made
+    assert rate.to_base_unit_1_per_base_unit_2() == (base_unit_1(10) / base_unit_2(1))
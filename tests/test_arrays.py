@@ -0,0 +1,201 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyunitx._exceptions import ImplicitConversionError, OperationError  # noqa: E402
+from pyunitx.arrays import QuantityArray  # noqa: E402
+from pyunitx.length import meters, feet, kilometers  # noqa: E402
+from pyunitx.time import seconds  # noqa: E402
+
+
+def test_divide_measurement():
+    speeds = QuantityArray(meters, [100, 200, 400]) / seconds(20)
+
+    assert speeds.unit is type(meters(1) / seconds(1))
+    assert np.array_equal(speeds.values, [5, 10, 20])
+
+
+def test_multiply_arrays():
+    a = QuantityArray(meters, [1, 2, 3])
+
+    area = a * a
+    assert area.unit is type(meters(1) ** 2)
+    assert np.array_equal(area.values, [1, 4, 9])
+    assert (a ** 2).unit is area.unit
+    assert (seconds(2) * a).unit is type(seconds(1) * meters(1))
+
+
+def test_cancel():
+    a = QuantityArray(meters, [1, 2, 4])
+
+    ratio = a / a
+    assert isinstance(ratio, np.ndarray)
+    assert np.array_equal(ratio, [1, 1, 1])
+    assert np.array_equal((1 / a).values, [1, 0.5, 0.25])
+
+
+def test_convert():
+    a = QuantityArray(kilometers, [1, 2])
+
+    converted = a.to_meters()
+    assert converted.unit is meters
+    assert np.array_equal(converted.values, [1000, 2000])
+    assert np.allclose(a.to_feet().values, [3280.8399, 6561.6798])
+
+
+def test_compound_convert():
+    speeds = QuantityArray(meters, [10, 20]) / seconds(1)
+
+    assert np.allclose(speeds.to_kilometers_per_hour().values, [36, 72])
+
+
+def test_add():
+    a = QuantityArray(meters, [1, 2])
+
+    assert np.array_equal((a + meters(1)).values, [2, 3])
+    assert np.array_equal((meters(5) - a).values, [4, 3])
+    assert np.array_equal((a + a).values, [2, 4])
+
+
+def test_add_incompatible():
+    a = QuantityArray(meters, [1, 2])
+
+    with pytest.raises(ImplicitConversionError):
+        print(a + feet(1))
+    with pytest.raises(OperationError):
+        print(a + seconds(1))
+    with pytest.raises(OperationError):
+        print(a + 1)
+
+
+def test_index():
+    a = QuantityArray(meters, [1, 2, 3])
+
+    assert a[0] == meters(1)
+    assert list(a) == [meters(1), meters(2), meters(3)]
+    assert np.array_equal(a[1:].values, [2, 3])
+
+
+def test_from_measurements():
+    a = QuantityArray.from_measurements([feet(1), feet("2.5")])
+
+    assert a.unit is feet
+    assert np.array_equal(a.values, [1, 2.5])
+    with pytest.raises(ImplicitConversionError):
+        QuantityArray.from_measurements([feet(1), meters(1)])
+
+
+def test_sqrt():
+    area = QuantityArray(meters, [3, 4]) ** 2
+
+    root = np.sqrt(area)
+    assert root.unit is meters
+    assert np.allclose(root.values, [3, 4])
+
+
+def test_same_unit_ufuncs():
+    a = QuantityArray(meters, [3, 5])
+    b = QuantityArray(meters, [4, 2])
+
+    assert np.allclose(np.hypot(a, b).values, [5, np.sqrt(29)])
+    assert np.maximum(a, b).unit is meters
+    assert np.array_equal(np.maximum(a, b).values, [4, 5])
+    with pytest.raises(ImplicitConversionError):
+        np.add(a, QuantityArray(feet, [1, 2]))
+    with pytest.raises(ImplicitConversionError):
+        np.maximum(a, feet(1))
+
+
+def test_comparisons():
+    a = QuantityArray(meters, [1, 2, 3])
+
+    assert np.array_equal(a < meters(2), [True, False, False])
+    assert np.array_equal(np.greater_equal(a, a), [True, True, True])
+    with pytest.raises(ImplicitConversionError):
+        print(a < feet(2))
+
+
+def test_measurement_compared_to_array():
+    a = QuantityArray(meters, [1, 2, 3])
+
+    assert np.array_equal(meters(2) < a, [False, False, True])
+    assert np.array_equal(meters(2) >= a, [True, True, False])
+
+
+def test_outer():
+    a = QuantityArray(meters, [1, 2])
+
+    assert np.array_equal(np.add.outer(a, a).values, [[2, 3], [3, 4]])
+    assert np.multiply.outer(a, a).unit is type(meters(1) ** 2)
+    with pytest.raises(ImplicitConversionError):
+        np.add.outer(a, QuantityArray(feet, [1, 2]))
+    with pytest.raises(OperationError):
+        np.add.outer(a, 1)
+
+
+def test_accumulate():
+    a = QuantityArray(meters, [1, 2, 3])
+
+    assert np.array_equal(np.add.accumulate(a).values, [1, 3, 6])
+    assert np.array_equal(np.add.reduceat(a, [0, 2]).values, [3, 3])
+    with pytest.raises(TypeError):
+        np.multiply.accumulate(a)
+
+
+def test_in_place_ufunc():
+    a = QuantityArray(meters, [1, 2])
+
+    with pytest.raises(TypeError):
+        np.add.at(a, [0], 1)
+    assert np.array_equal(a.values, [1, 2])
+
+
+def test_unsupported_ufunc():
+    with pytest.raises(TypeError):
+        np.exp(QuantityArray(meters, [1, 2]))
+
+
+def test_reductions():
+    a = QuantityArray(meters, [1, 2, 3, 6])
+
+    assert np.sum(a) == meters(12)
+    assert np.mean(a) == meters(3)
+    assert np.max(a) == meters(6)
+    assert type(np.var(a)) is type(meters(1) ** 2)
+    assert np.array_equal(np.mean(a.values.reshape(2, 2), axis=0), np.mean(
+        QuantityArray(meters, a.values.reshape(2, 2)), axis=0).values)
+
+
+def test_float_results():
+    a = QuantityArray(meters, [0.1, 0.2])
+
+    assert np.mean(a).value == pytest.approx(0.15)
+    assert str(np.mean(a)) == f"{np.mean(a.values)} m"
+    assert str(np.std(a)) == f"{np.std(a.values)} m"
+    assert str(a[0]) == "0.1 m"
+
+
+def test_compare_to_measurement():
+    a = QuantityArray(meters, [1, 2])
+
+    assert np.array_equal(np.isclose(a, meters(1)), [True, False])
+    assert np.array_equal(np.isclose(meters(2), a), [False, True])
+    with pytest.raises(ImplicitConversionError):
+        np.isclose(a, feet(1))
+
+
+def test_concatenate():
+    a = QuantityArray(meters, [1, 2])
+
+    joined = np.concatenate([a, a])
+    assert joined.unit is meters
+    assert np.array_equal(joined.values, [1, 2, 1, 2])
+    with pytest.raises(ImplicitConversionError):
+        np.concatenate([a, QuantityArray(feet, [1])])
+    with pytest.raises(OperationError):
+        np.concatenate([a, np.array([1.0])])
+
+
+def test_unsupported_function():
+    with pytest.raises(TypeError):
+        np.cumprod(QuantityArray(meters, [1, 2]))
@@ -2,7 +2,7 @@ from fractions import Fraction
 
 import pytest
 
-from pyunitx._api import Compound, Multiset
+from pyunitx._api import Compound, Multiset, make_unit
 from pyunitx.force import newtons
 from pyunitx.length import meters, kilometers, au
 from pyunitx.mass import kilograms
@@ -168,3 +168,32 @@ def test_from_string_multiword():
     expected = Compound(((au, 1), (julian_years, -1)))
 
     assert c == expected
+
+
+def test_interned():
+    c1 = Compound(((meters, 1), (seconds, -1)))
+    c2 = Compound(Multiset({seconds: -1, meters: 1}))
+
+    assert c1 is c2
+    assert {c1: "speed"}[c2] == "speed"
+
+
+def test_immutable():
+    c = Compound(((meters, 1), (seconds, -1)))
+
+    with pytest.raises(AttributeError):
+        c.units = Multiset({meters: 1})
+
+
+def test_from_string_longest_name():
+    c = Compound.from_string("kilometers_per_julian_year_squared")
+    expected = Compound(((kilometers, 1), (julian_years, -2)))
+
+    assert c == expected
+
+
+def test_from_string_new_unit():
+    length = meters.dimension
+    make_unit(name="furlongs", dimension=length, scale="201.168", abbrev="fur")
+
+    assert Compound.from_string("furlongs_per_second").to_pairs()[1] == (seconds, -1)
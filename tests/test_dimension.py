@@ -1,4 +1,8 @@
 from pyunitx._api import DimensionBase
+from pyunitx.angle import Angle
+from pyunitx.length import Length
+from pyunitx.time import Time
+from pyunitx.voltage import Potential, volts
 
 
 def test_base_create():
@@ -61,3 +65,38 @@ def test_no_overwrite_name():
     alias = DimensionBase('alias', ((complex, 1),))
 
     assert complex.__name__ == 'c' == alias.__name__
+
+
+def test_reserved_vector_places():
+    assert Length.vector == (1,)
+    assert Time.vector == (0, 0, 1)
+    assert Angle.vector == (0,) * 7 + (1,)
+
+
+def test_new_base_after_reserved():
+    a = DimensionBase('a', ())
+
+    assert len(a.vector) > 9
+    assert a.vector[-1] == 1
+    assert sum(a.vector) == 1
+
+
+def test_compound_vector():
+    velocity = DimensionBase('velocity', ((Length, 1), (Time, -1)))
+
+    assert velocity.vector == (1, 0, -1)
+    assert DimensionBase('other', ((velocity, 2),)).vector == (2, 0, -2)
+
+
+def test_ids_distinct():
+    a = DimensionBase('a', ())
+    b = DimensionBase('b', ())
+    complex = DimensionBase('c', ((a, 1), (b, -2)))
+
+    assert len({a.id, b.id, complex.id}) == 3
+    assert DimensionBase('alias', ((complex, 1),)).id == complex.id
+
+
+def test_named_through_other_dimensions():
+    assert volts.dimension is Potential
+    assert volts(1).is_dimension(Potential)
@@ -1,6 +1,13 @@
+import array
+import itertools
+from decimal import Decimal
+
 import pytest
 
-from pyunitx._api import make_compound_dimension
+import pyunitx
+
+from pyunitx._api import make_compound_dimension, conversion_factor, natural_si, precision
+from pyunitx._exceptions import ImplicitConversionError
 from pyunitx.area import hectares
 from pyunitx.length import (kilometers,
                             meters,
@@ -10,7 +17,9 @@ from pyunitx.length import (kilometers,
                             Length,
                             micrometers,
                             millimeters,
-                            angstroms, )
+                            angstroms,
+                            miles, )
+from pyunitx.time import seconds
 
 
 def test_km_to_m():
@@ -25,6 +34,11 @@ def test_ft_to_m():
     assert m == meters("0.3048")
 
 
+def test_exact_ratio():
+    assert feet(3).to_yards() == yards(1)
+    assert str(feet(3).to_yards().value) == "1"
+
+
 def test_area_conversion():
     a = meters(2)
     b = feet("6.56168")
@@ -70,8 +84,40 @@ def test_flyweight():
 
 def test_flyweight_types():
     a = meters(1000)
-    b = meters("1e3")
+    b = meters("1000")
+    c = meters("1e3")
     assert a is b
+    assert a is not c
+    assert str(a) == "1000 m"
+    assert str(c) == "1E+3 m"
+    assert meters(Decimal(2000)) is meters(2000)
+    assert str(meters("1.0")) == "1.0 m"
+    assert str(meters(1)) == "1 m"
+
+
+def test_slotted():
+    assert not hasattr(meters(1), "__dict__")
+    assert not hasattr(meters(1) * meters(1), "__dict__")
+    with pytest.raises(AttributeError):
+        meters(1).extra = 1
+
+
+def test_hashable():
+    assert len({meters(1), meters("1.0"), feet(1), meters(2)}) == 3
+    assert {meters(1): "a"}[meters("1.00")] == "a"
+    assert hash(meters(1)) != hash(feet(1))
+
+
+def test_canonical_key():
+    assert kilometers(1).canonical_key() == meters(1000).canonical_key()
+    assert feet(1).canonical_key() == inches(12).canonical_key()
+    assert meters(1).canonical_key() != feet(1).canonical_key()
+    assert meters(1).canonical_key()[0] is Length
+
+    groups = {}
+    for m in [meters(1000), kilometers(1), feet(3), yards(1), meters(3)]:
+        groups.setdefault(m.canonical_key(), []).append(m)
+    assert len(groups) == 3
 
 
 def test_conversion():
@@ -172,11 +218,26 @@ def test_less(a, b, expect):
 
 
 def test_less_different():
-    si = meters(1)
-    imperial = feet(1)
+    assert feet(3) < meters(1)
+    assert not meters(1) < feet(3)
+    assert kilometers(1) <= meters(1000)
+    assert kilometers(1) >= meters(1000)
+    assert miles(1) > kilometers(1)
 
+
+def test_less_other_dimension():
+    with pytest.raises(TypeError):
+        print(meters(1) < seconds(1))
     with pytest.raises(TypeError):
-        print(si < imperial)
+        print(meters(1) >= 1)
+
+
+def test_sort_mixed():
+    lengths = [miles(1), meters(5), feet(3), kilometers(1), inches(2)]
+    ordered = sorted(lengths)
+    assert ordered == [inches(2), feet(3), meters(5), kilometers(1), miles(1)]
+    assert sorted(lengths, key=lambda m: m.sort_key()) == ordered
+    assert feet(3).sort_key() == Decimal("0.9144")
 
 
 @pytest.mark.parametrize(
@@ -267,3 +328,93 @@ def test_format_unsupported():
 def test_exponential_scale():
     small = angstroms(1)
     assert small.to_meters() == meters("1e-10")
+
+
+def test_conversion_factor():
+    assert conversion_factor(kilometers, meters) == 1000
+    assert conversion_factor(feet, meters) == Decimal("0.3048")
+
+
+def test_conversion_factor_precision():
+    assert conversion_factor(meters, feet, precision=5) == Decimal("3.2808")
+    assert conversion_factor(meters, feet) == Decimal("3.280839895013123359580052493")
+
+
+def test_precision_scope():
+    with precision(6):
+        assert meters(1).to_feet() == feet("3.28084")
+        assert (meters(1) / 3).value == Decimal("0.333333")
+        assert meters("1.23456789").value == Decimal("1.23456789")
+    assert meters(1).to_feet(precision=3) == feet("3.28")
+    assert meters(1).to_feet() == feet("3.280839895013123359580052493")
+
+
+def test_conversion_factor_mismatch():
+    with pytest.raises(ImplicitConversionError):
+        conversion_factor(meters, hectares)
+
+
+def test_natural_si_many():
+    converted = natural_si([meters(102364), kilometers("0.041"), millimeters(7)])
+
+    assert converted == [kilometers("102.364"), meters(41), millimeters(7)]
+    with pytest.raises(TypeError):
+        natural_si([meters(1), feet(1)])
+
+
+@pytest.mark.parametrize(
+    "value,figs,expect", [
+        ("464", 5, "464.00"),
+        ("999.6", 3, "1.00E+3"),
+        ("0.125", 2, "0.13"),
+        ("-12.5", 2, "-13"),
+        ("-0.0012345", 3, "-0.00123"),
+        ("0", 3, "0.00"),
+        ("1E+10", 2, "1.0E+10"),
+    ]
+)
+def test_sig_figs(value, figs, expect):
+    assert str(meters(value).sig_figs(figs).value) == expect
+
+
+def test_sig_figs_invalid():
+    with pytest.raises(ValueError):
+        meters(5).sig_figs(0)
+
+
+def test_round_sig_figs():
+    rounded = pyunitx.round_sig_figs([meters("1234.5"), feet("0.0456789")], 2)
+    assert rounded == [meters("1.2E+3"), feet("0.046")]
+
+
+def test_convert_many():
+    assert miles.convert_many([1, "100"], to=kilometers) == [Decimal("1.609344"),
+                                                              Decimal("160.9344")]
+    assert miles.convert_many((1,), to=kilometers) == (Decimal("1.609344"),)
+    assert miles.convert_many((v for v in [2]), to=kilometers) == [Decimal("3.218688")]
+    with pytest.raises(ImplicitConversionError):
+        miles.convert_many([1], to=seconds)
+
+
+def test_convert_many_buffers():
+    assert kilometers.convert_many(array.array("i", [1, 2]), to=meters) == \
+        array.array("d", [1000, 2000])
+    assert kilometers.convert_many(memoryview(array.array("d", [3])), to=meters) == \
+        array.array("d", [3000])
+
+
+def test_convert_many_numpy():
+    np = pytest.importorskip("numpy")
+
+    converted = kilometers.convert_many(np.array([1, 2]), to=meters)
+    assert isinstance(converted, np.ndarray)
+    assert np.array_equal(converted, [1000, 2000])
+    exact = kilometers.convert_many(np.array([1.5, Decimal("0.001")], dtype=object), to=meters)
+    assert exact.dtype == object
+    assert list(exact) == [Decimal(1500), Decimal(1)]
+
+
+def test_convert_stream():
+    stream = kilometers.convert_stream(itertools.count(), to=meters)
+
+    assert list(itertools.islice(stream, 3)) == [0, 1000, 2000]
@@ -88,3 +88,17 @@ def test_pairs(speed):
     assert speed.to_pairs() == ((meters, 1), (seconds, -1))
     m = Multiset({seconds: -1, meters: 1})
     assert m.to_pairs() == ((meters, 1), (seconds, -1))
+
+
+def test_hash(speed):
+    copy = Multiset({seconds: -1, meters: 1})
+
+    assert hash(copy) == hash(speed)
+    assert {speed: "speed"}[copy] == "speed"
+
+
+def test_immutable(speed):
+    with pytest.raises(TypeError):
+        speed.store[meters] = 2
+    with pytest.raises(AttributeError):
+        speed.store = {}
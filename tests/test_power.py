@@ -15,3 +15,8 @@ def test_automatic_converter_ordering():
     v = core.to_feet_pounds_per_second()
     assert v.sig_figs(3) == type(v)("738")
     assert core.to_pounds_feet_per_second().sig_figs() == type(v)("738")
+
+
+def test_natural_si():
+    assert watts(1500).to_natural_si() == kilowatts("1.5")
+    assert str(watts("0.0025").to_natural_si()) == "2.5 mW"
@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+from pyunitx import _SUBMODULES
+from pyunitx._api import Compound
+from pyunitx._registry import modules_defining
+from pyunitx.force import newtons
+
+
+def test_snapshot_is_current():
+    result = subprocess.run([sys.executable, "-m", "pyunitx._registry", "--check"],
+                            capture_output=True, text=True)
+    assert result.returncode == 0, "Regenerate it with python -m pyunitx._registry"
+
+
+def test_modules_defining():
+    assert modules_defining(_SUBMODULES, names="kilometers_per_hour") == {"length", "time"}
+    assert modules_defining(_SUBMODULES, abbreviations="kN/m^2") == {"force", "length"}
+    assert modules_defining(_SUBMODULES, abbreviations="nonsense") == set()
+    assert modules_defining(_SUBMODULES, composition=newtons.composition,
+                            scale=newtons.scale) == {"force"}
+    assert modules_defining(_SUBMODULES, composition=Compound(()), scale=1) == set()
+
+
+def test_stale_snapshot_is_ignored():
+    assert modules_defining(_SUBMODULES[1:], names="meters") is None
+
+
+def test_imports_only_defining_module():
+    code = (
+        "import sys\n"
+        "from pyunitx.uconvert import parse_unit\n"
+        "parse_unit('kN')\n"
+        "print('pyunitx.force' in sys.modules, 'pyunitx.energy' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            check=True)
+    assert result.stdout.strip() == "True False"
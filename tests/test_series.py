@@ -0,0 +1,117 @@
+import math
+from decimal import Decimal, localcontext
+
+import pytest
+
+from pyunitx._api import flyweight_info, using_backend, BACKEND_FLOAT
+from pyunitx.angle import degrees
+from pyunitx._exceptions import ImplicitConversionError, OperationError
+from pyunitx.length import meters, feet, kilometers
+from pyunitx.series import MeasurementSeries
+from pyunitx.time import seconds
+
+
+def test_exact_values():
+    s = MeasurementSeries(meters, ["0.1", "0.2"])
+
+    assert (s + s).values == [Decimal("0.2"), Decimal("0.4")]
+
+
+def test_divide_measurement():
+    speeds = MeasurementSeries(meters, [100, 200, 400]) / seconds(20)
+
+    assert speeds.unit is type(meters(1) / seconds(1))
+    assert speeds.values == [5, 10, 20]
+
+
+def test_multiply_series():
+    s = MeasurementSeries(meters, [1, 2, 3])
+
+    area = s * s
+    assert area.unit is type(meters(1) ** 2)
+    assert area.values == [1, 4, 9]
+    assert (s ** 2) == area
+    assert (seconds(2) * s).unit is type(seconds(1) * meters(1))
+
+
+def test_cancel():
+    s = MeasurementSeries(meters, [1, 2, 4])
+
+    assert s / s == [1, 1, 1]
+    assert (1 / s).values == [1, Decimal("0.5"), Decimal("0.25")]
+
+
+def test_convert():
+    s = MeasurementSeries(kilometers, [1, 2])
+
+    assert s.to_meters() == MeasurementSeries(meters, [1000, 2000])
+    assert s.to_feet()[0] == kilometers(1).to_feet()
+
+
+def test_convert_to_radians():
+    values = ["1", "7", "33.3"]
+    with localcontext() as context:
+        context.prec = 100
+        exact = [Decimal(v) * Decimal(math.pi) / 180 for v in values]
+
+    assert MeasurementSeries(degrees, values).to_radians() == [+x for x in exact]
+    assert MeasurementSeries(degrees, values).to_radians() == [
+        degrees(v).to_radians() for v in values]
+    assert MeasurementSeries(degrees, values).to_radians(5) == [
+        degrees(v).to_radians(5) for v in values]
+
+
+def test_add():
+    s = MeasurementSeries(meters, [1, 2])
+
+    assert (s + meters(1)).values == [2, 3]
+    assert (meters(5) - s).values == [4, 3]
+    assert (s + s).values == [2, 4]
+
+
+def test_mixed_backends():
+    exact = MeasurementSeries(meters, ["1.5", "2"])
+    with using_backend(BACKEND_FLOAT):
+        floats = MeasurementSeries(meters, [0.5, 1.0])
+
+    assert exact + floats == MeasurementSeries(meters, [2, 3])
+    assert floats + exact == MeasurementSeries(meters, [2.0, 3.0])
+    assert (floats * exact).values == [0.75, 2.0]
+
+
+def test_add_incompatible():
+    s = MeasurementSeries(meters, [1, 2])
+
+    with pytest.raises(ImplicitConversionError):
+        print(s + feet(1))
+    with pytest.raises(OperationError):
+        print(s + seconds(1))
+    with pytest.raises(OperationError):
+        print(s + 1)
+    with pytest.raises(ValueError):
+        print(s + MeasurementSeries(meters, [1]))
+
+
+def test_index():
+    s = MeasurementSeries(meters, [1, 2, 3])
+
+    assert s[0] == meters(1)
+    assert s[-1] == meters(3)
+    assert s[1:] == MeasurementSeries(meters, [2, 3])
+    assert list(s) == [meters(1), meters(2), meters(3)]
+
+
+def test_no_measurements_created():
+    before = flyweight_info(meters).currsize
+    s = MeasurementSeries(meters, range(5000, 5100))
+    (s * 2 + s).to_kilometers()
+
+    assert flyweight_info(meters).currsize <= before + 1
+
+
+def test_from_measurements():
+    s = MeasurementSeries.from_measurements([feet(1), feet("2.5")])
+
+    assert s == MeasurementSeries(feet, [1, "2.5"])
+    with pytest.raises(ImplicitConversionError):
+        MeasurementSeries.from_measurements([feet(1), meters(1)])
@@ -1,11 +1,18 @@
+from decimal import Decimal
+
 import pytest
 
-from pyunitx._exceptions import UnitException
+from pyunitx._exceptions import UnitException, ImplicitConversionError
+from pyunitx.length import meters
+from pyunitx.series import MeasurementSeries
 from pyunitx.temperature import (celsius,
                                  celsius_to_kelvin_absolute,
                                  kelvin,
                                  fahrenheit,
-                                 kilokelvin, )
+                                 rankine,
+                                 kilokelvin,
+                                 absolute_conversion,
+                                 convert_absolute, )
 
 
 def test_celsius_to_absolute():
@@ -28,3 +35,53 @@ def test_si_prefix():
 
     assert hot.to_natural_si() == kilokelvin("30.122")
     assert cold.to_natural_si() == kelvin(266)
+
+
+@pytest.mark.parametrize(
+    "reading,unit,expect", [
+        (celsius(25), kelvin, kelvin("298.15")),
+        (celsius(100), fahrenheit, fahrenheit(212)),
+        (fahrenheit(-40), celsius, celsius(-40)),
+        (kelvin(0), rankine, rankine(0)),
+        (rankine("491.67"), celsius, celsius(0)),
+    ]
+)
+def test_convert_absolute(reading, unit, expect):
+    converted = convert_absolute(reading, unit)
+
+    assert type(converted) is unit
+    assert abs(converted.value - expect.value) < Decimal("1e-20")
+
+
+def test_convert_absolute_zero():
+    assert str(convert_absolute(kelvin(0), rankine)) == "0 °R"
+    assert str(convert_absolute(celsius("-273.15"), rankine)) == "0 °R"
+    assert str(convert_absolute(MeasurementSeries(kelvin, [0]), rankine)) == "[0] °R"
+
+
+def test_absolute_conversion():
+    scale, offset = absolute_conversion(celsius, fahrenheit)
+
+    assert scale == Decimal("1.8")
+    assert offset == 32
+
+
+def test_convert_absolute_series():
+    readings = MeasurementSeries(celsius, [0, 100, "-273.15"])
+
+    converted = convert_absolute(readings, kelvin)
+    assert converted == MeasurementSeries(kelvin, ["273.15", "373.15", 0])
+
+
+def test_convert_absolute_array():
+    np = pytest.importorskip("numpy")
+    from pyunitx.arrays import QuantityArray
+
+    converted = convert_absolute(QuantityArray(celsius, [0, 100, -40]), fahrenheit)
+    assert converted.unit is fahrenheit
+    assert np.allclose(converted.values, [32, 212, -40])
+
+
+def test_convert_absolute_other_dimension():
+    with pytest.raises(ImplicitConversionError):
+        convert_absolute(celsius(1), meters)
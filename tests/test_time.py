@@ -1,7 +1,7 @@
-from pyunitx._api import make_compound_unit
+from pyunitx._api import make_compound_unit, make_unit, warm_converters
 from pyunitx.frequency import hertz, kilohertz
 from pyunitx.length import kilometers, feet, meters
-from pyunitx.time import seconds, hours, minutes, milliseconds
+from pyunitx.time import seconds, hours, minutes, milliseconds, days
 
 
 def test_hertz_cancel():
@@ -44,3 +44,38 @@ def test_fake_si():
     new = make_compound_unit(name="new3", scale="1e6", abbrev="n", exponents={feet: 1})
 
     assert meters(1000).to_new3() == new(".001")
+
+
+def test_dynamic_converter_installed():
+    speed = type(meters(1) / seconds(1))
+    converted = speed(10).to_kilometers_per_hour()
+
+    assert converted.value == 36
+    assert "to_kilometers_per_hour" in vars(speed)
+    assert speed(1).to_kilometers_per_hour.__func__ is vars(speed)["to_kilometers_per_hour"]
+
+
+def test_warm_converters():
+    rate = type(meters(1) / hours(1))
+    warm_converters(rate, ["to_meters_per_second", "feet_per_minute"])
+
+    assert "to_meters_per_second" in vars(rate)
+    assert "to_feet_per_minute" in vars(rate)
+    assert hasattr(rate.dimension, "to_feet_per_minute")
+
+
+def test_exact_conversions():
+    assert seconds(86400).to_days() == days(1)
+    assert str(minutes(90).to_hours().value) == "1.5"
+
+
+def test_converters_are_methods():
+    assert "to_hours" in vars(seconds)
+    assert "to_seconds" in vars(hours)
+    assert "to_latex" not in vars(seconds)
+
+    fortnights = make_unit(name="fortnights", dimension=seconds.dimension, scale=1209600,
+                           abbrev="ftn")
+    assert "to_fortnights" in vars(minutes)
+    assert "to_minutes" in vars(fortnights)
+    assert fortnights(1).to_days().value == 14
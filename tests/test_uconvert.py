@@ -4,8 +4,10 @@ import pytest
 
 from pyunitx._api import Compound
 from pyunitx.area import acres
+from pyunitx.energy import joules
 from pyunitx.length import meters, feet
 from pyunitx.mass import kilograms
+from pyunitx.temperature import kelvin
 from pyunitx.time import seconds
 from pyunitx.uconvert import parse_unit, main
 from pyunitx.volume import fluid_ounces
@@ -21,6 +23,9 @@ from pyunitx.volume import fluid_ounces
         ("kg/s.m", ((kilograms, 1), (seconds, -1), (meters, 1))),
         ("m/s/s", ((seconds, -2), (meters, 1))),
         ("acre.ft", ((acres, 1), (feet, 1))),
+        ("J/kg/K", ((joules, 1), (kilograms, -1), (kelvin, -1))),
+        ("ft^2/s^-2", ((feet, 2), (seconds, 2))),
+        ("m^3", ((meters, 3),)),
     ]
 )
 def test_parse_unit_success(spec, expected):
@@ -29,9 +34,20 @@ def test_parse_unit_success(spec, expected):
     assert c == Compound(expected)
 
 
+def test_parse_generated_abbreviation():
+    # Units without a symbol of their own, like imperial gallons, are spelled
+    # like their composition and mustn't take it over
+    c, s = parse_unit("m^3")
+
+    assert c == Compound(((meters, 3),))
+    assert s == 1
+
+
 def test_parse_unit_fail():
     with pytest.raises(KeyError):
         parse_unit("lN")
+    with pytest.raises(KeyError):
+        parse_unit("kg.foo^2")
 
 
 @pytest.mark.parametrize(
@@ -40,6 +56,7 @@ def test_parse_unit_fail():
         (["-f", "3", "10", "kg", "lbm"], "22.0 lbm"),
         (["10", "cal", "J"], "41.8400 J"),
         (["10", "m.s^-1", "mi.hr^-1"], "22.3694 mi hr^-1"),
+        (["1", "m^3", "L"], "1000.00 L"),
     ]
 )
 def test_main(monkeypatch, capsys, args, expected):
@@ -1,7 +1,7 @@
 import pytest
 
 from pyunitx.length import inches
-from pyunitx.volume import feet_cubed, meters_cubed
+from pyunitx.volume import feet_cubed, meters_cubed, liters, fluid_ounce_imperial
 
 
 def test_exponent_scale():
@@ -15,3 +15,11 @@ def test_automatic_converter():
 
     value = meters.to_kilometers_cubed()
     assert value == type(value)("1e-3")
+
+
+def test_convert_many_name_with_spaces():
+    assert fluid_ounce_imperial.__name__ == "imperial fluid ounce"
+
+    converted = liters.convert_many([1], to=fluid_ounce_imperial)
+    assert float(converted[0]) == pytest.approx(35.195, rel=1e-4)
+    assert converted == [liters(1).to_imperial_fluid_ounce().value]